@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Velozes e Assados - Gera o pacote de assets pré-processados
+
+Decodifica todas as imagens de assets/images e constrói as mesmas
+variantes que o jogo usa (estrada escalada e seus limites de asfalto,
+telas cheias, carros com máscara, frames da sirene), gravando tudo num
+único arquivo que o jogo mapeia com mmap ao iniciar. Rode de novo sempre
+que mudar alguma imagem ou o tamanho da tela/faixas no config: um pacote
+desatualizado é ignorado e o jogo volta a carregar os PNGs.
+
+Exemplo:
+    python bake_assets.py
+    python bake_assets.py --saida /tmp/assets.pak
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from src import config
+from src.managers.assets import assets
+from src.managers.asset_pack import gravar_pacote, listar_imagens, PacoteAssets
+from src.managers.preloader import AssetPreloader, tarefas_jogo
+from src.game_states import carregar_tela_cheia
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+# Originais que o jogo só usa escalados: vão para o pacote apenas como variantes
+SO_ESCALADAS = ("road.png", "abertura.png", "gameover.png")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--saida', default=config.ASSETS_PACOTE, help='arquivo do pacote')
+    args = parser.parse_args()
+
+    os.chdir(RAIZ)
+    inicio = time.perf_counter()
+    pygame.init()
+    # Display (invisível) para as conversões ficarem no formato de convert/convert_alpha
+    pygame.display.set_mode((config.TELA_LARGURA, config.TELA_ALTURA))
+    assets.orcamento = float('inf')  # nada pode ser despejado antes de gravar
+
+    for nome in listar_imagens(assets.diretorio):
+        if nome.lower() not in SO_ESCALADAS:
+            assets.imagem(nome)
+    AssetPreloader(tarefas_jogo()).aguardar()
+    for nome in ("abertura.png", "gameover.png"):
+        carregar_tela_cheia(nome)
+
+    stats = gravar_pacote(args.saida)
+    print(f"📦 {args.saida}: {stats['bases']} imagens, {stats['variantes']} variantes, "
+          f"{stats['bytes'] / (1024 * 1024):.1f} MB em {time.perf_counter() - inicio:.1f}s")
+
+    # Confere se o pacote recém-gravado abre (e não está desatualizado)
+    if PacoteAssets.abrir(args.saida) is None:
+        raise SystemExit(f"Falha ao reabrir {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,21 @@ Arquivo principal simplificado usando arquitetura modular
 import pygame
 import sys
 import os
-import random
 
 # Importa módulos da nova arquitetura
 from src.config import *
-from src.utils.road_detection import detect_asphalt_bounds
-from src.entities.player import CarroJogador
-from src.entities.obstacles import Obstaculo
-from src.entities.powerup import PowerUp, PowerUpManager
+from src.engine import GameEngine
 from src.managers.playlist import PlaylistManager
-from src.managers.collision import check_collision_with_powerup
+from src.managers.timestep import FixedTimestep
+from src.managers.replay import ReplayRecorder
+from src.managers.input_source import criar_fonte
+from src.managers.assets import assets
+from src.managers.asset_pack import usar_pacote
+from src.managers.preloader import AssetPreloader, tarefas_jogo
+from src.utils.rng import RNGService
 from src.game_states import GameStateManager
+from src.ui.dirty_rects import DirtyRectManager
+from src.ui.background import RoadBackground
 
 
 def main():
@@ -34,42 +38,26 @@ def main():
         pygame.mixer.music.set_volume(0.2)  # Volume inicial em 20%
         pygame.mixer.music.play(-1)
 
-    # Sprites
-    img_carro_jogador = pygame.image.load(os.path.join("assets", "images", "carro_jogador.png")).convert_alpha()
-
-    # Estrada
-    img_road_orig = pygame.image.load(os.path.join("assets", "images", "road.png")).convert()
-    road_width = min(img_road_orig.get_width(), int(TELA_LARGURA * 0.4))
-    img_road = pygame.transform.smoothscale(img_road_orig, (road_width, img_road_orig.get_height()))
-    H_tile = img_road.get_height()
-    road_x = (TELA_LARGURA - road_width) // 2
-    road_y1, road_y2 = 0, -H_tile
-    road_speed = 200.0
-    road_accel = 8.0
-
-    # Detecta asfalto e define faixas
-    inner_x, inner_w = detect_asphalt_bounds(img_road, road_x)
-    lane_w = inner_w // LANE_COUNT
-    lane_centers = [inner_x + lane_w//2 + i*lane_w for i in range(LANE_COUNT)]
-
-    carro = CarroJogador(img_carro_jogador, inner_x, inner_w, lane_w)
-
-    obstaculos = []
-    powerups = []
-    spawn_timer = 0.0
-    powerup_spawn_timer = 0.0
-    spawn_interval = 0.7
-    powerup_spawn_interval = 2.0  # Power-ups aparecem a cada 2 segundos
-    vel_obst = OBST_VEL_INICIAL
-    pontuacao = 0
-    dificuldade = 1
-
-    ultimo_t = pygame.time.get_ticks() / 1000.0
+    # Pixels prontos do pacote gerado por bake_assets.py (se existir e estiver em dia)
+    usar_pacote()
 
     # Gerenciadores
-    playlist_manager = PlaylistManager()
-    powerup_manager = PowerUpManager()
-    game_state = GameStateManager(tela, playlist_manager)
+    rng = RNGService()
+    playlist_manager = PlaylistManager(rng.fluxo('playlist'))
+    # Assets do jogo carregados numa thread enquanto o menu e a cinemática rodam
+    preloader = AssetPreloader(tarefas_jogo())
+    game_state = GameStateManager(tela, playlist_manager, preloader)
+    preloader.adicionar('gameover', lambda resultados: game_state.img_gameover)
+    preloader.iniciar()
+    dirty_rects = DirtyRectManager(tela) if DIRTY_RECTS else None
+
+    # Simulação (lógica do jogo) em passo fixo, criada ao entrar no jogo
+    timestep = FixedTimestep()
+    engine = None
+
+    ultimo_t = pygame.time.get_ticks() / 1000.0
+    estado_anterior = None
+    regioes_hud = []
     
     # Debug: verifica se a playlist foi carregada
     print(f"🎵 Playlist inicializada com {len(playlist_manager.musicas)} músicas")
@@ -80,11 +68,12 @@ def main():
         agora = pygame.time.get_ticks() / 1000.0
         dt = agora - ultimo_t
         ultimo_t = agora
-        dt = min(dt, 0.05)  # evita "teleporte" em quedas de FPS
+        # Sem limite aqui: FixedTimestep.avancar limita os ticks (SIM_MAX_PASSOS_POR_FRAME)
 
         # Processa eventos
         eventos = pygame.event.get()
-        if not game_state.processar_eventos(eventos, carro, obstaculos, trilha_abertura):
+        if not game_state.processar_eventos(eventos, engine and engine.carro,
+                                            engine and engine.obstaculos, trilha_abertura):
             break
 
         # Atualiza estado do jogo
@@ -103,6 +92,21 @@ def main():
             game_state.atualizar_cinematic(dt)
 
         elif estado == JOGANDO:
+            if engine is None:
+                # Primeira partida: monta o motor com o que o preloader carregou
+                carregados = preloader.aguardar()
+                img_road, road_x = carregados['estrada']
+                inner_x, inner_w, lane_w, lane_centers = carregados['faixas']
+                fundo = RoadBackground(img_road, road_x)
+                engine = GameEngine(carregados['jogador'], inner_x, inner_w, lane_w, lane_centers,
+                                    timestep.passo, rng=rng)
+                gravador = ReplayRecorder(engine.rng.semente, SIM_TICK_HZ)
+                # Teclado ou piloto automático (PILOTO_AUTOMATICO), lido a cada tick
+                fonte_entrada = criar_fonte(PILOTO_AUTOMATICO or 'teclado', engine.rng.fluxo('entrada'))
+                print(f"📦 Pré-carregamento: {preloader.estatisticas()}")
+                if ASSETS_RELATORIO:
+                    assets.imprimir_relatorio()
+
             # Para trilha do menu apenas uma vez e inicia playlist do jogo
             if not hasattr(game_state, '_musica_abertura_parada'):
                 if pygame.mixer.music.get_busy():
@@ -117,130 +121,67 @@ def main():
             if playlist_manager.musica_atual:
                 print(f"🎵 Status: {os.path.basename(playlist_manager.musica_atual)} - Tocando: {pygame.mixer.music.get_busy()}")
 
-            # LIMPAR A TELA DO FRAME ANTERIOR
-            tela.fill((50, 150, 50))
-
-            # Estrada infinita (duas cópias)
-            road_y1 += road_speed * dt
-            road_y2 += road_speed * dt
-            if road_y1 >= TELA_ALTURA: road_y1 = road_y2 - H_tile
-            if road_y2 >= TELA_ALTURA: road_y2 = road_y1 - H_tile
-            tela.blit(img_road, (road_x, int(road_y1)))
-            tela.blit(img_road, (road_x, int(road_y2)))
-            road_speed += road_accel * dt
-
-            # Jogador
-            teclas = pygame.key.get_pressed()
-            carro.mover(teclas, dt)
-            carro.desenhar(tela)
-
-            # Spawns de obstáculos (tempo real) - MANTÉM DENSIDADE CONSTANTE
-            spawn_timer += dt
-            if spawn_timer >= spawn_interval:
-                obstaculos.append(Obstaculo(vel_obst, lane_centers, lane_w))
-                spawn_timer = 0.0
-                # Ajusta intervalo para manter densidade constante
-                # Quanto mais rápido os carros, mais frequentemente devem spawnar
-                spawn_interval = max(0.2, 0.7 * (OBST_VEL_INICIAL / vel_obst))
-            
-            # Spawns de power-ups
-            powerup_spawn_timer += dt
-            if powerup_spawn_timer >= powerup_spawn_interval:
-                if random.random() < POWERUP_SPAWN_CHANCE:
-                    # Escolhe tipo aleatório de power-up
-                    tipo_powerup = random.choice(list(POWERUP_TIPOS.keys()))
-                    powerups.append(PowerUp(tipo_powerup, lane_centers, lane_w))
-                powerup_spawn_timer = 0.0
-
-            # Atualiza power-ups ativos
-            powerup_manager.atualizar(dt)
-            
-            # Aplica efeitos dos power-ups ativos
-            efeitos = powerup_manager.get_efeitos_atuais()
-            
-            # Obstáculos + colisão
-            for obst in obstaculos[:]:
-                # Atualiza posição do jogador para polícia inteligente
-                if obst.eh_policia:
-                    obst.atualizar_posicao_jogador(carro.x + carro.largura // 2)
-                    obst.dificuldade_jogo = dificuldade
-                
-                # Aplica efeito de câmera lenta aos obstáculos
-                velocidade_efetiva = vel_obst * efeitos['velocidade_obstaculos_mult']
-                obst.mover(dt, velocidade_efetiva)
-                obst.desenhar(tela)
-
-                if obst.fora_da_tela():
-                    obstaculos.remove(obst)
-                    # Aplica multiplicador de pontos
-                    pontos_ganhos = int(1 * efeitos['pontos_mult'])
-                    pontuacao += pontos_ganhos
-                    if pontuacao % 10 == 0:
-                        dificuldade += 1
-                        vel_obst += 40  # aumento mais perceptível
-                        
-                        # ATUALIZA A VELOCIDADE DE TODOS OS OBSTÁCULOS EXISTENTES
-                        for obst_existente in obstaculos:
-                            obst_existente.vel = vel_obst
-                        
-                        # Ajusta volume da playlist baseado na dificuldade
-                        # VOLUME AGRESSIVO DESATIVADO - Usuário tem controle total
-                        # if PLAYLIST_AGGRESSIVE_MODE and not game_state.mute_ativo and not game_state.volume_ajustado_manualmente:
-                        #     novo_volume = min(1.0, PLAYLIST_VOLUME + (dificuldade - 1) * 0.05)
-                        #     playlist_manager.definir_volume(novo_volume)
-                    continue
-
-            # Power-ups
-            for powerup in powerups[:]:
-                powerup.mover(dt)
-                powerup.desenhar(tela)
-                
-                # Verifica colisão com power-up
-                if check_collision_with_powerup(carro, powerup):
-                    powerup_manager.adicionar_powerup(powerup.tipo)
-                    powerups.remove(powerup)
-                    continue
-                
-                # Efeito do ímã - atrai power-ups próximos
-                if efeitos['raio_imã'] > 0:
-                    distancia = ((carro.x - powerup.x)**2 + (carro.y - powerup.y)**2)**0.5
-                    if distancia <= efeitos['raio_imã']:
-                        # Move power-up em direção ao jogador
-                        dx = carro.x - powerup.x
-                        dy = carro.y - powerup.y
-                        if abs(dx) > 5:  # Evita oscilação
-                            powerup.x += dx * 0.1
-                        if abs(dy) > 5:
-                            powerup.y += dy * 0.1
-                
-                if not powerup.esta_na_tela():
-                    powerups.remove(powerup)
-                    continue
-
-            # Verifica colisão (ignora se tiver imunidade)
-            if not efeitos['imunidade_colisao'] and game_state.verificar_colisao(carro, obstaculos, pontuacao):
-                # Reseta variáveis do jogo
-                carro = CarroJogador(img_carro_jogador, inner_x, inner_w, lane_w)
-                obstaculos.clear()
-                powerups.clear()
-                powerup_manager.limpar_todos()
-                spawn_timer = 0.0
-                powerup_spawn_timer = 0.0
-                spawn_interval = 0.7
-                powerup_spawn_interval = 2.0
-                vel_obst = OBST_VEL_INICIAL
-                pontuacao = 0
-                dificuldade = 1
-                road_y1, road_y2 = 0, -H_tile
-                road_speed = 200.0
+            # Simulação em passo fixo: roda quantos ticks couberem no tempo real
+            passos = timestep.avancar(dt)
+            for _ in range(passos):
+                fundo.atualizar(timestep.passo)
+                entrada = fonte_entrada.ler(engine)
+                gravador.registrar(entrada)
+                estado_sim = engine.passo(entrada)
+
+                if estado_sim.colidiu:
+                    game_state.game_over(estado_sim.pontuacao)
+                    if REPLAY_GRAVAR:
+                        gravador.salvar(REPLAY_FILE)
+                    # Reseta variáveis do jogo
+                    engine.resetar()
+                    gravador = ReplayRecorder(engine.rng.semente, SIM_TICK_HZ)
+                    fonte_entrada.reiniciar()
+                    fundo.resetar()
+                    timestep.resetar()
+                    if dirty_rects:
+                        dirty_rects.invalidar()
+                    break
+
+            # Renderização interpolada entre o último tick e o próximo
+            alpha = timestep.alpha
+            if estado_anterior != JOGANDO:
+                fundo.invalidar()  # menu/ajuda desenharam a tela inteira
+            fundo.desenhar(tela, alpha, regioes_hud)
+            if dirty_rects:
+                dirty_rects.marcar(fundo.rect_estrada)
+            # Entidades: regiões do atlas (e overlays da sirene) num único blits
+            fila_desenho = []
+            engine.carro.enfileirar(fila_desenho, alpha)
+            for obst in engine.obstaculos:
+                obst.enfileirar(fila_desenho, alpha)
+                if dirty_rects and obst.eh_policia:
+                    # brilho da sirene pode passar das bordas do carro
+                    dirty_rects.marcar(obst.rect.inflate(obst.largura, obst.altura))
+            for powerup in engine.powerups:
+                powerup.enfileirar(fila_desenho, alpha)
+            tela.blits(fila_desenho, doreturn=False)
+            if SHOW_HITBOX_DEBUG:
+                for entidade in (engine.carro, *engine.obstaculos, *engine.powerups):
+                    entidade.desenhar_debug(tela, alpha)
 
         # Desenha interface baseada no estado
-        game_state.desenhar(pontuacao, obstaculos if estado == JOGANDO else None, powerup_manager if estado == JOGANDO else None)
+        estado_anterior = estado
+        regioes_hud = game_state.desenhar(engine.estado.pontuacao if engine else 0,
+                                          engine.obstaculos if estado == JOGANDO else None,
+                                          engine.powerup_manager if estado == JOGANDO else None)
         
         # Atualiza playlist
         game_state.atualizar_playlist(dt)
         
-        pygame.display.flip()
+        if dirty_rects and estado == JOGANDO and game_state.estado_atual == JOGANDO:
+            # Só a estrada (com as entidades) e os textos do HUD mudam
+            dirty_rects.marcar_varios(regioes_hud)
+            dirty_rects.apresentar()
+        else:
+            if dirty_rects:
+                dirty_rects.invalidar()
+            pygame.display.flip()
         clock.tick(FPS)
 
     pygame.quit()
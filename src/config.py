@@ -6,7 +6,11 @@ Configurações e constantes do jogo
 # -------------------- Configurações da Tela --------------------
 TELA_LARGURA = 1280
 TELA_ALTURA = 720
-FPS = 60
+FPS = 60  # limite de renderização (0 = sem limite)
+SIM_TICK_HZ = 60  # frequência fixa da simulação (ticks por segundo)
+SIM_MAX_PASSOS_POR_FRAME = 8  # máximo de ticks simulados por frame renderizado
+DIRTY_RECTS = False  # atualiza só as regiões alteradas (bom p/ renderização por software)
+DIRTY_RECTS_LIMITE = 0.6  # fração da tela acima da qual volta a fazer flip completo
 
 # Estados do jogo
 MENU = 0
@@ -22,21 +26,31 @@ CARRO_ALTURA = 90
 # Obstáculos
 OBST_ALTURA = 90
 OBST_VEL_INICIAL = 280  # px/s
+OBST_VEL_INCREMENTO = 40  # aumento de velocidade a cada 10 pontos (px/s)
+OBST_SPAWN_INTERVALO = 0.7  # intervalo entre spawns na velocidade inicial (s)
+OBST_SPAWN_INTERVALO_MIN = 0.2  # intervalo mínimo entre spawns (s)
+SPAWN_JANELA = 10.0  # segundos de spawns sorteados com antecedência
+SPAWN_LOTE_OBSTACULOS = 16  # padrões de obstáculos sorteados por vez
 
 # Faixas
 LANE_COUNT = 3
 LANE_MARGIN = 6  # folga lateral dentro da faixa
 
 # -------------------- Configurações de Colisão --------------------
-COLLISION_MODE = "mask"  # "shrink" ou "mask"
+COLLISION_MODE = "hybrid"  # "shrink", "mask" ou "hybrid" (bbox da máscara + máscara)
 HITBOX_SHRINK_W = 0.15  # 15% na largura (modo shrink)
 HITBOX_SHRINK_H = 0.18  # 18% na altura (modo shrink)
 ALPHA_THRESHOLD = 50  # opacidade mínima p/ máscara
 SHOW_HITBOX_DEBUG = False
+BROADPHASE_ALTURA_BANDA = 90  # altura (px) das bandas verticais da broadphase
+BROADPHASE_LOTE_MIN = 32  # a partir de quantos obstáculos a broadphase usa NumPy
+COLISAO_VARRIDA = True  # testa o trajeto entre ticks (evita atravessar o jogador em ticks longos)
+COLISAO_VARRIDA_PASSO = 8  # distância máxima (px) entre amostras do trajeto
 
 # -------------------- Configurações da Sirene --------------------
 SIRENE_FPS = 8  # frames por segundo da animação da sirene
 SIRENE_COLOR = (255, 0, 0)  # cor vermelha da sirene
+SIRENE_BLEND_ADITIVO = False  # True = brilho/luz somados ao fundo (BLEND_RGB_ADD)
 POLICE_SPAWN_CHANCE = 0.15  # 15% de chance de spawnar carro da polícia
 POLICE_SPECIAL_EFFECTS = True  # ativa efeitos especiais para carros da polícia
 
@@ -51,13 +65,45 @@ PLAYLIST_VOLUME = 0.2  # volume das músicas da playlist (0.0 a 1.0) - 20%
 PLAYLIST_FADE_TIME = 1.0  # tempo de fade entre músicas (segundos)
 PLAYLIST_AGGRESSIVE_MODE = False  # volume agressivo DESATIVADO - usuário tem controle total
 
+# -------------------- Configurações de Assets --------------------
+ASSETS_ORCAMENTO_BYTES = 48 * 1024 * 1024  # memória máxima das variantes (escaladas/máscaras); LRU acima disso
+ASSETS_RELATORIO = False  # mostra no console a memória de cada asset ao iniciar
+ATLAS_SPRITES = True  # empacota carros, sirene e power-ups em atlas (entidades desenhadas com um único blits)
+ATLAS_LARGURA = 2048  # largura das páginas do atlas
+ATLAS_ALTURA_MAX = 2048  # altura máxima de cada página (acima disso abre outra)
+ASSETS_PACOTE = "assets/assets.pak"  # pacote gerado por bake_assets.py (ignorado se faltar ou estiver desatualizado)
+
+# -------------------- Configurações do HUD --------------------
+TEXTO_CACHE_TAMANHO = 256  # máximo de textos renderizados mantidos em cache (LRU)
+
 # -------------------- Configurações do Record --------------------
-RECORD_FILE = "record.txt"  # arquivo para salvar o record 
+RECORD_FILE = "record.txt"  # arquivo para salvar o record
+
+# -------------------- Configurações do Piloto Automático --------------------
+PILOTO_AUTOMATICO = None  # None = teclado; ou um nível de PILOTO_NIVEIS (benchmarks/demonstração)
+PILOTO_PASSO_PLANO = 1 / 30  # resolução (s) da simulação à frente
+PILOTO_NIVEIS = {
+    # horizonte: segundos simulados à frente; reacao: segundos entre replanejamentos
+    # margem: folga (px) em volta do jogador; erro: chance de escolher uma faixa ao acaso
+    # antecipa_policia: prevê a próxima decisão das viaturas (se vão mirar a faixa do jogador)
+    'iniciante': {'horizonte': 0.8, 'reacao': 0.25, 'margem': 0, 'erro': 0.05, 'antecipa_policia': False},
+    'medio': {'horizonte': 1.5, 'reacao': 0.1, 'margem': 4, 'erro': 0.01, 'antecipa_policia': False},
+    'expert': {'horizonte': 2.0, 'reacao': 0.05, 'margem': 4, 'erro': 0.0, 'antecipa_policia': True},
+}
+
+# -------------------- Configurações de Replay --------------------
+REPLAY_GRAVAR = True  # grava semente + entradas de cada partida
+REPLAY_FILE = "ultimo_replay.rpl"  # replay da última partida (sobrescrito a cada game over)
+REPLAY_SNAPSHOT_INTERVALO = 600  # ticks entre snapshots ao indexar um replay (busca)
+REPLAY_SNAPSHOT_MEMORIA = 32 * 1024 * 1024  # orçamento (bytes); acima dele os snapshots são desbastados 
 
 # -------------------- Configurações dos Power-ups --------------------
 POWERUP_SPAWN_CHANCE = 0.08  # 8% de chance de spawnar power-up
+POWERUP_SPAWN_INTERVALO = 2.0  # intervalo entre tentativas de spawn (s)
 POWERUP_ALTURA = 60  # altura dos power-ups
 POWERUP_VELOCIDADE = 280  # velocidade de queda dos power-ups (px/s)
+POWERUP_FRAMES_ROTACAO = 32  # ângulos pré-renderizados (mais = mais suave, mais memória)
+POWERUP_FRAMES_PULSO = 8  # passos de pulsação pré-renderizados por ângulo
 
 # Tipos de Power-ups disponíveis
 POWERUP_TIPOS = {
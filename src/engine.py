@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de simulação headless (sem display, fontes ou mixer)
+
+Concentra a lógica do jogo: jogador, obstáculos, power-ups, spawns,
+dificuldade e pontuação. Cada chamada a `passo()` avança um tick fixo a
+partir de uma entrada codificada em bits e devolve o estado atualizado.
+"""
+
+import heapq
+import pygame
+from .config import (
+    TELA_LARGURA, LANE_COUNT, OBST_VEL_INICIAL, OBST_VEL_INCREMENTO, SIM_TICK_HZ
+)
+from .utils.road_detection import detect_asphalt_bounds
+from .managers.assets import assets
+from .utils.rng import RNGService
+from .entities.player import CarroJogador
+from .entities.obstacles import Obstaculo
+from .entities.obstacle_store import ObstaculoStore, CAMPOS
+from .entities.pool import EntityPool
+from .entities.powerup import PowerUp, PowerUpManager
+from .managers.police_ai import PoliceAIManager
+from .managers.spawn import SpawnScheduler, SPAWN_OBSTACULO
+from .managers.collision import (
+    BroadphaseFaixas, check_collision, check_collision_with_powerup
+)
+
+# Bits da entrada de cada tick
+ENTRADA_ESQUERDA = 1
+ENTRADA_DIREITA = 2
+
+
+def entrada_do_teclado(teclas) -> int:
+    """Converte o estado do teclado do pygame nos bits de entrada"""
+    entrada = 0
+    if teclas[pygame.K_LEFT] or teclas[pygame.K_a]:
+        entrada |= ENTRADA_ESQUERDA
+    if teclas[pygame.K_RIGHT] or teclas[pygame.K_d]:
+        entrada |= ENTRADA_DIREITA
+    return entrada
+
+
+def carregar_estrada():
+    """Carrega e escala a estrada; retorna (img_road, road_x)"""
+    # Só as dimensões do original (1024x1536) importam; com o pacote de assets
+    # elas e a estrada escalada vêm prontas, sem decodificar o PNG
+    largura_orig, altura_orig = assets.variante(('tamanho', 'road.png'),
+                                                lambda: assets.imagem("road.png", alpha=False).get_size())
+    road_width = min(largura_orig, int(TELA_LARGURA * 0.4))
+    img_road = assets.escalada("road.png", (road_width, altura_orig), alpha=False)
+    assets.descartar_base("road.png", alpha=False)  # o original não é mais usado
+    road_x = (TELA_LARGURA - road_width) // 2
+    return img_road, road_x
+
+
+def calcular_faixas(img_road, road_x: int):
+    """Detecta o asfalto e retorna (inner_x, inner_w, lane_w, lane_centers)"""
+    # Guardado como variante: o pacote de assets já traz os limites calculados
+    inner_x, inner_w = assets.variante(('asfalto', 'road.png', img_road.get_size(), road_x),
+                                       lambda: detect_asphalt_bounds(img_road, road_x))
+    lane_w = inner_w // LANE_COUNT
+    lane_centers = [inner_x + lane_w//2 + i*lane_w for i in range(LANE_COUNT)]
+    return inner_x, inner_w, lane_w, lane_centers
+
+
+class EstadoSimulacao:
+    """Estado escalar da partida, atualizado no lugar a cada tick"""
+
+    __slots__ = ('tick', 'tempo', 'pontuacao', 'dificuldade', 'vel_obst', 'colidiu', 'causa')
+
+    def __init__(self):
+        self.tick = 0
+        self.tempo = 0.0
+        self.pontuacao = 0
+        self.dificuldade = 1
+        self.vel_obst = OBST_VEL_INICIAL
+        self.colidiu = False
+        self.causa = None  # nome da imagem do obstáculo que causou a colisão
+
+
+class SnapshotSimulacao:
+    """Cópia de todo o estado de uma partida num tick (ver GameEngine.capturar_estado).
+
+    Só guarda dados (números, arrays e tuplas), nunca referências às
+    entidades vivas, então pode ser restaurado quantas vezes for preciso.
+    """
+
+    __slots__ = ('tick', 'estado', 'carro', 'obstaculos', 'sirenes', 'policia',
+                 'powerups', 'powerup_manager', 'spawner', 'rng')
+
+    def tamanho(self) -> int:
+        """Estimativa (bytes) da memória ocupada, para o orçamento de snapshots"""
+        arrays = sum(arr.nbytes for arr in self.obstaculos.values())
+        itens = (len(self.sirenes) + len(self.policia[2]) + len(self.powerups) +
+                 len(self.powerup_manager[2]) + len(self.spawner[2]) + len(self.spawner[3]))
+        # Estado do Mersenne Twister: 625 inteiros por fluxo
+        return 512 + arrays + itens * 96 + len(self.rng) * 625 * 36
+
+
+class GameEngine:
+    """Simulação completa de uma partida, independente de janela e áudio"""
+
+    def __init__(self, img_jogador, inner_x: int, inner_w: int, lane_w: int,
+                 lane_centers: list[int], dt: float = 1.0 / SIM_TICK_HZ, semente: int = None,
+                 rng: RNGService = None, avisos: bool = True):
+        self.img_jogador = img_jogador
+        self.inner_x = inner_x
+        self.inner_w = inner_w
+        self.lane_w = lane_w
+        self.lane_centers = lane_centers
+        self.dt = dt
+
+        # Toda aleatoriedade da simulação vem destes fluxos (reprodutível pela semente);
+        # `rng` permite compartilhar o serviço criado antes do motor (ex.: playlist no menu)
+        self.rng = rng or RNGService(semente)
+        self.powerup_manager = PowerUpManager(avisos)
+        self.pool_obstaculos = EntityPool(Obstaculo)
+        self.pool_powerups = EntityPool(PowerUp)
+        self.obstaculos = ObstaculoStore()
+        self.powerups = []
+        self.broadphase = BroadphaseFaixas(inner_x, lane_w, len(lane_centers))
+        self.policia = PoliceAIManager(lane_centers, self.rng.fluxo('policia'))
+        self.spawner = SpawnScheduler(len(lane_centers), rng=self.rng.fluxo('spawn'))
+        self.estado = EstadoSimulacao()
+        self.resetar(self.rng.semente)
+
+    @classmethod
+    def headless(cls, dt: float = 1.0 / SIM_TICK_HZ, semente: int = None, avisos: bool = True):
+        """Cria o motor carregando os assets sem precisar de janela"""
+        img_jogador = assets.imagem("carro_jogador.png")
+        img_road, road_x = carregar_estrada()
+        inner_x, inner_w, lane_w, lane_centers = calcular_faixas(img_road, road_x)
+        return cls(img_jogador, inner_x, inner_w, lane_w, lane_centers, dt, semente, avisos=avisos)
+
+    def resetar(self, semente: int = None):
+        """Começa uma nova partida (semente None = sorteia uma nova)"""
+        self.rng.reiniciar(semente)
+        self.carro = CarroJogador(self.img_jogador, self.inner_x, self.inner_w, self.lane_w)
+        self.pool_obstaculos.liberar_varios(self.obstaculos.clear())
+        self.pool_powerups.liberar_varios(self.powerups)
+        self.powerups.clear()
+        self.powerup_manager.limpar_todos()
+        self.policia.limpar()
+        self.spawner.resetar()
+        self.estado.__init__()
+
+    def capturar_estado(self) -> SnapshotSimulacao:
+        """Copia o estado completo da partida (restaurável com restaurar_estado)"""
+        snap = SnapshotSimulacao()
+        estado = self.estado
+        store = self.obstaculos
+        n = store.n
+        snap.tick = estado.tick
+        snap.estado = tuple(getattr(estado, campo) for campo in EstadoSimulacao.__slots__)
+        snap.carro = (self.carro.x, self.carro.x_ant)
+        snap.obstaculos = {nome: getattr(store, nome)[:n].copy() for nome in CAMPOS}
+        snap.sirenes = [(obst.sirene.timer, obst.sirene.frame_atual, obst.sirene.brilho_timer)
+                        if obst.sirene is not None else None for obst in store.objetos]
+
+        # Decisões da polícia guardadas pela linha do obstáculo no store
+        policia = self.policia
+        decisoes = [(instante, seq, obst._i) for instante, seq, geracao, obst in policia.decisoes
+                    if obst._store is store and obst._geracao == geracao]
+        snap.policia = (policia.relogio, policia.seq, decisoes)
+
+        snap.powerups = [(p.tipo, p.x, p.y, p.x_ant, p.y_ant, p.animacao_timer, p.rotacao,
+                          p.escala, p.pulsando) for p in self.powerups]
+        manager = self.powerup_manager
+        snap.powerup_manager = (manager.relogio, dict(manager.expiracoes),
+                                list(manager.heap_expiracoes), manager.efeitos)
+        spawner = self.spawner
+        snap.spawner = (spawner.relogio, spawner.seq, list(spawner.eventos),
+                        list(spawner.padroes_obstaculos), spawner.proxima_tentativa_powerup)
+        snap.rng = {nome: fluxo.getstate() for nome, fluxo in self.rng.fluxos.items()}
+        return snap
+
+    def restaurar_estado(self, snap: SnapshotSimulacao):
+        """Volta a partida exatamente ao tick em que `snap` foi capturado"""
+        estado = self.estado
+        for campo, valor in zip(EstadoSimulacao.__slots__, snap.estado):
+            setattr(estado, campo, valor)
+        self.carro.x, self.carro.x_ant = snap.carro
+
+        # Obstáculos: recria as linhas (pelo pool) na mesma ordem e copia os arrays
+        store = self.obstaculos
+        self.pool_obstaculos.liberar_varios(store.clear())
+        colunas = snap.obstaculos
+        for i in range(len(colunas['x'])):
+            store.adicionar(self.pool_obstaculos.adquirir(
+                colunas['vel'][i], self.lane_centers, self.lane_w,
+                int(colunas['sprite_id'][i]), int(colunas['faixa'][i])))
+        n = store.n
+        for nome, valores in colunas.items():
+            getattr(store, nome)[:n] = valores
+        for obst, sirene in zip(store.objetos, snap.sirenes):
+            if sirene is not None:
+                obst.sirene.timer, obst.sirene.frame_atual, obst.sirene.brilho_timer = sirene
+
+        policia = self.policia
+        policia.relogio, policia.seq, decisoes = snap.policia
+        policia.decisoes = [(instante, seq, store.objetos[i]._geracao, store.objetos[i])
+                            for instante, seq, i in decisoes]
+        heapq.heapify(policia.decisoes)
+
+        self.pool_powerups.liberar_varios(self.powerups)
+        self.powerups.clear()
+        for tipo, x, y, x_ant, y_ant, animacao_timer, rotacao, escala, pulsando in snap.powerups:
+            powerup = self.pool_powerups.adquirir(tipo, self.lane_centers, self.lane_w, 0)
+            powerup.x, powerup.y, powerup.x_ant, powerup.y_ant = x, y, x_ant, y_ant
+            powerup.animacao_timer, powerup.rotacao = animacao_timer, rotacao
+            powerup.escala, powerup.pulsando = escala, pulsando
+            self.powerups.append(powerup)
+
+        manager = self.powerup_manager
+        manager.relogio, expiracoes, heap_expiracoes, manager.efeitos = snap.powerup_manager
+        manager.expiracoes = dict(expiracoes)
+        manager.heap_expiracoes = list(heap_expiracoes)
+
+        spawner = self.spawner
+        spawner.relogio, spawner.seq, eventos, padroes, spawner.proxima_tentativa_powerup = snap.spawner
+        spawner.eventos = list(eventos)
+        spawner.padroes_obstaculos.clear()
+        spawner.padroes_obstaculos.extend(padroes)
+
+        for nome, estado_rng in snap.rng.items():
+            self.rng.fluxo(nome).setstate(estado_rng)
+
+    def passo(self, entrada: int) -> EstadoSimulacao:
+        """Avança um tick com a entrada dada e retorna o estado (mesmo objeto, atualizado)"""
+        dt = self.dt
+        estado = self.estado
+        carro = self.carro
+
+        # Jogador
+        carro.mover_entrada(entrada & ENTRADA_ESQUERDA, entrada & ENTRADA_DIREITA, dt)
+
+        # Spawns agendados (obstáculos mantêm densidade constante; ver SpawnScheduler)
+        for tipo, dados in self.spawner.atualizar(dt, estado):
+            if tipo == SPAWN_OBSTACULO:
+                sprite_id, faixa = dados
+                obst = self.pool_obstaculos.adquirir(
+                    estado.vel_obst, self.lane_centers, self.lane_w, sprite_id, faixa)
+                self.obstaculos.adicionar(obst)
+                if obst.eh_policia:
+                    self.policia.registrar(obst, estado.dificuldade)
+            else:
+                tipo_powerup, faixa = dados
+                self.powerups.append(
+                    self.pool_powerups.adquirir(tipo_powerup, self.lane_centers, self.lane_w, faixa))
+
+        # Atualiza power-ups ativos e aplica seus efeitos
+        self.powerup_manager.atualizar(dt)
+        efeitos = self.powerup_manager.efeitos
+
+        # Faixas/bandas do jogador neste tick (broadphase das colisões)
+        self.broadphase.preparar(carro)
+
+        self._mover_obstaculos(dt, efeitos)
+        self._mover_powerups(dt, efeitos)
+
+        estado.tick += 1
+        estado.tempo = estado.tick * dt
+
+        # Verifica colisão (ignora se tiver imunidade)
+        if not efeitos.imunidade_colisao:
+            for obst in self.broadphase.candidatos(self.obstaculos):
+                if check_collision(carro, obst):
+                    estado.colidiu = True
+                    estado.causa = obst.nome_imagem
+                    break
+
+        # Descarte depois da colisão: com colisão contínua um obstáculo rápido
+        # pode cruzar o jogador e sair da tela no mesmo tick
+        self._descartar_obstaculos(efeitos)
+        return estado
+
+    def _mover_obstaculos(self, dt, efeitos):
+        """Move os obstáculos em lote (descida, polícia e sirenes)"""
+        estado = self.estado
+        store = self.obstaculos
+        store.salvar_anteriores()
+
+        # Descida de todos os obstáculos de uma vez (com efeito de câmera lenta)
+        store.mover(dt, estado.vel_obst * efeitos.velocidade_obstaculos_mult)
+
+        # Trocas de faixa e movimento lateral de todas as viaturas em lote
+        jogador_x = self.carro.x + self.carro.largura // 2
+        self.policia.atualizar(store, jogador_x, estado.dificuldade, dt)
+        for i in store.indices_policia():
+            store.objetos[i].sirene.atualizar(dt)
+
+    def _descartar_obstaculos(self, efeitos):
+        """Remove os obstáculos que saíram da tela e pontua"""
+        estado = self.estado
+        store = self.obstaculos
+        for obst in store.remover_fora_da_tela():
+            self.pool_obstaculos.liberar(obst)
+            # Aplica multiplicador de pontos
+            estado.pontuacao += int(1 * efeitos.pontos_mult)
+            if estado.pontuacao % 10 == 0:
+                estado.dificuldade += 1
+                estado.vel_obst += OBST_VEL_INCREMENTO  # aumento mais perceptível
+
+                # Atualiza a velocidade de todos os obstáculos existentes
+                store.definir_velocidade(estado.vel_obst)
+
+    def _mover_powerups(self, dt, efeitos):
+        """Move os power-ups, coleta os que tocaram o jogador e aplica o ímã"""
+        carro = self.carro
+        raio_ima = efeitos.raio_ima
+
+        for powerup in self.powerups[:]:
+            powerup.mover(dt)
+
+            # Verifica colisão com power-up
+            if self.broadphase.e_candidato(powerup) and check_collision_with_powerup(carro, powerup):
+                self.powerup_manager.adicionar_powerup(powerup.tipo)
+                self.powerups.remove(powerup)
+                self.pool_powerups.liberar(powerup)
+                continue
+
+            # Efeito do ímã - atrai power-ups próximos
+            if raio_ima > 0:
+                dx = carro.x - powerup.x
+                dy = carro.y - powerup.y
+                if (dx * dx + dy * dy) ** 0.5 <= raio_ima:
+                    # Move power-up em direção ao jogador
+                    if abs(dx) > 5:  # Evita oscilação
+                        powerup.x += dx * 0.1
+                    if abs(dy) > 5:
+                        powerup.y += dy * 0.1
+
+            if not powerup.esta_na_tela():
+                self.powerups.remove(powerup)
+                self.pool_powerups.liberar(powerup)
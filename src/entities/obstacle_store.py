@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Armazenamento struct-of-arrays (NumPy) dos obstáculos ativos
+"""
+
+import numpy as np
+from ..config import TELA_ALTURA
+
+# Campos numéricos mantidos em arrays paralelos: nome -> dtype
+CAMPOS = {
+    'x': np.float64,
+    'y': np.float64,
+    'x_ant': np.float64,
+    'y_ant': np.float64,
+    'vel': np.float64,
+    'largura': np.int64,
+    'altura': np.int64,
+    'faixa': np.int64,
+    'sprite_id': np.int64,
+    'eh_policia': np.bool_,
+    'target_lane_x': np.float64,
+    'moving_lateral': np.bool_,
+}
+
+
+class ObstaculoStore:
+    """Obstáculos ativos com posição/velocidade em arrays NumPy.
+
+    Movimento vertical, descarte dos que saíram da tela e troca de velocidade
+    são operações vetorizadas. `objetos[i]` é o Obstaculo da linha `i`; a
+    remoção troca a linha removida pela última (swap-remove, O(1)).
+    """
+
+    def __init__(self, capacidade: int = 64):
+        self.n = 0
+        self.objetos = []
+        for nome, dtype in CAMPOS.items():
+            setattr(self, nome, np.zeros(capacidade, dtype=dtype))
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        return iter(self.objetos)
+
+    def __getitem__(self, i):
+        return self.objetos[i]
+
+    def _crescer(self):
+        """Dobra a capacidade dos arrays"""
+        for nome in CAMPOS:
+            antigo = getattr(self, nome)
+            novo = np.zeros(len(antigo) * 2, dtype=antigo.dtype)
+            novo[:self.n] = antigo[:self.n]
+            setattr(self, nome, novo)
+
+    def adicionar(self, obst):
+        """Move os campos do obstáculo para a próxima linha livre"""
+        if self.n == len(self.x):
+            self._crescer()
+        i = self.n
+        valores = {nome: getattr(obst, nome) for nome in CAMPOS}
+        for nome, valor in valores.items():
+            getattr(self, nome)[i] = valor
+        obst._store, obst._i = self, i
+        self.objetos.append(obst)
+        self.n += 1
+
+    def remover_indice(self, i: int):
+        """Remove a linha `i` trocando-a pela última"""
+        obst = self.objetos[i]
+        # Devolve os valores ao objeto, que volta a funcionar fora do store
+        valores = {nome: getattr(obst, nome) for nome in CAMPOS}
+        obst._store = None
+        for nome, valor in valores.items():
+            setattr(obst, nome, valor)
+
+        ultimo = self.n - 1
+        if i != ultimo:
+            for nome in CAMPOS:
+                arr = getattr(self, nome)
+                arr[i] = arr[ultimo]
+            movido = self.objetos[ultimo]
+            self.objetos[i] = movido
+            movido._i = i
+        self.objetos.pop()
+        self.n = ultimo
+        return obst
+
+    def clear(self) -> list:
+        """Remove todos os obstáculos e os retorna"""
+        return [self.remover_indice(i) for i in range(self.n - 1, -1, -1)]
+
+    def salvar_anteriores(self):
+        """Guarda a posição atual como posição do tick anterior (interpolação)"""
+        n = self.n
+        self.x_ant[:n] = self.x[:n]
+        self.y_ant[:n] = self.y[:n]
+
+    def mover(self, dt: float, velocidade):
+        """Desce todos os obstáculos; `velocidade` pode ser escalar ou array"""
+        self.y[:self.n] += velocidade * dt
+
+    def definir_velocidade(self, vel: float):
+        """Aplica a mesma velocidade a todos os obstáculos"""
+        self.vel[:self.n] = vel
+
+    def indices_policia(self):
+        """Índices das linhas que são carros da polícia"""
+        return self.eh_policia[:self.n].nonzero()[0]
+
+    def remover_fora_da_tela(self, limite: float = TELA_ALTURA) -> list:
+        """Remove (em lote) os obstáculos abaixo de `limite` e os retorna"""
+        indices = (self.y[:self.n] > limite).nonzero()[0]
+        if not len(indices):
+            return []
+        # Do maior para o menor, para o swap-remove não mover um índice pendente
+        return [self.remover_indice(int(i)) for i in indices[::-1]]
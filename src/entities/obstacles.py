@@ -3,233 +3,166 @@
 Classe para obstáculos do jogo
 """
 
-import os
-import random
 import pygame
-from ..config import (
-    OBST_ALTURA, LANE_MARGIN, ALPHA_THRESHOLD, SHOW_HITBOX_DEBUG,
-    POLICE_SPAWN_CHANCE, POLICE_LATERAL_SPEED, POLICE_LANE_CHANGE_INTERVAL,
-    POLICE_AGGRESSIVE_MODE, OBST_VEL_INICIAL
-)
+from ..config import POLICE_SPAWN_CHANCE
 from .police import SireneAnimacao
-from ..managers.collision import create_hit_rect
+from ..managers.collision import create_hit_rect_from_rect
+from ..managers.sprite_cache import SpriteCache
+from ..managers.assets import assets
+from ..managers.atlas import atlas
+
+
+def _campo_store(nome: str):
+    """Atributo guardado no ObstaculoStore quando o obstáculo está em um, ou no próprio objeto"""
+    privado = '_' + nome
+
+    def obter(self):
+        store = self._store
+        if store is None:
+            return getattr(self, privado)
+        # .item(): float/int/bool do Python, nunca escalares NumPy (pygame, JSON)
+        return getattr(store, nome)[self._i].item()
+
+    def definir(self, valor):
+        store = self._store
+        if store is None:
+            setattr(self, privado, valor)
+        else:
+            getattr(store, nome)[self._i] = valor
+
+    return property(obter, definir)
 
 
 class Obstaculo:
     inimigos_imgs = []
     inimigos_nomes = ["taxi.png", "audi.png", "car.png", "police.png"]
+    carros_civis = [i for i, nome in enumerate(inimigos_nomes) if nome != "police.png"]
+    sprite_cache = SpriteCache()
+    setas = None  # (esquerda, direita): seta da viatura trocando de faixa
+
+    # Campos numéricos vivem nos arrays do ObstaculoStore (ver CAMPOS)
+    _store = None
+    _i = -1
+    x = _campo_store('x')
+    y = _campo_store('y')
+    x_ant = _campo_store('x_ant')
+    y_ant = _campo_store('y_ant')
+    vel = _campo_store('vel')
+    largura = _campo_store('largura')
+    altura = _campo_store('altura')
+    faixa = _campo_store('faixa')
+    sprite_id = _campo_store('sprite_id')
+    eh_policia = _campo_store('eh_policia')
+    target_lane_x = _campo_store('target_lane_x')
+    moving_lateral = _campo_store('moving_lateral')
+    _geracao = 0  # incrementada a cada reset (invalida decisões agendadas da vida anterior)
 
     @classmethod
     def carregar_imgs(cls):
         if not cls.inimigos_imgs:
-            for nome in cls.inimigos_nomes:
-                caminho = os.path.join("assets", "images", nome)
-                img = pygame.image.load(caminho).convert_alpha()
-                cls.inimigos_imgs.append(img)  # sem escala aqui
-
-    def __init__(self, vel_px_s: float, lane_centers: list[int], lane_w: int):
-        if not Obstaculo.inimigos_imgs:
-            Obstaculo.carregar_imgs()
+            # Originais (sem escala) vindos do AssetManager
+            cls.inimigos_imgs.extend(assets.imagem(nome) for nome in cls.inimigos_nomes)
 
+    @classmethod
+    def sortear(cls, n_faixas: int, rng) -> tuple[int, int]:
+        """Sorteia (sprite_id, faixa) de um novo obstáculo com o fluxo `rng` (RNGService)"""
         # Escolhe uma imagem aleatória com chance especial para polícia
-        if random.random() < POLICE_SPAWN_CHANCE:
+        if rng.random() < POLICE_SPAWN_CHANCE:
             # Força spawn de carro da polícia
-            img_index = Obstaculo.inimigos_nomes.index("police.png")
+            img_index = cls.inimigos_nomes.index("police.png")
         else:
             # Escolhe aleatoriamente entre todos os carros (exceto polícia)
-            carros_disponiveis = [i for i, nome in enumerate(Obstaculo.inimigos_nomes) if nome != "police.png"]
-            img_index = random.choice(carros_disponiveis)
-            
-        base = Obstaculo.inimigos_imgs[img_index]
-        self.nome_imagem = Obstaculo.inimigos_nomes[img_index]
-        
-        ow, oh = base.get_width(), base.get_height()
+            img_index = rng.choice(cls.carros_civis)
+        return img_index, rng.randrange(n_faixas)
 
-        # escala pela ALTURA alvo (OBST_ALTURA), preservando proporção
-        scale = OBST_ALTURA / oh
-        w = int(ow * scale)
-        h = OBST_ALTURA
+    def __init__(self, vel_px_s: float, lane_centers: list[int], lane_w: int,
+                 sprite_id: int, faixa: int):
+        self.sirene = None
+        self._sirene_reserva = None  # sirene guardada para quando a instância for reusada
+        self.reset(vel_px_s, lane_centers, lane_w, sprite_id, faixa)
+
+    def reset(self, vel_px_s: float, lane_centers: list[int], lane_w: int,
+              sprite_id: int, faixa: int):
+        """(Re)inicializa o obstáculo; usado pelo construtor e pelo EntityPool.
+
+        `sprite_id`/`faixa` vêm sorteados do SpawnScheduler (`Obstaculo.sortear`).
+        """
+        self._geracao += 1
 
-        # garante que cabe na faixa
-        max_w = max(10, lane_w - 2*LANE_MARGIN)
-        if w > max_w:
-            s = max_w / w
-            w = int(w * s)
-            h = int(h * s)
+        self.sprite_id = sprite_id
+        self.nome_imagem = Obstaculo.inimigos_nomes[sprite_id]
 
-        self.largura, self.altura = w, h
-        self.img  = pygame.transform.smoothscale(base, (w, h)).convert_alpha()
-        self.mask = pygame.mask.from_surface(self.img, ALPHA_THRESHOLD)
+        # Variante escalada + máscara compartilhadas (somente leitura)
+        variante = Obstaculo.sprite_cache.obter(self.nome_imagem, lane_w)
+        self.largura, self.altura = variante.largura, variante.altura
+        self.img = variante.img
+        self.mask = variante.mask
+        self.bbox = variante.bbox
 
         self.vel = vel_px_s
-        center = random.choice(lane_centers)
-        self.x = center - self.largura // 2
+        self.faixa = faixa
+        self.x = lane_centers[self.faixa] - self.largura // 2
         self.y = -self.altura
+        self.x_ant, self.y_ant = self.x, self.y  # posição no tick anterior (interpolação)
         
-        # Guarda informações das faixas para movimento da polícia
-        self.lane_centers = lane_centers
-        self.lane_w = lane_w
-        
-        # Cria animação da sirene se for carro da polícia
+        # Cria (ou reaproveita) a animação da sirene se for carro da polícia
+        if self.sirene is not None:
+            self._sirene_reserva = self.sirene
         self.sirene = None
         self.eh_policia = False
+        self.moving_lateral = False
+        self.target_lane_x = self.x
         if self.nome_imagem == "police.png":
-            self.sirene = SireneAnimacao(self.x, self.y, self.largura, self.altura)
+            if self._sirene_reserva is not None:
+                self.sirene = self._sirene_reserva
+                self.sirene.reset(self.largura, self.altura)
+            else:
+                self.sirene = SireneAnimacao(self.largura, self.altura)
             self.eh_policia = True
-            
-            # Variáveis para movimento lateral da polícia
-            self.lane_change_timer = 0.0
-            # Detecta a faixa inicial baseada na posição
-            self.current_lane = self._detectar_faixa_atual()
-            self.target_lane_x = self.x
-            self.moving_lateral = False
-
-    def mover(self, dt, velocidade_personalizada=None):
-        # Usa velocidade personalizada se fornecida, senão usa a velocidade padrão
-        vel_efetiva = velocidade_personalizada if velocidade_personalizada is not None else self.vel
-        self.y += vel_efetiva * dt
-        
-        # Movimento lateral especial para polícia
-        if self.eh_policia:
-            self._mover_policia_lateral(dt)
-        
-        # Atualiza posição da sirene se existir
-        if self.sirene:
-            self.sirene.x = self.x
-            self.sirene.y = self.y
-            self.sirene.atualizar(dt)
+            # Troca de faixa da polícia: PoliceAIManager (no motor)
 
-    def desenhar(self, tela):
-        tela.blit(self.img, (int(self.x), int(self.y)))
-        
-        # Desenha a sirene se for carro da polícia
+    @classmethod
+    def obter_setas(cls):
+        """Setas (esquerda, direita) da troca de faixa, desenhadas uma única vez"""
+        if cls.setas is None:
+            esquerda = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.polygon(esquerda, (255, 255, 0, 180), [(20, 10), (0, 10), (5, 5), (5, 15)])
+            direita = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.polygon(direita, (255, 255, 0, 180), [(0, 10), (20, 10), (15, 5), (15, 15)])
+            cls.setas = (esquerda, direita)
+        return cls.setas
+
+    def enfileirar(self, fila: list, alpha=1.0):
+        """Acrescenta à fila de `Surface.blits` o carro, a sirene e a seta (regiões do atlas)"""
+        # Interpola entre o tick anterior e o atual
+        x = self.x_ant + (self.x - self.x_ant) * alpha
+        y = self.y_ant + (self.y - self.y_ant) * alpha
+        fila.append(atlas.item(self.img, (int(x), int(y))))
+        
+        # Sirene se for carro da polícia
         if self.sirene:
-            self.sirene.desenhar(tela)
+            self.sirene.enfileirar(fila, x, y)
         
-        # Efeito visual quando a polícia está se movendo lateralmente
+        # Efeito visual quando a polícia está se movendo lateralmente: seta indicando o movimento
         if self.eh_policia and self.moving_lateral:
-            # Desenha uma seta indicando o movimento
-            seta_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
-            if self.x < self.target_lane_x:
-                # Movendo para direita
-                pygame.draw.polygon(seta_surf, (255, 255, 0, 180), [(0, 10), (20, 10), (15, 5), (15, 15)])
-            else:
-                # Movendo para esquerda
-                pygame.draw.polygon(seta_surf, (255, 255, 0, 180), [(20, 10), (0, 10), (5, 5), (5, 15)])
-            
-            tela.blit(seta_surf, (self.x + self.largura // 2 - 10, self.y - 25))
-        
-        if SHOW_HITBOX_DEBUG:
-            pygame.draw.rect(tela, (255,0,0), self.hit_rect, 2)
-            if hasattr(self, 'mask'):
-                msurf = self.mask.to_surface(setcolor=(255,0,0,80), unsetcolor=(0,0,0,0))
-                msurf.set_colorkey((0,0,0))
-                tela.blit(msurf, (int(self.x), int(self.y)))
-    
-    def _mover_policia_lateral(self, dt):
-        """Movimento lateral especial da polícia para tentar bloquear o jogador"""
-        self.lane_change_timer += dt
-        
-        # Ajusta intervalo baseado na dificuldade e velocidade
-        intervalo_atual = POLICE_LANE_CHANGE_INTERVAL
-        if POLICE_AGGRESSIVE_MODE and hasattr(self, 'dificuldade_jogo'):
-            # Reduz o intervalo conforme a dificuldade aumenta
-            intervalo_atual = max(0.3, POLICE_LANE_CHANGE_INTERVAL - (self.dificuldade_jogo - 1) * 0.15)
-        
-        # Ajusta intervalo baseado na velocidade do jogo
-        # Quanto mais rápido, mais frequentemente deve tentar manobrar
-        velocidade_ratio = self.vel / OBST_VEL_INICIAL
-        intervalo_atual = max(0.2, intervalo_atual / velocidade_ratio)
-        
-        # Decide se deve mudar de faixa
-        if self.lane_change_timer >= intervalo_atual:
-            self.lane_change_timer = 0.0
-            
-            # Comportamento inteligente: tenta bloquear o jogador se estiver próximo
-            # Ativa mais cedo em velocidades altas
-            altura_ativacao = 720 * 0.5  # 50% da tela (era 30%)
-            if velocidade_ratio > 2.0:  # Se velocidade > 2x a inicial
-                altura_ativacao = 720 * 0.7  # Ativa ainda mais cedo (70% da tela)
-            
-            if hasattr(self, 'jogador_x') and self.y > altura_ativacao:
-                # Tenta se posicionar na faixa do jogador
-                faixa_jogador = self._detectar_faixa_jogador()
-                if faixa_jogador != self.current_lane:
-                    nova_faixa = faixa_jogador
-                else:
-                    # Se já está na faixa do jogador, escolhe uma aleatória
-                    nova_faixa = random.randint(0, 2)
-            else:
-                # Movimento aleatório normal
-                nova_faixa = random.randint(0, 2)
-            
-            if nova_faixa != self.current_lane:
-                self.current_lane = nova_faixa
-                self.moving_lateral = True
-                
-                # Calcula a posição alvo na nova faixa
-                target_center = self.lane_centers[self.current_lane]
-                self.target_lane_x = target_center - self.largura // 2
-        
-        # Move lateralmente se estiver mudando de faixa
-        if self.moving_lateral:
-            # Ajusta velocidade lateral baseado na velocidade do jogo
-            velocidade_lateral = POLICE_LATERAL_SPEED
-            if velocidade_ratio > 1.5:  # Se velocidade > 1.5x a inicial
-                velocidade_lateral = POLICE_LATERAL_SPEED * velocidade_ratio
-            
-            dx = velocidade_lateral * dt
-            if abs(self.x - self.target_lane_x) < dx:
-                self.x = self.target_lane_x
-                self.moving_lateral = False
-            else:
-                # Move em direção ao alvo
-                if self.x < self.target_lane_x:
-                    self.x += dx
-                else:
-                    self.x -= dx
-    
-    def _detectar_faixa_atual(self):
-        """Detecta em qual faixa o carro está baseado na posição X"""
-        carro_center = self.x + self.largura // 2
-        menor_distancia = float('inf')
-        faixa_mais_proxima = 0
-        
-        for i, center in enumerate(self.lane_centers):
-            distancia = abs(carro_center - center)
-            if distancia < menor_distancia:
-                menor_distancia = distancia
-                faixa_mais_proxima = i
-        
-        return faixa_mais_proxima
-    
-    def _detectar_faixa_jogador(self):
-        """Detecta em qual faixa o jogador está baseado na posição X"""
-        if not hasattr(self, 'jogador_x'):
-            return 1  # faixa central como padrão
-        
-        menor_distancia = float('inf')
-        faixa_mais_proxima = 1
-        
-        for i, center in enumerate(self.lane_centers):
-            distancia = abs(self.jogador_x - center)
-            if distancia < menor_distancia:
-                menor_distancia = distancia
-                faixa_mais_proxima = i
-        
-        return faixa_mais_proxima
-    
-    def atualizar_posicao_jogador(self, jogador_x):
-        """Atualiza a posição do jogador para comportamento inteligente"""
-        self.jogador_x = jogador_x
-
-    def fora_da_tela(self):
-        return self.y > 720  # TELA_ALTURA
+            esquerda, direita = Obstaculo.obter_setas()
+            seta = direita if self.x < self.target_lane_x else esquerda
+            fila.append(atlas.item(seta, (x + self.largura // 2 - 10, y - 25)))
 
+    def desenhar_debug(self, tela, alpha=1.0):
+        """Hitbox e máscara de colisão (SHOW_HITBOX_DEBUG)"""
+        x = self.x_ant + (self.x - self.x_ant) * alpha
+        y = self.y_ant + (self.y - self.y_ant) * alpha
+        pygame.draw.rect(tela, (255,0,0), self.hit_rect, 2)
+        if hasattr(self, 'mask'):
+            msurf = self.mask.to_surface(setcolor=(255,0,0,80), unsetcolor=(0,0,0,0))
+            msurf.set_colorkey((0,0,0))
+            tela.blit(msurf, (int(x), int(y)))
+    
     @property
     def rect(self):
         return pygame.Rect(int(self.x), int(self.y), self.largura, self.altura)
 
     @property
     def hit_rect(self):
-        return create_hit_rect(self.rect) 
\ No newline at end of file
+        return create_hit_rect_from_rect(self.rect) 
\ No newline at end of file
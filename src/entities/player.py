@@ -4,8 +4,9 @@ Classe para o carro do jogador
 """
 
 import pygame
-from ..config import CARRO_ALTURA, LANE_MARGIN, ALPHA_THRESHOLD, SHOW_HITBOX_DEBUG
-from ..managers.collision import create_hit_rect
+from ..config import CARRO_ALTURA, LANE_MARGIN, ALPHA_THRESHOLD
+from ..managers.collision import create_hit_rect_from_rect, calcular_bbox
+from ..utils.surface import converter_para_display
 
 
 class CarroJogador:
@@ -33,25 +34,35 @@ class CarroJogador:
         self.x = inner_x + inner_w // 2 - self.largura // 2
         self.y = 720 - self.altura - 20  # 720 é TELA_ALTURA
         self.vel = 380  # CARRO_VEL
+        self.x_ant = self.x  # posição no tick anterior (interpolação)
+        self.y_ant = self.y  # o jogador não se move na vertical (colisão contínua)
 
-        self.img = pygame.transform.smoothscale(img, (self.largura, self.altura)).convert_alpha()
+        self.img = converter_para_display(pygame.transform.smoothscale(img, (self.largura, self.altura)))
         self.mask = pygame.mask.from_surface(self.img, ALPHA_THRESHOLD)
+        self.bbox = calcular_bbox(self.mask)
 
-    def mover(self, teclas, dt):
-        if teclas[pygame.K_LEFT] or teclas[pygame.K_a]:
+    def mover_entrada(self, esquerda: bool, direita: bool, dt):
+        """Move a partir de uma entrada abstrata (teclado, replay, simulação)"""
+        self.x_ant = self.x
+        if esquerda:
             self.x -= self.vel * dt
-        if teclas[pygame.K_RIGHT] or teclas[pygame.K_d]:
+        if direita:
             self.x += self.vel * dt
         self.x = max(self.inner_x, min(self.inner_x + self.inner_w - self.largura, self.x))
 
-    def desenhar(self, tela):
-        tela.blit(self.img, (int(self.x), int(self.y)))
-        if SHOW_HITBOX_DEBUG:
-            pygame.draw.rect(tela, (0,255,0), self.hit_rect, 2)
-            if hasattr(self, 'mask'):
-                msurf = self.mask.to_surface(setcolor=(0,255,0,80), unsetcolor=(0,0,0,0))
-                msurf.set_colorkey((0,0,0))
-                tela.blit(msurf, (int(self.x), int(self.y)))
+    def enfileirar(self, fila: list, alpha=1.0):
+        """Acrescenta o carro à fila de `Surface.blits`"""
+        x = self.x_ant + (self.x - self.x_ant) * alpha
+        fila.append((self.img, (int(x), int(self.y))))
+
+    def desenhar_debug(self, tela, alpha=1.0):
+        """Hitbox e máscara de colisão (SHOW_HITBOX_DEBUG)"""
+        x = self.x_ant + (self.x - self.x_ant) * alpha
+        pygame.draw.rect(tela, (0,255,0), self.hit_rect, 2)
+        if hasattr(self, 'mask'):
+            msurf = self.mask.to_surface(setcolor=(0,255,0,80), unsetcolor=(0,0,0,0))
+            msurf.set_colorkey((0,0,0))
+            tela.blit(msurf, (int(x), int(self.y)))
 
     @property
     def rect(self):
@@ -59,4 +70,4 @@ class CarroJogador:
 
     @property
     def hit_rect(self):
-        return create_hit_rect(self.rect) 
\ No newline at end of file
+        return create_hit_rect_from_rect(self.rect) 
\ No newline at end of file
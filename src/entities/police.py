@@ -3,27 +3,76 @@
 Classe para animação da sirene da polícia
 """
 
-import os
 import pygame
-from ..config import SIRENE_FPS, SIRENE_COLOR, POLICE_SPECIAL_EFFECTS
+from ..config import SIRENE_FPS, SIRENE_COLOR, SIRENE_BLEND_ADITIVO, POLICE_SPECIAL_EFFECTS
+from ..managers.assets import assets
+from ..managers.atlas import atlas
 
 
 class SireneAnimacao:
-    def __init__(self, x: int, y: int, largura: int, altura: int):
-        self.x = x
-        self.y = y
+    nomes_frames = [f"Police_animation/{i}.png" for i in range(1, 4)]  # 1.png, 2.png, 3.png
+    overlays_por_tamanho = {}  # {(largura, altura, cor, aditivo): (flash, luz, flags)}
+
+    @classmethod
+    def obter_frames(cls, largura: int, altura: int):
+        """Retorna os frames escalados para o tamanho do carro (compartilhados, somente leitura)"""
+        # Escala para o tamanho do carro da polícia (variantes no AssetManager)
+        return assets.variante(
+            ('sirene', 'Police_animation', largura, altura),
+            lambda: [pygame.transform.smoothscale(assets.imagem(nome), (largura, altura))
+                     for nome in cls.nomes_frames if assets.existe(nome)])
+
+    @classmethod
+    def obter_overlays(cls, largura: int, altura: int, cor=SIRENE_COLOR, aditivo=SIRENE_BLEND_ADITIVO):
+        """Retorna (flash, luz, special_flags) pré-renderizados para o tamanho e cor dados"""
+        chave = (largura, altura, cor, aditivo)
+        overlays = cls.overlays_por_tamanho.get(chave)
+        if overlays is None:
+            overlays = cls._criar_overlays(largura, altura, cor, aditivo)
+            cls.overlays_por_tamanho[chave] = overlays
+        return overlays
+
+    @staticmethod
+    def _criar_overlays(largura, altura, cor, aditivo):
+        """Renderiza o flash e o gradiente radial de luz uma única vez"""
+        raio = min(largura, altura) // 2
+        lado = raio * 2 + 1
+
+        if aditivo:
+            # Cores pré-multiplicadas pelo alpha, somadas ao fundo com BLEND_RGB_ADD
+            def cor_efetiva(alpha):
+                return tuple(c * alpha // 255 for c in cor)
+            flash = pygame.Surface((largura, altura))
+            luz = pygame.Surface((lado, lado))
+            luz.fill((0, 0, 0))
+            flags = pygame.BLEND_RGB_ADD
+        else:
+            def cor_efetiva(alpha):
+                return (*cor, alpha)
+            flash = pygame.Surface((largura, altura), pygame.SRCALPHA)
+            luz = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            flags = 0
+
+        flash.fill(cor_efetiva(30))
+
+        # Gradiente radial para simular luz
+        for r in range(raio, 0, -2):
+            alpha = max(0, 40 - (raio - r) * 2)
+            pygame.draw.circle(luz, cor_efetiva(alpha), (raio, raio), r)
+
+        return flash, luz, flags
+
+    def __init__(self, largura: int, altura: int):
+        self.reset(largura, altura)
+
+    def reset(self, largura: int, altura: int):
+        """(Re)inicializa tamanho e timers da animação (a posição vem do carro em `enfileirar`)"""
         self.largura = largura
         self.altura = altura
+        self.cor = SIRENE_COLOR
         
-        # Carrega os frames da animação
-        self.frames = []
-        for i in range(1, 4):  # 1.png, 2.png, 3.png
-            caminho = os.path.join("assets", "images", "Police_animation", f"{i}.png")
-            if os.path.exists(caminho):
-                img = pygame.image.load(caminho).convert_alpha()
-                # Escala para o tamanho do carro da polícia
-                img_scaled = pygame.transform.smoothscale(img, (largura, altura))
-                self.frames.append(img_scaled)
+        # Frames da animação compartilhados entre todas as viaturas do mesmo tamanho
+        self.frames = SireneAnimacao.obter_frames(largura, altura)
         
         self.frame_atual = 0
         self.timer = 0.0
@@ -45,29 +94,19 @@ class SireneAnimacao:
         if self.brilho_timer >= self.brilho_delay:
             self.brilho_timer = 0.0
     
-    def desenhar(self, tela):
+    def enfileirar(self, fila: list, x, y):
+        """Acrescenta à fila de `Surface.blits` o frame atual, o flash e a luz em (x, y)"""
         if self.frames:
-            # Desenha o frame atual
-            tela.blit(self.frames[self.frame_atual], (self.x, self.y))
+            # Frame atual (região do atlas, se empacotado)
+            fila.append(atlas.item(self.frames[self.frame_atual], (x, y)))
+            
+            flash, luz, flags = SireneAnimacao.obter_overlays(self.largura, self.altura, self.cor)
             
             # Efeito de brilho da sirene (pisca)
             if self.brilho_timer < self.brilho_delay * 0.5:
-                # Cria uma superfície para o efeito de brilho
-                brilho_surf = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
-                pygame.draw.rect(brilho_surf, (*SIRENE_COLOR, 30), (0, 0, self.largura, self.altura))
-                tela.blit(brilho_surf, (self.x, self.y))
+                fila.append((flash, (x, y), None, flags))
                 
-            # Efeito de luz da sirene (raio de luz)
+            # Efeito de luz da sirene (raio de luz), recortado ao redor do gradiente
             if POLICE_SPECIAL_EFFECTS:
-                # Cria um efeito de luz circular
-                luz_surf = pygame.Surface((self.largura * 2, self.altura * 2), pygame.SRCALPHA)
-                centro_x, centro_y = self.largura, self.altura
-                raio = min(self.largura, self.altura) // 2
-                
-                # Gradiente radial para simular luz
-                for r in range(raio, 0, -2):
-                    alpha = max(0, 40 - (raio - r) * 2)
-                    cor = (*SIRENE_COLOR, alpha)
-                    pygame.draw.circle(luz_surf, cor, (centro_x, centro_y), r)
-                
-                tela.blit(luz_surf, (self.x - self.largura//2, self.y - self.altura//2)) 
\ No newline at end of file
+                raio = luz.get_width() // 2
+                fila.append((luz, (x + self.largura//2 - raio, y + self.altura//2 - raio), None, flags))
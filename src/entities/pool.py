@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Pool de entidades reutilizáveis (obstáculos, power-ups)
+"""
+
+
+class EntityPool:
+    """Reaproveita instâncias liberadas em vez de criar novas.
+
+    A classe da entidade precisa ter `reset(*args)` aceitando os mesmos
+    argumentos do construtor; o reset reinicializa o estado sem realocar
+    superfícies ou máscaras.
+    """
+
+    def __init__(self, classe):
+        self.classe = classe
+        self.livres = []
+        self.criados = 0
+        self.reusos = 0
+        self.ativos = 0
+        self.pico = 0  # maior número de instâncias ativas ao mesmo tempo
+
+    def adquirir(self, *args):
+        """Retorna uma instância inicializada com `args` (reusada quando possível)"""
+        if self.livres:
+            obj = self.livres.pop()
+            obj.reset(*args)
+            self.reusos += 1
+        else:
+            obj = self.classe(*args)
+            self.criados += 1
+        self.ativos += 1
+        if self.ativos > self.pico:
+            self.pico = self.ativos
+        return obj
+
+    def liberar(self, obj):
+        """Devolve uma instância que saiu de jogo"""
+        self.ativos -= 1
+        self.livres.append(obj)
+
+    def liberar_varios(self, objs):
+        """Devolve várias instâncias de uma vez"""
+        for obj in objs:
+            self.liberar(obj)
+
+    def estatisticas(self) -> dict:
+        """Contadores para dimensionar o pool"""
+        total = self.criados + self.reusos
+        return {
+            'criados': self.criados,
+            'reusos': self.reusos,
+            'ativos': self.ativos,
+            'livres': len(self.livres),
+            'pico': self.pico,
+            'taxa_reuso': self.reusos / total if total else 0.0,
+        }
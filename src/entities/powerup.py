@@ -4,20 +4,25 @@ Classe para power-ups do jogo
 """
 
 import os
-import random
+import heapq
 import pygame
 import math
+from collections import namedtuple
 from ..config import (
-    POWERUP_ALTURA, LANE_MARGIN, ALPHA_THRESHOLD, SHOW_HITBOX_DEBUG,
-    POWERUP_VELOCIDADE, POWERUP_TIPOS, TELA_ALTURA
+    POWERUP_ALTURA, LANE_MARGIN, ALPHA_THRESHOLD,
+    POWERUP_VELOCIDADE, POWERUP_TIPOS, POWERUP_EFEITOS, TELA_ALTURA,
+    POWERUP_FRAMES_ROTACAO, POWERUP_FRAMES_PULSO
 )
-from ..managers.collision import create_hit_rect
+from ..managers.collision import create_hit_rect, calcular_bbox
+from ..managers.atlas import atlas
 
 
 class PowerUp:
     """Classe para representar um power-up no jogo"""
+    superficies = {}  # {tipo: (superficie, mask, bbox)}
+    frames = {}  # {tipo: [[frame por passo de pulsação] por ângulo]}
     
-    def __init__(self, tipo: str, lane_centers: list[int], lane_w: int):
+    def __init__(self, tipo: str, lane_centers: list[int], lane_w: int, faixa: int):
         """
         Inicializa um power-up
         
@@ -25,14 +30,20 @@ class PowerUp:
             tipo: Tipo do power-up ('shield', 'speed_boost', etc.)
             lane_centers: Lista com as posições centrais das faixas
             lane_w: Largura de cada faixa
+            faixa: Faixa sorteada pelo SpawnScheduler
         """
+        self.reset(tipo, lane_centers, lane_w, faixa)
+    
+    def reset(self, tipo: str, lane_centers: list[int], lane_w: int, faixa: int):
+        """(Re)inicializa o power-up; usado pelo construtor e pelo EntityPool"""
         self.tipo = tipo
         self.config = POWERUP_TIPOS[tipo]
         
         # Posicionamento
-        center = random.choice(lane_centers)
+        center = lane_centers[faixa]
         self.x = center - POWERUP_ALTURA // 2
         self.y = -POWERUP_ALTURA
+        self.x_ant, self.y_ant = self.x, self.y  # posição no tick anterior (interpolação)
         
         # Dimensões
         self.largura = POWERUP_ALTURA
@@ -41,93 +52,132 @@ class PowerUp:
         # Velocidade
         self.vel = POWERUP_VELOCIDADE
         
-        # Cria superfície do power-up
-        self._criar_superficie()
+        # Superfície e máscara compartilhadas por tipo
+        self.superficie, self.mask, self.bbox = PowerUp.obter_superficie(tipo)
         
         # Efeitos visuais
         self.animacao_timer = 0.0
         self.rotacao = 0.0
         self.escala = 1.0
         self.pulsando = True
+    
+    @classmethod
+    def obter_superficie(cls, tipo: str):
+        """Retorna (superficie, mask, bbox) do tipo, criando-os no primeiro uso"""
+        if tipo not in cls.superficies:
+            superficie = cls._criar_superficie(tipo)
+            # Cria máscara para colisão
+            mask = pygame.mask.from_surface(superficie, ALPHA_THRESHOLD)
+            cls.superficies[tipo] = (superficie, mask, calcular_bbox(mask))
+        return cls.superficies[tipo]
+    
+    @classmethod
+    def obter_frames(cls, tipo: str):
+        """Retorna os frames pré-renderizados [rotação][pulso] do tipo"""
+        if tipo not in cls.frames:
+            cls.frames[tipo] = cls._gerar_frames(cls.obter_superficie(tipo)[0])
+        return cls.frames[tipo]
+    
+    @classmethod
+    def carregar_frames(cls):
+        """Pré-renderiza as animações de todos os tipos (chamar no carregamento)"""
+        for tipo in POWERUP_TIPOS:
+            cls.obter_frames(tipo)
+    
+    @staticmethod
+    def _gerar_frames(superficie):
+        """Gera POWERUP_FRAMES_ROTACAO x POWERUP_FRAMES_PULSO frames de rotação/pulsação"""
+        frames = []
+        for i in range(POWERUP_FRAMES_ROTACAO):
+            superficie_rot = pygame.transform.rotate(superficie, i * 360 / POWERUP_FRAMES_ROTACAO)
+            passos = []
+            for j in range(POWERUP_FRAMES_PULSO):
+                # Mesma curva de pulsação usada em mover(): 1.0 + 0.1 * sin(fase)
+                escala = 1.0 + 0.1 * math.sin(j * 2 * math.pi / POWERUP_FRAMES_PULSO)
+                tamanho = int(POWERUP_ALTURA * escala)
+                passos.append(pygame.transform.scale(superficie_rot, (tamanho, tamanho)))
+            frames.append(passos)
+        return frames
         
-    def _criar_superficie(self):
+    @staticmethod
+    def _criar_superficie(tipo: str):
         """Cria a superfície visual do power-up"""
         # Cria uma superfície quadrada
-        self.superficie = pygame.Surface((POWERUP_ALTURA, POWERUP_ALTURA), pygame.SRCALPHA)
+        superficie = pygame.Surface((POWERUP_ALTURA, POWERUP_ALTURA), pygame.SRCALPHA)
         
         # Cor base do power-up
-        cor = self.config['cor']
+        cor = POWERUP_TIPOS[tipo]['cor']
         
         # Desenha um círculo com gradiente
         raio = POWERUP_ALTURA // 2 - 5
         
         # Círculo externo (borda)
-        pygame.draw.circle(self.superficie, (255, 255, 255), (POWERUP_ALTURA//2, POWERUP_ALTURA//2), raio + 2)
+        pygame.draw.circle(superficie, (255, 255, 255), (POWERUP_ALTURA//2, POWERUP_ALTURA//2), raio + 2)
         
         # Círculo interno (cor principal)
-        pygame.draw.circle(self.superficie, cor, (POWERUP_ALTURA//2, POWERUP_ALTURA//2), raio)
+        pygame.draw.circle(superficie, cor, (POWERUP_ALTURA//2, POWERUP_ALTURA//2), raio)
         
         # Círculo interno mais claro (brilho)
-        pygame.draw.circle(self.superficie, tuple(min(255, c + 50) for c in cor), 
+        pygame.draw.circle(superficie, tuple(min(255, c + 50) for c in cor), 
                           (POWERUP_ALTURA//2, POWERUP_ALTURA//2), raio - 5)
         
         # Adiciona símbolo baseado no tipo
-        self._adicionar_simbolo()
+        PowerUp._adicionar_simbolo(superficie, tipo)
+        return superficie
         
-        # Cria máscara para colisão
-        self.mask = pygame.mask.from_surface(self.superficie, ALPHA_THRESHOLD)
-        
-    def _adicionar_simbolo(self):
+    @staticmethod
+    def _adicionar_simbolo(superficie, tipo: str):
         """Adiciona símbolo específico para cada tipo de power-up"""
         cor_simbolo = (255, 255, 255)  # branco
         centro = POWERUP_ALTURA // 2
         tamanho_simbolo = POWERUP_ALTURA // 4
         
-        if self.tipo == 'shield':
+        if tipo == 'shield':
             # Escudo - triângulo
             pontos = [
                 (centro, centro - tamanho_simbolo),
                 (centro - tamanho_simbolo, centro + tamanho_simbolo),
                 (centro + tamanho_simbolo, centro + tamanho_simbolo)
             ]
-            pygame.draw.polygon(self.superficie, cor_simbolo, pontos)
+            pygame.draw.polygon(superficie, cor_simbolo, pontos)
             
-        elif self.tipo == 'speed_boost':
+        elif tipo == 'speed_boost':
             # Turbo - seta para cima
             pontos = [
                 (centro, centro - tamanho_simbolo),
                 (centro - tamanho_simbolo//2, centro),
                 (centro + tamanho_simbolo//2, centro)
             ]
-            pygame.draw.polygon(self.superficie, cor_simbolo, pontos)
+            pygame.draw.polygon(superficie, cor_simbolo, pontos)
             
-        elif self.tipo == 'slow_motion':
+        elif tipo == 'slow_motion':
             # Câmera lenta - relógio
-            pygame.draw.circle(self.superficie, cor_simbolo, (centro, centro), tamanho_simbolo//2, 2)
+            pygame.draw.circle(superficie, cor_simbolo, (centro, centro), tamanho_simbolo//2, 2)
             # Ponteiros do relógio
-            pygame.draw.line(self.superficie, cor_simbolo, 
+            pygame.draw.line(superficie, cor_simbolo, 
                            (centro, centro), (centro, centro - tamanho_simbolo//3), 2)
-            pygame.draw.line(self.superficie, cor_simbolo, 
+            pygame.draw.line(superficie, cor_simbolo, 
                            (centro, centro), (centro + tamanho_simbolo//4, centro), 2)
             
-        elif self.tipo == 'magnet':
+        elif tipo == 'magnet':
             # Ímã - formato de U
-            pygame.draw.rect(self.superficie, cor_simbolo, 
+            pygame.draw.rect(superficie, cor_simbolo, 
                            (centro - tamanho_simbolo//2, centro - tamanho_simbolo//2, 
                             tamanho_simbolo, tamanho_simbolo//2))
-            pygame.draw.rect(self.superficie, cor_simbolo, 
+            pygame.draw.rect(superficie, cor_simbolo, 
                            (centro - tamanho_simbolo//3, centro, 
                             tamanho_simbolo*2//3, tamanho_simbolo//2))
             
-        elif self.tipo == 'double_points':
+        elif tipo == 'double_points':
             # Pontos duplos - dois círculos
-            pygame.draw.circle(self.superficie, cor_simbolo, 
+            pygame.draw.circle(superficie, cor_simbolo, 
                              (centro - tamanho_simbolo//3, centro), tamanho_simbolo//3)
-            pygame.draw.circle(self.superficie, cor_simbolo, 
+            pygame.draw.circle(superficie, cor_simbolo, 
                              (centro + tamanho_simbolo//3, centro), tamanho_simbolo//3)
     
     def mover(self, dt):
         """Move o power-up para baixo"""
+        self.x_ant, self.y_ant = self.x, self.y
         self.y += self.vel * dt
         
         # Atualiza animação
@@ -138,28 +188,33 @@ class PowerUp:
         if self.pulsando:
             self.escala = 1.0 + 0.1 * math.sin(self.animacao_timer * 4)
     
-    def desenhar(self, tela):
-        """Desenha o power-up na tela"""
-        if self.y + self.altura < 0 or self.y > TELA_ALTURA:
+    def enfileirar(self, fila: list, alpha=1.0):
+        """Acrescenta à fila de `Surface.blits` o frame atual, interpolando entre ticks"""
+        x = self.x_ant + (self.x - self.x_ant) * alpha
+        y = self.y_ant + (self.y - self.y_ant) * alpha
+        if y + self.altura < 0 or y > TELA_ALTURA:
             return
             
-        # Cria superfície rotacionada e escalada
-        superficie_rot = pygame.transform.rotate(self.superficie, self.rotacao)
-        superficie_final = pygame.transform.scale(superficie_rot, 
-                                                (int(self.largura * self.escala), 
-                                                 int(self.altura * self.escala)))
+        # Frame pré-renderizado mais próximo da rotação/pulsação atuais
+        frames = PowerUp.obter_frames(self.tipo)
+        i = int(self.rotacao * POWERUP_FRAMES_ROTACAO / 360 + 0.5) % POWERUP_FRAMES_ROTACAO
+        j = 0
+        if self.pulsando:
+            fase = self.animacao_timer * 4 / (2 * math.pi)
+            j = int(fase * POWERUP_FRAMES_PULSO + 0.5) % POWERUP_FRAMES_PULSO
+        superficie_final = frames[i][j]
         
         # Centraliza a superfície rotacionada
         rect = superficie_final.get_rect()
-        rect.centerx = self.x + self.largura // 2
-        rect.centery = self.y + self.altura // 2
+        rect.centerx = x + self.largura // 2
+        rect.centery = y + self.altura // 2
         
-        tela.blit(superficie_final, rect)
-        
-        # Debug: mostra hitbox
-        if SHOW_HITBOX_DEBUG:
-            hit_rect = create_hit_rect(self.x, self.y, self.largura, self.altura)
-            pygame.draw.rect(tela, (0, 255, 255), hit_rect, 2)  # ciano para power-ups
+        fila.append(atlas.item(superficie_final, rect))
+    
+    def desenhar_debug(self, tela, alpha=1.0):
+        """Hitbox do power-up (SHOW_HITBOX_DEBUG)"""
+        hit_rect = create_hit_rect(self.x, self.y, self.largura, self.altura)
+        pygame.draw.rect(tela, (0, 255, 255), hit_rect, 2)  # ciano para power-ups
     
     def esta_na_tela(self):
         """Verifica se o power-up ainda está visível na tela"""
@@ -170,94 +225,107 @@ class PowerUp:
         return create_hit_rect(self.x, self.y, self.largura, self.altura)
 
 
+# Efeitos combinados dos power-ups ativos (imutável: pode ser lido sem cópia)
+EfeitosPowerUp = namedtuple('EfeitosPowerUp', [
+    'velocidade_jogador_mult',
+    'velocidade_obstaculos_mult',
+    'pontos_mult',
+    'imunidade_colisao',
+    'raio_ima',
+])
+EFEITOS_PADRAO = EfeitosPowerUp(1.0, 1.0, 1.0, False, 0)
+
+
 class PowerUpManager:
-    """Gerenciador de power-ups ativos no jogador"""
+    """Gerenciador de power-ups ativos no jogador.
+
+    Guarda o instante de expiração de cada tipo ativo num relógio interno e
+    um heap (instante, tipo) para achar o próximo a expirar. Os efeitos
+    combinados só são recalculados quando um power-up entra ou expira.
+    """
     
-    def __init__(self):
-        self.powerups_ativos = {}  # {tipo: {'tempo_restante': float, 'config': dict}}
-        self.efeitos_atuais = {
-            'velocidade_jogador_mult': 1.0,
-            'velocidade_obstaculos_mult': 1.0,
-            'pontos_mult': 1.0,
-            'imunidade_colisao': False,
-            'raio_imã': 0
-        }
+    def __init__(self, avisos: bool = True):
+        self.avisos = avisos  # imprime no console quando um power-up entra ou expira
+        self.relogio = 0.0
+        self.expiracoes = {}  # {tipo: instante de expiração}
+        self.heap_expiracoes = []  # [(instante, tipo)]; entradas antigas de um tipo renovado são ignoradas
+        self.efeitos = EFEITOS_PADRAO
     
     def adicionar_powerup(self, tipo: str):
-        """Adiciona um power-up ativo"""
-        from ..config import POWERUP_TIPOS, POWERUP_EFEITOS
-        
+        """Adiciona um power-up ativo (ou renova a duração se já estiver ativo)"""
         duracao = POWERUP_TIPOS[tipo]['duracao']
-        self.powerups_ativos[tipo] = {
-            'tempo_restante': duracao,
-            'config': POWERUP_EFEITOS[tipo].copy()
-        }
+        instante = self.relogio + duracao
+        novo = tipo not in self.expiracoes
+        self.expiracoes[tipo] = instante
+        heapq.heappush(self.heap_expiracoes, (instante, tipo))
+        if novo:
+            self._calcular_efeitos_combinados()
         
-        print(f"🎁 Power-up ativado: {POWERUP_TIPOS[tipo]['nome']} ({duracao}s)")
+        if self.avisos:
+            print(f"🎁 Power-up ativado: {POWERUP_TIPOS[tipo]['nome']} ({duracao}s)")
     
     def atualizar(self, dt):
-        """Atualiza os power-ups ativos e calcula efeitos"""
-        # Remove power-ups expirados
-        tipos_para_remover = []
-        for tipo, dados in self.powerups_ativos.items():
-            dados['tempo_restante'] -= dt
-            if dados['tempo_restante'] <= 0:
-                tipos_para_remover.append(tipo)
+        """Avança o relógio e remove os power-ups expirados"""
+        self.relogio += dt
+        heap = self.heap_expiracoes
+        if not heap or heap[0][0] > self.relogio:
+            return
         
-        for tipo in tipos_para_remover:
-            del self.powerups_ativos[tipo]
-            print(f"⏰ Power-up expirado: {POWERUP_TIPOS[tipo]['nome']}")
+        mudou = False
+        while heap and heap[0][0] <= self.relogio:
+            instante, tipo = heapq.heappop(heap)
+            if self.expiracoes.get(tipo) != instante:
+                continue  # renovado depois desta entrada
+            del self.expiracoes[tipo]
+            mudou = True
+            if self.avisos:
+                print(f"⏰ Power-up expirado: {POWERUP_TIPOS[tipo]['nome']}")
         
-        # Calcula efeitos combinados
-        self._calcular_efeitos_combinados()
+        if mudou:
+            self._calcular_efeitos_combinados()
     
     def _calcular_efeitos_combinados(self):
         """Calcula os efeitos combinados de todos os power-ups ativos"""
-        from ..config import POWERUP_TIPOS
+        velocidade_jogador_mult = 1.0
+        velocidade_obstaculos_mult = 1.0
+        pontos_mult = 1.0
+        imunidade_colisao = False
+        raio_ima = 0
         
-        # Reset para valores padrão
-        self.efeitos_atuais = {
-            'velocidade_jogador_mult': 1.0,
-            'velocidade_obstaculos_mult': 1.0,
-            'pontos_mult': 1.0,
-            'imunidade_colisao': False,
-            'raio_imã': 0
-        }
-        
-        # Aplica efeitos de cada power-up ativo
-        for tipo, dados in self.powerups_ativos.items():
-            config = dados['config']
+        for tipo in self.expiracoes:
+            config = POWERUP_EFEITOS[tipo]
             
             # Multiplicadores são multiplicados entre si
-            self.efeitos_atuais['velocidade_jogador_mult'] *= config.get('velocidade_jogador_mult', 1.0)
-            self.efeitos_atuais['velocidade_obstaculos_mult'] *= config.get('velocidade_obstaculos_mult', 1.0)
-            self.efeitos_atuais['pontos_mult'] *= config.get('pontos_mult', 1.0)
+            velocidade_jogador_mult *= config.get('velocidade_jogador_mult', 1.0)
+            velocidade_obstaculos_mult *= config.get('velocidade_obstaculos_mult', 1.0)
+            pontos_mult *= config.get('pontos_mult', 1.0)
             
             # Imunidade é True se qualquer power-up der imunidade
-            if config.get('imunidade_colisao', False):
-                self.efeitos_atuais['imunidade_colisao'] = True
+            imunidade_colisao = imunidade_colisao or config.get('imunidade_colisao', False)
             
             # Raio do ímã é o maior entre todos
-            self.efeitos_atuais['raio_imã'] = max(
-                self.efeitos_atuais['raio_imã'], 
-                config.get('raio_imã', 0)
-            )
+            raio_ima = max(raio_ima, config.get('raio_imã', 0))
+        
+        self.efeitos = EfeitosPowerUp(velocidade_jogador_mult, velocidade_obstaculos_mult,
+                                      pontos_mult, imunidade_colisao, raio_ima)
     
     def tem_powerup_ativo(self, tipo: str):
         """Verifica se um tipo específico de power-up está ativo"""
-        return tipo in self.powerups_ativos
+        return tipo in self.expiracoes
+    
+    def tipos_ativos(self):
+        """Tipos ativos, na ordem em que foram ativados"""
+        return self.expiracoes.keys()
     
     def get_tempo_restante(self, tipo: str):
         """Retorna o tempo restante de um power-up específico"""
-        if tipo in self.powerups_ativos:
-            return self.powerups_ativos[tipo]['tempo_restante']
+        if tipo in self.expiracoes:
+            return self.expiracoes[tipo] - self.relogio
         return 0.0
     
-    def get_efeitos_atuais(self):
-        """Retorna os efeitos atuais combinados"""
-        return self.efeitos_atuais.copy()
-    
     def limpar_todos(self):
         """Remove todos os power-ups ativos"""
-        self.powerups_ativos.clear()
-        self._calcular_efeitos_combinados() 
\ No newline at end of file
+        self.relogio = 0.0
+        self.expiracoes.clear()
+        self.heap_expiracoes.clear()
+        self.efeitos = EFEITOS_PADRAO
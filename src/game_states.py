@@ -7,20 +7,26 @@ import pygame
 import os
 from .config import MENU, CINEMATICA, JOGANDO, GAME_OVER, POWERUP_HELP, TELA_LARGURA, TELA_ALTURA
 from .ui.hud import desenhar_tela_abertura, desenhar_tela_gameover, desenhar_hud_jogo, desenhar_tela_cinematic, desenhar_tela_powerup_help
-from .managers.collision import check_collision
 from .managers.record import RecordManager
 from .managers.cinematic import CinematicManager
+from .managers.assets import assets
+
+
+def carregar_tela_cheia(nome: str):
+    """Imagem escalada para a tela inteira (só essa versão fica em memória)"""
+    return assets.escalada(nome, (TELA_LARGURA, TELA_ALTURA), alpha=False, suave=False, manter_base=False)
 
 
 class GameStateManager:
-    def __init__(self, tela, playlist_manager):
+    def __init__(self, tela, playlist_manager, preloader=None):
         self.tela = tela
         self.playlist_manager = playlist_manager
+        self.preloader = preloader  # AssetPreloader aquecendo o jogo durante o menu
         self.estado = MENU
         
-        # Carrega imagens das telas
+        # Carrega imagens das telas (a de game over só quando for usada)
         self.img_abertura = self._carregar_imagem_abertura()
-        self.img_gameover = self._carregar_imagem_gameover()
+        self._img_gameover = None
         
         # Sistema de mute melhorado
         self.mute_ativo = False
@@ -36,14 +42,18 @@ class GameStateManager:
         self.cinematic_duration = 10.0  # Duração da cinemática em segundos (fallback)
     
     def _carregar_imagem_abertura(self):
-        """Carrega a imagem de abertura"""
-        img = pygame.image.load(os.path.join("assets", "images", "abertura.png")).convert()
-        return pygame.transform.scale(img, (TELA_LARGURA, TELA_ALTURA))
+        """Carrega a imagem de abertura (só a versão em tela cheia fica em memória)"""
+        return carregar_tela_cheia("abertura.png")
+    
+    @property
+    def img_gameover(self):
+        if self._img_gameover is None:
+            self._img_gameover = self._carregar_imagem_gameover()
+        return self._img_gameover
     
     def _carregar_imagem_gameover(self):
-        """Carrega a imagem de game over"""
-        img = pygame.image.load(os.path.join("assets", "images", "gameover.png")).convert()
-        return pygame.transform.scale(img, (TELA_LARGURA, TELA_ALTURA))
+        """Carrega a imagem de game over (só a versão em tela cheia fica em memória)"""
+        return carregar_tela_cheia("gameover.png")
     
     def processar_eventos(self, eventos, carro, obstaculos, trilha_abertura):
         """Processa eventos baseado no estado atual"""
@@ -110,6 +120,10 @@ class GameStateManager:
     
     def iniciar_jogo(self):
         """Inicia o jogo"""
+        if self.preloader is not None and not self.preloader.pronto:
+            # Só bloqueia se o pré-carregamento ainda não terminou
+            print(f"⏳ Aguardando assets ({self.preloader.progresso():.0%})...")
+            self.preloader.aguardar()
         self.estado = JOGANDO
         # Reseta flag para permitir que a música de abertura seja parada
         if hasattr(self, '_musica_abertura_parada'):
@@ -215,14 +229,6 @@ class GameStateManager:
             self.mute_ativo = False
             print(f"🔊 Música desmutada (volume: {self.volume_anterior:.1f})")
     
-    def verificar_colisao(self, carro, obstaculos, pontuacao_atual):
-        """Verifica colisão entre carro e obstáculos"""
-        for obst in obstaculos:
-            if check_collision(carro, obst):
-                self.game_over(pontuacao_atual)
-                return True
-        return False
-    
     def game_over(self, pontuacao_final):
         """Define estado de game over"""
         # Para playlist quando perde
@@ -240,20 +246,24 @@ class GameStateManager:
             print(f"📊 Pontuação: {pontuacao_final} | Record: {self.record_manager.obter_record()}")
     
     def desenhar(self, pontuacao=0, obstaculos=None, powerup_manager=None):
-        """Desenha o estado atual"""
+        """Desenha o estado atual; no jogo retorna as regiões do HUD desenhadas"""
         if self.estado == MENU:
-            desenhar_tela_abertura(self.tela, self.img_abertura)
+            progresso = None
+            if self.preloader is not None and not self.preloader.pronto:
+                progresso = self.preloader.progresso()
+            desenhar_tela_abertura(self.tela, self.img_abertura, progresso)
         elif self.estado == CINEMATICA:
             desenhar_tela_cinematic(self.tela, self.cinematic_manager)
         elif self.estado == JOGANDO:
             if obstaculos:
-                desenhar_hud_jogo(self.tela, pontuacao, obstaculos, self.playlist_manager, self.record_manager, powerup_manager, self)
+                return desenhar_hud_jogo(self.tela, pontuacao, obstaculos, self.playlist_manager, self.record_manager, powerup_manager, self)
         elif self.estado == POWERUP_HELP:
             desenhar_tela_powerup_help(self.tela)
         elif self.estado == GAME_OVER:
             # Usa a pontuação final armazenada no game over
             pontuacao_final = getattr(self, 'pontuacao_final', 0)
             desenhar_tela_gameover(self.tela, pontuacao_final, self.img_gameover, self.record_manager, self.novo_record_atingido)
+        return []
     
     def atualizar_playlist(self, dt):
         """Atualiza o gerenciador de playlist"""
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Pacote de assets pré-processados (gerado offline por bake_assets.py)
+
+Formato (little-endian):
+    cabeçalho: magic b'VAPK', versão (u8), tamanho do índice (u32)
+    índice: JSON UTF-8 com as fontes (tamanho e mtime de cada imagem),
+            as imagens base e as variantes, cada uma apontando para blocos
+    blocos: alinhados em 64 bytes a partir do fim do índice
+            - superfícies: pixels BGRA 32 bits (o formato de convert_alpha)
+            - máscaras: bits por linha (np.packbits), como em Mask
+
+Em tempo de execução o arquivo é mapeado com mmap e cada superfície é só
+um `pygame.image.frombuffer` sobre sua região, sem decodificar PNG nem
+escalar. Se alguma imagem de assets/images mudou depois do bake, ou se o
+arquivo estiver truncado/corrompido, o pacote inteiro é ignorado e o
+AssetManager volta a carregar os PNGs.
+"""
+
+import json
+import mmap
+import os
+import struct
+import numpy as np
+import pygame
+from ..config import ASSETS_PACOTE
+from ..utils.surface import converter_para_display
+from .assets import assets, DIR_IMAGENS
+from .sprite_cache import VarianteSprite
+
+PACOTE_MAGIC = b'VAPK'
+PACOTE_VERSAO = 1
+_CABECALHO = struct.Struct('<4sBI')
+_ALINHAMENTO = 64
+EXTENSOES_IMAGEM = ('.png', '.jpg', '.jpeg', '.bmp')
+
+# Máscaras RGBA dos pixels BGRA em little-endian (ARGB8888)
+_MASCARAS_BGRA = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+
+
+def listar_imagens(diretorio: str = DIR_IMAGENS) -> dict:
+    """{caminho relativo com '/': (tamanho, mtime_ns)} das imagens do diretório"""
+    fontes = {}
+    for raiz, _, arquivos in os.walk(diretorio):
+        for arquivo in sorted(arquivos):
+            if arquivo.lower().endswith(EXTENSOES_IMAGEM):
+                caminho = os.path.join(raiz, arquivo)
+                info = os.stat(caminho)
+                fontes[os.path.relpath(caminho, diretorio).replace(os.sep, '/')] = (info.st_size, info.st_mtime_ns)
+    return fontes
+
+
+def _alinhar(n: int) -> int:
+    return (n + _ALINHAMENTO - 1) // _ALINHAMENTO * _ALINHAMENTO
+
+
+# -------------------- Gravação --------------------
+
+class _Blocos:
+    """Acumula os blocos de dados e devolve o offset (relativo) de cada um"""
+
+    def __init__(self):
+        self.partes = []
+        self.tamanho = 0
+
+    def adicionar(self, dados: bytes) -> int:
+        offset = self.tamanho
+        preenchimento = _alinhar(len(dados)) - len(dados)
+        self.partes.append(dados)
+        self.partes.append(b'\0' * preenchimento)
+        self.tamanho += len(dados) + preenchimento
+        return offset
+
+
+def _serializar(valor, blocos: _Blocos):
+    """Descrição JSON de uma variante (None se o tipo não pode ir para o pacote)"""
+    if isinstance(valor, pygame.Surface):
+        w, h = valor.get_size()
+        return {'t': 'superficie', 'o': blocos.adicionar(pygame.image.tobytes(valor, 'BGRA')),
+                'w': w, 'h': h, 'alpha': bool(valor.get_flags() & pygame.SRCALPHA)}
+    if isinstance(valor, pygame.mask.Mask):
+        w, h = valor.get_size()
+        plano = pygame.surfarray.array_alpha(valor.to_surface(setcolor=(255, 255, 255, 255),
+                                                              unsetcolor=(0, 0, 0, 0))).T > 0
+        return {'t': 'mascara', 'o': blocos.adicionar(np.packbits(plano, axis=1).tobytes()), 'w': w, 'h': h}
+    if isinstance(valor, VarianteSprite):
+        return {'t': 'sprite', 'img': _serializar(valor.img, blocos), 'mask': _serializar(valor.mask, blocos)}
+    if isinstance(valor, list) and all(isinstance(item, pygame.Surface) for item in valor):
+        return {'t': 'lista', 'itens': [_serializar(item, blocos) for item in valor]}
+    if isinstance(valor, tuple) and all(isinstance(item, (int, float)) for item in valor):
+        return {'t': 'valor', 'v': list(valor)}
+    return None
+
+
+def gravar_pacote(caminho: str = ASSETS_PACOTE, asset_manager=assets) -> dict:
+    """Grava as bases (com alpha) e as variantes carregadas no AssetManager.
+
+    Quem chama (bake_assets.py) carrega antes tudo o que deve ir no pacote.
+    O arquivo é escrito ao lado e renomeado no fim, então um bake
+    interrompido nunca deixa um pacote pela metade no lugar do anterior.
+    """
+    blocos = _Blocos()
+    bases = {}
+    for (nome, alpha), img in asset_manager.bases.items():
+        if alpha:
+            bases.setdefault(nome.lower(), _serializar(img, blocos))
+    variantes = {}
+    for chave, (valor, _) in asset_manager.variantes.items():
+        descricao = _serializar(valor, blocos)
+        if descricao is not None:
+            variantes[repr(chave)] = descricao
+
+    indice = json.dumps({
+        'fontes': listar_imagens(asset_manager.diretorio),
+        'bases': bases,
+        'variantes': variantes,
+    }, separators=(',', ':')).encode('utf-8')
+    cabecalho = _CABECALHO.pack(PACOTE_MAGIC, PACOTE_VERSAO, len(indice))
+    inicio = _alinhar(len(cabecalho) + len(indice))
+
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(cabecalho)
+        arquivo.write(indice)
+        arquivo.write(b'\0' * (inicio - len(cabecalho) - len(indice)))
+        arquivo.writelines(blocos.partes)
+    os.replace(temporario, caminho)
+    return {'bases': len(bases), 'variantes': len(variantes), 'bytes': inicio + blocos.tamanho}
+
+
+# -------------------- Leitura --------------------
+
+def _dentro(descricao: dict, limite: int) -> bool:
+    """Os blocos da descrição (e de suas partes) cabem nos `limite` bytes de dados?"""
+    tipo = descricao['t']
+    if tipo == 'sprite':
+        return _dentro(descricao['img'], limite) and _dentro(descricao['mask'], limite)
+    if tipo == 'lista':
+        return all(_dentro(item, limite) for item in descricao['itens'])
+    if tipo == 'superficie':
+        tamanho = descricao['w'] * descricao['h'] * 4
+    elif tipo == 'mascara':
+        tamanho = (descricao['w'] + 7) // 8 * descricao['h']
+    else:
+        return tipo == 'valor'  # sem bloco
+    return min(descricao['o'], descricao['w'], descricao['h']) >= 0 and descricao['o'] + tamanho <= limite
+
+
+class PacoteAssets:
+    """Pacote mapeado em memória; entrega superfícies sem decodificar nada.
+
+    As superfícies com alpha apontam direto para o mmap (ACCESS_COPY: cópia
+    só se alguém escrever nelas). As opacas passam por `convert()` para não
+    pagar mistura de alpha a cada blit. O mmap fica aberto enquanto o jogo
+    roda, já que as superfícies dependem dele.
+    """
+
+    def __init__(self, caminho: str, dados: mmap.mmap, indice: dict, inicio: int):
+        self.caminho = caminho
+        self.dados = dados
+        self.bases = indice['bases']
+        self.variantes = indice['variantes']
+        self.inicio = inicio
+        self.usos = 0
+        self._formato_direto = None  # pixels BGRA já estão no formato do display?
+
+    @classmethod
+    def abrir(cls, caminho: str = ASSETS_PACOTE, diretorio: str = DIR_IMAGENS):
+        """Abre o pacote; retorna None se faltar, for de outra versão, estiver
+        desatualizado ou corrompido (índice ilegível, blocos além do fim)"""
+        if not os.path.exists(caminho):
+            return None
+        with open(caminho, 'rb') as arquivo:
+            try:
+                dados = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_COPY)
+            except ValueError:  # arquivo vazio
+                return None
+        pacote = None
+        try:
+            magic, versao, tamanho_indice = _CABECALHO.unpack_from(dados, 0)
+            if magic != PACOTE_MAGIC or versao != PACOTE_VERSAO:
+                print(f"⚠️ {caminho}: pacote de outra versão; usando os PNGs (rode bake_assets.py)")
+                return None
+            indice = json.loads(dados[_CABECALHO.size:_CABECALHO.size + tamanho_indice])
+            inicio = _alinhar(_CABECALHO.size + tamanho_indice)
+
+            fontes = indice['fontes']
+            atuais = listar_imagens(diretorio)
+            mudaram = [nome for nome, info in fontes.items() if tuple(info) != atuais.get(nome)]
+            if mudaram:
+                print(f"⚠️ {caminho}: desatualizado ({', '.join(mudaram[:3])}...); usando os PNGs (rode bake_assets.py)")
+                return None
+
+            descricoes = list(indice['bases'].values()) + list(indice['variantes'].values())
+            if not all(_dentro(descricao, len(dados) - inicio) for descricao in descricoes):
+                raise ValueError("blocos além do fim do arquivo")
+            pacote = cls(caminho, dados, indice, inicio)
+        except (struct.error, ValueError, KeyError, TypeError) as erro:
+            # JSONDecodeError/UnicodeDecodeError são ValueError
+            print(f"⚠️ {caminho}: pacote corrompido ({erro}); usando os PNGs (rode bake_assets.py)")
+        finally:
+            if pacote is None:
+                dados.close()  # o `with` só fecha o descritor; o mapeamento ficaria até o GC
+        return pacote
+
+    def _superficie(self, descricao: dict, alpha: bool = None) -> pygame.Surface:
+        w, h = descricao['w'], descricao['h']
+        offset = self.inicio + descricao['o']
+        img = pygame.image.frombuffer(memoryview(self.dados)[offset:offset + w * h * 4], (w, h), 'BGRA')
+        alpha = descricao['alpha'] if alpha is None else alpha
+        if not alpha or not self._pixels_no_formato_do_display():
+            return converter_para_display(img, alpha)
+        return img
+
+    def _pixels_no_formato_do_display(self) -> bool:
+        if self._formato_direto is None:
+            if pygame.display.get_surface() is None:
+                return True  # headless: não há para onde converter
+            teste = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            self._formato_direto = teste.get_masks() == _MASCARAS_BGRA
+        return self._formato_direto
+
+    def _mascara(self, descricao: dict) -> pygame.mask.Mask:
+        w, h = descricao['w'], descricao['h']
+        offset = self.inicio + descricao['o']
+        bits = np.frombuffer(self.dados, np.uint8, (w + 7) // 8 * h, offset).reshape(h, -1)
+        plano = np.unpackbits(bits, axis=1, count=w)
+        # Reconstrói a máscara pelo alpha (Mask não aceita bits prontos)
+        superficie = pygame.Surface((w, h), pygame.SRCALPHA)
+        alpha = pygame.surfarray.pixels_alpha(superficie)
+        alpha[...] = plano.T * 255
+        del alpha  # destrava a superfície
+        return pygame.mask.from_surface(superficie, 127)
+
+    def _desserializar(self, descricao: dict):
+        tipo = descricao['t']
+        if tipo == 'superficie':
+            return self._superficie(descricao)
+        if tipo == 'mascara':
+            return self._mascara(descricao)
+        if tipo == 'sprite':
+            return VarianteSprite(self._superficie(descricao['img']), self._mascara(descricao['mask']))
+        if tipo == 'lista':
+            return [self._superficie(item) for item in descricao['itens']]
+        return tuple(descricao['v'])
+
+    def imagem(self, nome: str, alpha: bool = True):
+        """Imagem base do pacote (None se não estiver nele)"""
+        descricao = self.bases.get(nome.lower())
+        if descricao is None:
+            return None
+        self.usos += 1
+        return self._superficie(descricao, alpha)
+
+    def variante(self, chave):
+        """Variante pré-calculada com a mesma chave do AssetManager (None se não houver)"""
+        descricao = self.variantes.get(repr(chave))
+        if descricao is None:
+            return None
+        self.usos += 1
+        return self._desserializar(descricao)
+
+    def estatisticas(self) -> dict:
+        """Conteúdo do pacote e quantos assets ele já entregou"""
+        return {
+            'bases': len(self.bases),
+            'variantes': len(self.variantes),
+            'bytes': len(self.dados),
+            'usos': self.usos,
+        }
+
+
+def usar_pacote(caminho: str = ASSETS_PACOTE, asset_manager=assets):
+    """Liga o pacote ao AssetManager se ele existir e estiver em dia"""
+    pacote = PacoteAssets.abrir(caminho, asset_manager.diretorio)
+    asset_manager.pacote = pacote
+    if pacote is not None:
+        stats = pacote.estatisticas()
+        print(f"📦 Pacote de assets: {caminho} ({stats['bases']} imagens, "
+              f"{stats['variantes']} variantes, {stats['bytes'] / (1024 * 1024):.1f} MB)")
+    return pacote
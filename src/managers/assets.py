@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Gerenciador central de assets (imagens base + variantes derivadas com orçamento)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+import pygame
+from ..config import ASSETS_ORCAMENTO_BYTES
+from ..utils.surface import converter_para_display
+
+DIR_IMAGENS = os.path.join("assets", "images")
+
+
+def tamanho_bytes(valor) -> int:
+    """Memória residente estimada de uma superfície, máscara ou coleção delas"""
+    if isinstance(valor, pygame.Surface):
+        return valor.get_pitch() * valor.get_height()
+    if isinstance(valor, pygame.mask.Mask):
+        w, h = valor.get_size()
+        return (w + 7) // 8 * h
+    if isinstance(valor, (list, tuple)):
+        return sum(tamanho_bytes(v) for v in valor)
+    slots = getattr(valor, '__slots__', ())
+    return sum(tamanho_bytes(getattr(valor, nome, None)) for nome in slots)
+
+
+class AssetManager:
+    """Carrega cada arquivo de assets/images uma única vez e guarda variantes.
+
+    - Imagens base: decodificadas e convertidas para o formato do display no
+      primeiro uso e mantidas enquanto o jogo roda.
+    - Variantes (escaladas, com máscara, frames...): construídas sob demanda
+      por `variante(chave, construir)` e mantidas num LRU limitado a
+      `orcamento` bytes. Uma variante despejada ainda em uso por alguma
+      entidade continua válida; só volta a ser construída no próximo pedido.
+
+    `relatorio()` lista a memória de cada item; `estatisticas()` dá os totais.
+    Carregamentos e o LRU ficam sob um lock (o AssetPreloader usa uma thread).
+    Com um `pacote` (PacoteAssets, ver asset_pack.py), bases e variantes
+    pré-calculadas vêm dele antes de decodificar/construir qualquer coisa.
+    """
+
+    def __init__(self, orcamento: int = ASSETS_ORCAMENTO_BYTES, diretorio: str = DIR_IMAGENS):
+        self.orcamento = orcamento
+        self.diretorio = diretorio
+        self.bases = {}  # {(nome, alpha): Surface}
+        self.variantes = OrderedDict()  # {chave: (valor, bytes)} em ordem de uso
+        self.bytes_variantes = 0
+        self.hits = 0
+        self.misses = 0
+        self.despejos = 0
+        self.pacote = None
+        self._lock = threading.RLock()
+
+    def caminho(self, nome: str) -> str:
+        """Caminho de um arquivo relativo a assets/images (ex.: 'Police_animation/1.png')"""
+        return os.path.join(self.diretorio, *nome.split('/'))
+
+    def existe(self, nome: str) -> bool:
+        return os.path.exists(self.caminho(nome))
+
+    def imagem(self, nome: str, alpha: bool = True) -> pygame.Surface:
+        """Imagem original convertida para o display (compartilhada, somente leitura)"""
+        chave = (nome, alpha)
+        img = self.bases.get(chave)
+        if img is None:
+            with self._lock:
+                img = self.bases.get(chave)
+                if img is None:
+                    img = self.bases[chave] = self._carregar(nome, alpha)
+        return img
+
+    def descartar_base(self, nome: str, alpha: bool = True):
+        """Libera um original que só era necessário para gerar variantes"""
+        with self._lock:
+            self.bases.pop((nome, alpha), None)
+
+    def _carregar(self, nome: str, alpha: bool) -> pygame.Surface:
+        if self.pacote is not None:
+            img = self.pacote.imagem(nome, alpha)
+            if img is not None:
+                return img
+        return converter_para_display(pygame.image.load(self.caminho(nome)), alpha)
+
+    def variante(self, chave, construir):
+        """Valor derivado cacheado sob `chave`; `construir()` só roda na falta"""
+        with self._lock:
+            item = self.variantes.get(chave)
+            if item is not None:
+                self.hits += 1
+                self.variantes.move_to_end(chave)
+                return item[0]
+
+            self.misses += 1
+            valor = self.pacote.variante(chave) if self.pacote is not None else None
+            if valor is None:
+                valor = construir()
+            tamanho = tamanho_bytes(valor)
+            self.variantes[chave] = (valor, tamanho)
+            self.bytes_variantes += tamanho
+            self._despejar()
+            return valor
+
+    def _despejar(self):
+        """Remove as variantes menos usadas até caber no orçamento (mantém a mais recente)"""
+        while self.bytes_variantes > self.orcamento and len(self.variantes) > 1:
+            _, (_, tamanho) = self.variantes.popitem(last=False)
+            self.bytes_variantes -= tamanho
+            self.despejos += 1
+
+    def escalada(self, nome: str, tamanho: tuple[int, int], alpha: bool = True,
+                 suave: bool = True, manter_base: bool = True) -> pygame.Surface:
+        """Imagem redimensionada (smoothscale ou scale) no formato do display.
+
+        `manter_base=False` não guarda o original (telas cheias usadas só escaladas).
+        """
+        tamanho = (int(tamanho[0]), int(tamanho[1]))
+
+        def construir():
+            base = self.imagem(nome, alpha) if manter_base else self._carregar(nome, alpha)
+            escalar = pygame.transform.smoothscale if suave else pygame.transform.scale
+            return converter_para_display(escalar(base, tamanho), alpha)
+
+        return self.variante(('escalada', nome, tamanho, alpha, suave), construir)
+
+    def relatorio(self) -> list[dict]:
+        """Memória de cada imagem base e variante, da maior para a menor"""
+        linhas = []
+        for (nome, alpha), img in self.bases.items():
+            linhas.append({'tipo': 'base', 'asset': nome, 'tamanho': img.get_size(),
+                           'bytes': tamanho_bytes(img)})
+        for chave, (valor, tamanho) in self.variantes.items():
+            dimensoes = valor.get_size() if isinstance(valor, pygame.Surface) else None
+            linhas.append({'tipo': chave[0], 'asset': chave[1], 'tamanho': dimensoes, 'bytes': tamanho})
+        linhas.sort(key=lambda linha: linha['bytes'], reverse=True)
+        return linhas
+
+    def imprimir_relatorio(self):
+        """Mostra o relatório de memória no console"""
+        for linha in self.relatorio():
+            dimensoes = 'x'.join(map(str, linha['tamanho'])) if linha['tamanho'] else '-'
+            print(f"🎨 {linha['bytes'] / 1024:9.1f} KB  {linha['tipo']:<10} {linha['asset']} ({dimensoes})")
+        stats = self.estatisticas()
+        print(f"🎨 Total: {(stats['bytes_bases'] + stats['bytes_variantes']) / (1024 * 1024):.1f} MB "
+              f"(variantes {stats['bytes_variantes'] / (1024 * 1024):.1f} / "
+              f"{stats['orcamento'] / (1024 * 1024):.0f} MB)")
+
+    def estatisticas(self) -> dict:
+        """Totais de memória e contadores do cache de variantes"""
+        return {
+            'bases': len(self.bases),
+            'bytes_bases': sum(tamanho_bytes(img) for img in self.bases.values()),
+            'variantes': len(self.variantes),
+            'bytes_variantes': self.bytes_variantes,
+            'orcamento': self.orcamento,
+            'hits': self.hits,
+            'misses': self.misses,
+            'despejos': self.despejos,
+        }
+
+    def limpar(self):
+        """Descarta bases e variantes e zera os contadores"""
+        with self._lock:
+            self.bases.clear()
+            self.variantes.clear()
+            self.bytes_variantes = 0
+            self.hits = 0
+            self.misses = 0
+            self.despejos = 0
+
+
+# Instância compartilhada pelo jogo
+assets = AssetManager()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Atlas de sprites: várias superfícies pequenas empacotadas em poucas páginas
+"""
+
+import pygame
+from ..config import ATLAS_LARGURA, ATLAS_ALTURA_MAX
+from ..utils.surface import converter_para_display
+
+
+class AtlasSprites:
+    """Empacota sprites em páginas por prateleiras (shelf packing).
+
+    Os sprites são ordenados por altura e colocados lado a lado em
+    prateleiras; quando uma página passa de `altura_max`, abre-se outra.
+    Cada sprite vira uma subsuperfície da página (mesma memória), e
+    `regioes` guarda para ela (página, retângulo de origem). Assim quem
+    desenha monta itens (página, destino, área) para um único
+    `Surface.blits`; superfícies fora do atlas são desenhadas diretamente.
+    """
+
+    def __init__(self, largura: int = ATLAS_LARGURA, altura_max: int = ATLAS_ALTURA_MAX, espaco: int = 1):
+        self.largura = largura
+        self.altura_max = altura_max
+        self.espaco = espaco  # pixels livres entre sprites
+        self.paginas = []
+        self.regioes = {}  # {subsuperfície: (página, Rect)}
+
+    def empacotar(self, superficies) -> dict:
+        """Copia as superfícies para novas páginas; retorna {original: subsuperfície}"""
+        unicas = list(dict.fromkeys(superficies))
+        ordem = sorted(unicas, key=lambda s: (s.get_height(), s.get_width()), reverse=True)
+
+        posicoes = []  # (superfície, página, x, y)
+        alturas = [0]
+        x = y = prateleira = 0
+        for superficie in ordem:
+            w, h = superficie.get_size()
+            if w > self.largura or h > self.altura_max:
+                raise ValueError(f"Sprite {w}x{h} não cabe numa página de {self.largura}x{self.altura_max}")
+            if x + w > self.largura:
+                # Próxima prateleira
+                x, y, prateleira = 0, y + prateleira + self.espaco, 0
+            if y + h > self.altura_max:
+                # Próxima página
+                x = y = prateleira = 0
+                alturas.append(0)
+            posicoes.append((superficie, len(alturas) - 1, x, y))
+            prateleira = max(prateleira, h)
+            alturas[-1] = max(alturas[-1], y + h)
+            x += w + self.espaco
+
+        paginas = [pygame.Surface((self.largura, altura), pygame.SRCALPHA) for altura in alturas]
+        for superficie, p, x, y in posicoes:
+            # MAX sobre a página transparente = cópia exata (sem misturar alpha)
+            paginas[p].blit(superficie, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        paginas = [converter_para_display(pagina) for pagina in paginas]
+        self.paginas.extend(paginas)
+
+        mapa = {}
+        for superficie, p, x, y in posicoes:
+            rect = pygame.Rect((x, y), superficie.get_size())
+            sub = paginas[p].subsurface(rect)
+            self.regioes[sub] = (paginas[p], rect)
+            mapa[superficie] = sub
+        return mapa
+
+    def item(self, superficie, destino, special_flags: int = 0) -> tuple:
+        """Item de `Surface.blits`: (página, destino, área) se a superfície está no atlas"""
+        regiao = self.regioes.get(superficie)
+        if regiao is None:
+            return (superficie, destino, None, special_flags)
+        return (regiao[0], destino, regiao[1], special_flags)
+
+    def estatisticas(self) -> dict:
+        """Páginas, sprites e aproveitamento da área"""
+        area_paginas = sum(p.get_width() * p.get_height() for p in self.paginas)
+        area_sprites = sum(rect.width * rect.height for _, rect in self.regioes.values())
+        return {
+            'paginas': len(self.paginas),
+            'sprites': len(self.regioes),
+            'bytes': sum(p.get_pitch() * p.get_height() for p in self.paginas),
+            'ocupacao': round(area_sprites / area_paginas, 3) if area_paginas else 0.0,
+        }
+
+    def limpar(self):
+        """Descarta as páginas (quem ainda usa as subsuperfícies continua válido)"""
+        self.paginas.clear()
+        self.regioes.clear()
+
+
+# Instância compartilhada pelo jogo
+atlas = AtlasSprites()
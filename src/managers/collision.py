@@ -3,8 +3,13 @@
 Sistema de colisão do jogo
 """
 
+import math
+import numpy as np
 import pygame
-from ..config import COLLISION_MODE, HITBOX_SHRINK_W, HITBOX_SHRINK_H
+from ..config import (
+    COLLISION_MODE, HITBOX_SHRINK_W, HITBOX_SHRINK_H, LANE_COUNT,
+    BROADPHASE_ALTURA_BANDA, BROADPHASE_LOTE_MIN, COLISAO_VARRIDA, COLISAO_VARRIDA_PASSO
+)
 
 
 def collide_shrink(a_rect: pygame.Rect, b_rect: pygame.Rect) -> bool:
@@ -12,10 +17,97 @@ def collide_shrink(a_rect: pygame.Rect, b_rect: pygame.Rect) -> bool:
     return a_rect.colliderect(b_rect)
 
 
+# Contadores de pares testados (modos "mask" e "hybrid")
+estatisticas_colisao = {
+    'pares': 0,           # pares que chegaram à fase fina
+    'rejeitados_bbox': 0, # descartados pelo teste de retângulos
+    'testes_pixel': 0,    # pares que chegaram ao mask.overlap
+    'colisoes': 0,
+}
+
+
+def resetar_estatisticas():
+    """Zera os contadores de colisão"""
+    for chave in estatisticas_colisao:
+        estatisticas_colisao[chave] = 0
+
+
+def calcular_bbox(mask) -> pygame.Rect:
+    """Retângulo justo (coordenadas locais) dos pixels opacos da máscara"""
+    rects = mask.get_bounding_rects()
+    if not rects:
+        return pygame.Rect(0, 0, 0, 0)
+    return rects[0].unionall(rects[1:])
+
+
 def collide_mask(a, b) -> bool:
     """Colisão usando máscaras de pixel"""
     offset = (int(b.x - a.x), int(b.y - a.y))
-    return a.mask.overlap(b.mask, offset) is not None
+    estatisticas_colisao['pares'] += 1
+    estatisticas_colisao['testes_pixel'] += 1
+    if a.mask.overlap(b.mask, offset) is None:
+        return False
+    estatisticas_colisao['colisoes'] += 1
+    return True
+
+
+def collide_hybrid(a, b) -> bool:
+    """Rejeita pelos retângulos justos das máscaras; só os que se cruzam vão ao teste de pixel"""
+    ox, oy = int(b.x - a.x), int(b.y - a.y)
+    ra, rb = a.bbox, b.bbox
+    estatisticas_colisao['pares'] += 1
+    # Mesmo teste de Rect.colliderect, com `rb` deslocado para o referencial de `a`
+    if (rb.x + ox >= ra.right or rb.right + ox <= ra.x or
+            rb.y + oy >= ra.bottom or rb.bottom + oy <= ra.y):
+        estatisticas_colisao['rejeitados_bbox'] += 1
+        return False
+    estatisticas_colisao['testes_pixel'] += 1
+    if a.mask.overlap(b.mask, (ox, oy)) is None:
+        return False
+    estatisticas_colisao['colisoes'] += 1
+    return True
+
+
+def collide_varrida(a, b, modo: str = COLLISION_MODE) -> bool:
+    """Colisão contínua: testa o movimento relativo de `b` entre o tick anterior e o atual.
+
+    O trajeto (x_ant, y_ant) -> (x, y) dos dois objetos é amostrado a cada
+    COLISAO_VARRIDA_PASSO px, então um obstáculo rápido não atravessa o
+    jogador entre dois ticks. Cada amostra usa o teste do `modo`: em
+    "hybrid" o retângulo varrido inteiro e depois o de cada amostra
+    descartam pares antes do teste de pixel; em "mask" toda amostra vai
+    direto ao mask.overlap.
+    """
+    ox1, oy1 = b.x - a.x, b.y - a.y
+    ox0, oy0 = b.x_ant - a.x_ant, b.y_ant - a.y_ant
+    ra, rb = a.bbox, b.bbox
+    hybrid = modo == "hybrid"
+    estatisticas_colisao['pares'] += 1
+    if hybrid and (rb.x + min(ox0, ox1) >= ra.right or rb.right + max(ox0, ox1) <= ra.x or
+                   rb.y + min(oy0, oy1) >= ra.bottom or rb.bottom + max(oy0, oy1) <= ra.y):
+        estatisticas_colisao['rejeitados_bbox'] += 1
+        return False
+
+    # Do fim para o início: a posição atual é a colisão mais provável
+    passos = max(1, math.ceil(max(abs(ox1 - ox0), abs(oy1 - oy0)) / COLISAO_VARRIDA_PASSO))
+    for k in range(passos, 0, -1):
+        t = k / passos
+        ox = int(ox0 + (ox1 - ox0) * t)
+        oy = int(oy0 + (oy1 - oy0) * t)
+        if hybrid and (rb.x + ox >= ra.right or rb.right + ox <= ra.x or
+                       rb.y + oy >= ra.bottom or rb.bottom + oy <= ra.y):
+            continue
+        estatisticas_colisao['testes_pixel'] += 1
+        if a.mask.overlap(b.mask, (ox, oy)) is None:
+            continue
+        estatisticas_colisao['colisoes'] += 1
+        return True
+    return False
+
+
+def collide_shrink_varrida(a_rect: pygame.Rect, b_rect: pygame.Rect, dx: int, dy: int) -> bool:
+    """Colisão contínua com retângulos: `b_rect` varre (dx, dy) relativos até a posição atual"""
+    return a_rect.colliderect(b_rect.union(b_rect.move(-dx, -dy)))
 
 
 def create_hit_rect(x: int, y: int, w: int, h: int) -> pygame.Rect:
@@ -35,7 +127,15 @@ def create_hit_rect_from_rect(rect: pygame.Rect) -> pygame.Rect:
 
 def check_collision(obj_a, obj_b) -> bool:
     """Verifica colisão entre dois objetos baseado no modo configurado"""
-    if COLLISION_MODE == "mask":
+    if COLISAO_VARRIDA:
+        if COLLISION_MODE == "shrink":
+            dx = int((obj_b.x - obj_b.x_ant) - (obj_a.x - obj_a.x_ant))
+            dy = int((obj_b.y - obj_b.y_ant) - (obj_a.y - obj_a.y_ant))
+            return collide_shrink_varrida(obj_a.hit_rect, obj_b.hit_rect, dx, dy)
+        return collide_varrida(obj_a, obj_b, COLLISION_MODE)
+    if COLLISION_MODE == "hybrid":
+        return collide_hybrid(obj_a, obj_b)
+    elif COLLISION_MODE == "mask":
         return collide_mask(obj_a, obj_b)
     else:  # "shrink"
         return collide_shrink(obj_a.hit_rect, obj_b.hit_rect)
@@ -43,7 +143,11 @@ def check_collision(obj_a, obj_b) -> bool:
 
 def check_collision_with_powerup(jogador, powerup) -> bool:
     """Verifica colisão específica entre jogador e power-up"""
-    if COLLISION_MODE == "mask":
+    if COLISAO_VARRIDA and COLLISION_MODE != "shrink":
+        return collide_varrida(jogador, powerup, COLLISION_MODE)
+    if COLLISION_MODE == "hybrid":
+        return collide_hybrid(jogador, powerup)
+    elif COLLISION_MODE == "mask":
         return collide_mask(jogador, powerup)
     else:  # "shrink"
         jogador_hit_rect = create_hit_rect_from_rect(jogador.hit_rect)
@@ -56,4 +160,124 @@ def check_distance_between_objects(obj_a, obj_b, max_distance: float) -> bool:
     dx = obj_a.x - obj_b.x
     dy = obj_a.y - obj_b.y
     distance = (dx * dx + dy * dy) ** 0.5
-    return distance <= max_distance 
\ No newline at end of file
+    return distance <= max_distance
+
+
+class BroadphaseFaixas:
+    """Broadphase por faixa e banda vertical.
+
+    Cada objeto ocupa um intervalo de faixas (pela largura) e de bandas de
+    BROADPHASE_ALTURA_BANDA px (pela altura). Só os objetos cujos intervalos
+    cruzam os do jogador seguem para o teste fino (máscara/retângulo).
+
+    As células do jogador são convertidas em limites de pixel em `preparar`,
+    então o teste de cada objeto são quatro comparações. No ObstaculoStore
+    as chaves são recalculadas a cada tick: em Python para poucos obstáculos
+    e em lote (NumPy) a partir de BROADPHASE_LOTE_MIN linhas. Com `varrido`
+    os intervalos cobrem também a posição do tick anterior (colisão contínua).
+    """
+
+    def __init__(self, inner_x: int, lane_w: int, lane_count: int = None,
+                 altura_banda: int = None, varrido: bool = None):
+        # None = valor atual do config (lido aqui, não na definição: o sweep.py o altera)
+        self.inner_x = inner_x
+        self.lane_w = lane_w
+        self.ultima_faixa = (LANE_COUNT if lane_count is None else lane_count) - 1
+        self.altura_banda = BROADPHASE_ALTURA_BANDA if altura_banda is None else altura_banda
+        self.varrido = COLISAO_VARRIDA if varrido is None else varrido
+        # Limites (em px) das células ocupadas pelo jogador
+        self.x_min = self.y_min = -math.inf
+        self.x_max = self.y_max = math.inf
+        # Contadores do tick atual e acumulados
+        self.n_candidatos = 0
+        self.n_objetos = 0
+        self.total_candidatos = 0
+        self.total_objetos = 0
+
+    def _faixa(self, x) -> int:
+        return min(self.ultima_faixa, max(0, int((x - self.inner_x) // self.lane_w)))
+
+    def preparar(self, jogador):
+        """Calcula as células do jogador para o tick atual"""
+        x0 = x1 = jogador.x
+        y0 = y1 = jogador.y
+        if self.varrido:
+            x0, x1 = min(x0, jogador.x_ant), max(x1, jogador.x_ant)
+            y0, y1 = min(y0, jogador.y_ant), max(y1, jogador.y_ant)
+        faixa_min = self._faixa(x0)
+        faixa_max = self._faixa(x1 + jogador.largura)
+        banda_min = y0 // self.altura_banda
+        banda_max = (y1 + jogador.altura) // self.altura_banda
+
+        # As faixas das bordas se estendem até o infinito (mesmo clamp de _faixa)
+        self.x_min = self.inner_x + faixa_min * self.lane_w if faixa_min > 0 else -math.inf
+        self.x_max = (self.inner_x + (faixa_max + 1) * self.lane_w
+                      if faixa_max < self.ultima_faixa else math.inf)
+        self.y_min = banda_min * self.altura_banda
+        self.y_max = (banda_max + 1) * self.altura_banda
+
+        self.total_candidatos += self.n_candidatos
+        self.total_objetos += self.n_objetos
+        self.n_candidatos = 0
+        self.n_objetos = 0
+
+    def e_candidato(self, obj) -> bool:
+        """Teste individual (para listas pequenas, como os power-ups)"""
+        self.n_objetos += 1
+        x0 = x1 = obj.x
+        y0 = y1 = obj.y
+        if self.varrido:
+            x0, x1 = min(x0, obj.x_ant), max(x1, obj.x_ant)
+            y0, y1 = min(y0, obj.y_ant), max(y1, obj.y_ant)
+        if (x0 < self.x_max and x1 + obj.largura >= self.x_min and
+                y0 < self.y_max and y1 + obj.altura >= self.y_min):
+            self.n_candidatos += 1
+            return True
+        return False
+
+    def candidatos_store(self, store):
+        """Índices das linhas do store que cruzam as células do jogador"""
+        n = store.n
+        self.n_objetos += n
+        x_min, x_max, y_min, y_max = self.x_min, self.x_max, self.y_min, self.y_max
+        if n < BROADPHASE_LOTE_MIN:
+            linhas = zip(store.x[:n].tolist(), store.y[:n].tolist(),
+                         store.largura[:n].tolist(), store.altura[:n].tolist())
+            if self.varrido:
+                indices = [i for i, ((x, y, w, h), xa, ya) in enumerate(
+                               zip(linhas, store.x_ant[:n].tolist(), store.y_ant[:n].tolist()))
+                           if (y if y < ya else ya) < y_max and (y if y > ya else ya) + h >= y_min and
+                           (x if x < xa else xa) < x_max and (x if x > xa else xa) + w >= x_min]
+            else:
+                indices = [i for i, (x, y, w, h) in enumerate(linhas)
+                           if y < y_max and y + h >= y_min and x < x_max and x + w >= x_min]
+        else:
+            x0 = x1 = store.x[:n]
+            y0 = y1 = store.y[:n]
+            if self.varrido:
+                xa, ya = store.x_ant[:n], store.y_ant[:n]
+                x0, x1 = np.minimum(x0, xa), np.maximum(x1, xa)
+                y0, y1 = np.minimum(y0, ya), np.maximum(y1, ya)
+            indices = ((y0 < y_max) & (y1 + store.altura[:n] >= y_min) &
+                       (x0 < x_max) & (x1 + store.largura[:n] >= x_min)).nonzero()[0]
+        self.n_candidatos += len(indices)
+        return indices
+
+    def candidatos(self, obstaculos) -> list:
+        """Objetos candidatos de um ObstaculoStore ou de uma lista comum"""
+        if hasattr(obstaculos, 'objetos'):  # ObstaculoStore (sem importar entities: import circular)
+            objetos = obstaculos.objetos
+            return [objetos[i] for i in self.candidatos_store(obstaculos)]
+        return [obj for obj in obstaculos if self.e_candidato(obj)]
+
+    def estatisticas(self) -> dict:
+        """Candidatos do tick atual e proporção podada desde o início"""
+        total_objetos = self.total_objetos + self.n_objetos
+        total_candidatos = self.total_candidatos + self.n_candidatos
+        return {
+            'candidatos_tick': self.n_candidatos,
+            'objetos_tick': self.n_objetos,
+            'total_candidatos': total_candidatos,
+            'total_objetos': total_objetos,
+            'poda': 1.0 - total_candidatos / total_objetos if total_objetos else 0.0,
+        }
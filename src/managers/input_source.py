@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Fontes de entrada do jogador: teclado, piloto automático e motoristas simples
+
+Toda fonte expõe `ler(engine) -> int` (bits ENTRADA_* do tick) e
+`reiniciar()`, chamado a cada nova partida. O laço do jogo, o replay e a
+varredura de parâmetros usam a mesma interface. As fontes que sorteiam
+recebem um fluxo do RNGService do motor (`engine.rng.fluxo('entrada')`),
+ressemeado pelo próprio motor em `resetar`.
+"""
+
+import numpy as np
+import pygame
+from ..config import (
+    PILOTO_NIVEIS, PILOTO_PASSO_PLANO, POLICE_LATERAL_SPEED, OBST_VEL_INICIAL
+)
+from ..engine import ENTRADA_ESQUERDA, ENTRADA_DIREITA, entrada_do_teclado
+from .police_ai import altura_ativacao, intervalo_decisao
+
+
+class EntradaTeclado:
+    """Setas / A-D do teclado"""
+
+    def reiniciar(self):
+        pass
+
+    def ler(self, engine) -> int:
+        return entrada_do_teclado(pygame.key.get_pressed())
+
+
+class EntradaParada:
+    """Nunca se move (linha de base para benchmarks)"""
+
+    def reiniciar(self):
+        pass
+
+    def ler(self, engine) -> int:
+        return 0
+
+
+class EntradaAleatoria:
+    """Mantém uma direção por alguns ticks, como um jogador distraído"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.entrada = 0
+
+    def ler(self, engine) -> int:
+        if self.rng.random() < 0.05:
+            self.entrada = self.rng.choice((0, 0, ENTRADA_ESQUERDA, ENTRADA_DIREITA))
+        return self.entrada
+
+
+class PilotoAutomatico:
+    """Escolhe a manobra mais segura planejando alguns segundos à frente.
+
+    O jogador é discretizado em posições (centros das faixas e os pontos
+    entre elas) e o tempo em passos de PILOTO_PASSO_PLANO. A ocupação de
+    cada (posição, instante) vem das colunas do ObstaculoStore em lote, com
+    os bbox das máscaras: obstáculos descem na velocidade atual e viaturas
+    em troca de faixa seguem até o alvo. Uma programação dinâmica de trás
+    para frente dá, para cada estado, até quando se sobrevive ficando ou
+    indo para uma posição vizinha (a travessia exige as duas posições
+    livres durante todo o trajeto), desempatando pela folga. O piloto só
+    replaneja ao chegar numa posição.
+
+    Os níveis (PILOTO_NIVEIS) mudam o horizonte, o tempo de reação, a
+    margem de segurança, a chance de errar a manobra e se as próximas
+    decisões das viaturas são previstas.
+    """
+
+    def __init__(self, nivel: str, rng):
+        if nivel not in PILOTO_NIVEIS:
+            raise ValueError(f"Nível de piloto desconhecido: {nivel} (use {', '.join(PILOTO_NIVEIS)})")
+        self.nivel = nivel
+        config = PILOTO_NIVEIS[nivel]
+        self.reacao = config['reacao']
+        self.margem = config['margem']
+        self.erro = config['erro']
+        self.antecipa_policia = config['antecipa_policia']
+        self.tempos = np.arange(0.0, config['horizonte'] + 1e-9, PILOTO_PASSO_PLANO)
+        self.planos = 0
+        self._posicoes_de = None  # (id de lane_centers, largura do carro) -> posições
+        self.rng = rng
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.alvo = None  # índice da posição de destino
+        self.proximo_plano = 0.0
+
+    def _posicoes(self, engine):
+        """x (canto esquerdo) de cada posição: faixa, meio, faixa, meio, ..."""
+        chave = (id(engine.lane_centers), engine.carro.largura)
+        if self._posicoes_de != chave:
+            centros = np.asarray(engine.lane_centers, dtype=np.float64)
+            pontos = np.empty(2 * len(centros) - 1)
+            pontos[0::2] = centros
+            pontos[1::2] = (centros[1:] + centros[:-1]) / 2
+            self.posicoes = pontos - engine.carro.largura / 2
+            self._posicoes_de = chave
+        return self.posicoes
+
+    def ler(self, engine) -> int:
+        carro = engine.carro
+        posicoes = self._posicoes(engine)
+        zona_morta = carro.vel * engine.dt / 2
+        if self.alvo is None:
+            self.alvo = int(np.abs(posicoes - carro.x).argmin())
+
+        dx = posicoes[self.alvo] - carro.x
+        if abs(dx) <= zona_morta:
+            # Chegou: replaneja (respeitando o tempo de reação)
+            tempo = engine.estado.tempo
+            if tempo >= self.proximo_plano:
+                self.alvo = self.planejar(engine, self.alvo)
+                self.proximo_plano = tempo + self.reacao
+                dx = posicoes[self.alvo] - carro.x
+
+        if dx < -zona_morta:
+            return ENTRADA_ESQUERDA
+        if dx > zona_morta:
+            return ENTRADA_DIREITA
+        return 0
+
+    def _ocupacao(self, engine, posicoes):
+        """Matriz (posições, instantes) com True onde o jogador bateria"""
+        carro = engine.carro
+        store = engine.obstaculos
+        n = store.n
+        tempos = self.tempos
+        margem = self.margem
+        if not n:
+            return np.zeros((len(posicoes), len(tempos)), dtype=bool)
+
+        vel = engine.estado.vel_obst * engine.powerup_manager.efeitos.velocidade_obstaculos_mult
+        oy = store.y[:n, None] + vel * tempos
+        # Viaturas trocando de faixa: seguem até o alvo na velocidade lateral
+        ox0 = store.x[:n]
+        ratio = store.vel[:n] / OBST_VEL_INICIAL
+        vel_lateral = np.where(ratio > 1.5, POLICE_LATERAL_SPEED * ratio, POLICE_LATERAL_SPEED)
+        distancia = np.where(store.moving_lateral[:n], store.target_lane_x[:n] - ox0, 0.0)
+        ox = ox0[:, None] + np.sign(distancia)[:, None] * np.minimum(
+            np.abs(distancia)[:, None], vel_lateral[:, None] * tempos)
+
+        # Retângulos das máscaras (bbox), como na colisão em modo hybrid
+        bbox = np.array([tuple(obst.bbox) for obst in store.objetos[:n]], dtype=np.float64)
+        ox = ox + bbox[:, 0:1]
+        oy = oy + bbox[:, 1:2]
+        jx, jy, jw, jh = carro.bbox
+        jy += carro.y
+
+        # x por posição do jogador: (posições, obstáculos, instantes)
+        ox = np.broadcast_to(ox, (len(posicoes),) + ox.shape)
+        if self.antecipa_policia and store.eh_policia[:n].any():
+            ox = self._antecipar_policia(engine, posicoes, ox, vel, vel_lateral, bbox)
+
+        sobrepoe_y = (oy < jy + jh + margem) & (oy + bbox[:, 3:4] > jy - margem)
+        px = (posicoes + jx)[:, None, None]
+        sobrepoe_x = (ox < px + jw + margem) & (ox + bbox[None, :, 2:3] > px - margem)
+        return (sobrepoe_x & sobrepoe_y[None]).any(axis=1)
+
+    def _antecipar_policia(self, engine, posicoes, ox, vel, vel_lateral, bbox):
+        """Prevê as decisões de cada viatura (agenda do PoliceAIManager).
+
+        A partir da primeira decisão abaixo da altura de ativação, a viatura
+        vai para a faixa do jogador - que depende de onde o plano o coloca.
+        """
+        store = engine.obstaculos
+        n = store.n
+        decisoes = engine.policia.proximas_decisoes()
+        tempos = self.tempos
+        ox = ox.copy()
+        for i in np.flatnonzero(store.eh_policia[:n]):
+            obst = store.objetos[i]
+            d = decisoes.get(id(obst))
+            if d is None:
+                continue
+            # Primeira decisão (dentro do horizonte) já abaixo da altura de ativação
+            ativacao = altura_ativacao(obst.vel)
+            while d <= tempos[-1] and obst.y + vel * d <= ativacao:
+                d += intervalo_decisao(obst.vel, engine.estado.dificuldade)
+            if d > tempos[-1]:
+                continue
+            j = int(np.searchsorted(tempos, d))
+            depois = np.maximum(0.0, tempos[j:] - d) * vel_lateral[i]
+            # Faixa do jogador em cada posição (os pontos entre faixas contam como a da esquerda)
+            alvos = np.asarray(engine.lane_centers, dtype=np.float64)[np.arange(len(posicoes)) // 2]
+            alvos = alvos - obst.largura // 2 + bbox[i, 0]
+            x_d = ox[:, i, j:j + 1]
+            distancia = alvos[:, None] - x_d
+            ox[:, i, j:] = x_d + np.sign(distancia) * np.minimum(np.abs(distancia), depois)
+        return ox
+
+    def planejar(self, engine, atual: int) -> int:
+        """Próxima posição (a atual ou uma vizinha) do plano que sobrevive mais"""
+        self.planos += 1
+        posicoes = self._posicoes(engine)
+        n_pos = len(posicoes)
+        vizinhas = [p for p in (atual - 1, atual + 1) if 0 <= p < n_pos]
+        if self.erro and self.rng.random() < self.erro:
+            return self.rng.choice([atual] + vizinhas)
+
+        ocupado = self._ocupacao(engine, posicoes).tolist()
+        m = len(self.tempos)
+        espaco = abs(posicoes[1] - posicoes[0]) if n_pos > 1 else 0.0
+        k = max(1, int(np.ceil(espaco / (engine.carro.vel * PILOTO_PASSO_PLANO))))
+        folga_max = 3 * k
+
+        # livre_ate[p][t]: primeiro instante >= t ocupado em p; livre até o
+        # horizonte conta como folga máxima (o que vem depois é desconhecido)
+        sempre = m + folga_max
+        livre_ate = []
+        for linha in ocupado:
+            prox = [sempre] * (m + 1)
+            for t in range(m - 1, -1, -1):
+                prox[t] = t if linha[t] else prox[t + 1]
+            livre_ate.append(prox)
+
+        def ficar(valor, p, t):
+            """Valor de continuar em p no instante t"""
+            livre = livre_ate[p][t] - t
+            if not livre:
+                return (t, 0)
+            sobrevive, folga = valor[p][t + 1]
+            return (sobrevive, min(folga, livre, folga_max))
+
+        def mover(valor, p, q, t):
+            """Valor de sair de p para q no instante t"""
+            chegada = min(t + k, m)
+            bloqueio = min(livre_ate[p][t], livre_ate[q][t])
+            if bloqueio <= chegada:
+                return (bloqueio, 0)  # bate no meio da travessia
+            sobrevive, folga = valor[q][chegada]
+            return (sobrevive, min(folga, bloqueio - chegada))
+
+        # valor[p][t] = (instante até onde se sobrevive partindo de p em t,
+        #                menor folga do plano) - comparados nessa ordem. A folga
+        # (passos até a posição ocupada ser tomada) faz o piloto manobrar cedo
+        # em vez de no último instante possível.
+        valor = [[(m, folga_max)] * (m + 1) for _ in range(n_pos)]
+        for t in range(m - 1, -1, -1):
+            for p in range(n_pos):
+                melhor = ficar(valor, p, t)
+                if melhor[0] == t:
+                    valor[p][t] = melhor
+                    continue
+                for q in (p - 1, p + 1):
+                    if 0 <= q < n_pos:
+                        opcao = mover(valor, p, q, t)
+                        if opcao > melhor:
+                            melhor = opcao
+                valor[p][t] = melhor
+
+        # Raiz - empates: ficar numa faixa, depois seguir para uma faixa
+        opcoes = [(ficar(valor, atual, 0), atual % 2 == 0, True, atual)]
+        opcoes.extend((mover(valor, atual, q, 0), q % 2 == 0, False, q) for q in vizinhas)
+        return max(opcoes)[3]
+
+    def estatisticas(self) -> dict:
+        """Nível e replanejamentos feitos"""
+        return {'nivel': self.nivel, 'planos': self.planos}
+
+
+def criar_fonte(nome: str, rng):
+    """Fonte de entrada pelo nome: 'teclado', 'parado', 'aleatorio' ou um nível do piloto.
+
+    `rng` é o fluxo do motor para as entradas (`engine.rng.fluxo('entrada')`).
+    """
+    if nome == 'teclado':
+        return EntradaTeclado()
+    if nome == 'parado':
+        return EntradaParada()
+    if nome == 'aleatorio':
+        return EntradaAleatoria(rng)
+    return PilotoAutomatico(nome, rng)
+
+
+FONTES = ('teclado', 'parado', 'aleatorio') + tuple(PILOTO_NIVEIS)
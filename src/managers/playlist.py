@@ -4,13 +4,13 @@ Gerenciador de playlist de músicas
 """
 
 import os
-import random
 import pygame
 from ..config import PLAYLIST_VOLUME, PLAYLIST_FADE_TIME
 
 
 class PlaylistManager:
-    def __init__(self):
+    def __init__(self, rng):
+        self.rng = rng
         self.playlist_dir = os.path.join("assets", "sounds", "playlist")
         self.musicas = []
         self.musica_atual = None
@@ -40,7 +40,7 @@ class PlaylistManager:
         
         # Embaralha a playlist para reprodução aleatória
         if self.musicas:
-            random.shuffle(self.musicas)
+            self.rng.shuffle(self.musicas)
             print(f"✅ Playlist carregada com {len(self.musicas)} músicas")
         else:
             print("❌ Nenhuma música encontrada na pasta playlist!")
@@ -78,7 +78,7 @@ class PlaylistManager:
             return
         
         # Escolhe uma música aleatória
-        musica_aleatoria = random.choice(self.musicas)
+        musica_aleatoria = self.rng.choice(self.musicas)
         print(f"Tentando tocar: {musica_aleatoria}")
         
         # Para a música atual se estiver tocando
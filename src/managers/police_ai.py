@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+IA da polícia processada em lote para todas as viaturas
+"""
+
+import heapq
+import numpy as np
+from ..config import (
+    TELA_ALTURA, OBST_VEL_INICIAL, POLICE_LATERAL_SPEED,
+    POLICE_LANE_CHANGE_INTERVAL, POLICE_AGGRESSIVE_MODE
+)
+
+
+def intervalo_decisao(vel: float, dificuldade: int) -> float:
+    """Tempo até a próxima troca de faixa (mesma regra de Obstaculo._mover_policia_lateral)"""
+    intervalo = POLICE_LANE_CHANGE_INTERVAL
+    if POLICE_AGGRESSIVE_MODE:
+        # Reduz o intervalo conforme a dificuldade aumenta
+        intervalo = max(0.3, POLICE_LANE_CHANGE_INTERVAL - (dificuldade - 1) * 0.15)
+    # Quanto mais rápido, mais frequentemente deve tentar manobrar
+    return max(0.2, intervalo / (vel / OBST_VEL_INICIAL))
+
+
+def altura_ativacao(vel: float) -> float:
+    """Altura (y) a partir da qual a viatura passa a mirar a faixa do jogador"""
+    # Ativa mais cedo em velocidades altas
+    return TELA_ALTURA * (0.7 if vel / OBST_VEL_INICIAL > 2.0 else 0.5)
+
+
+class PoliceAIManager:
+    """Troca de faixa e movimento lateral de todas as viaturas do ObstaculoStore.
+
+    As decisões ficam num heap (instante, seq, geração, obstáculo): a cada
+    tick só as viaturas com decisão vencida são processadas individualmente.
+    O deslocamento lateral em direção à faixa alvo é vetorizado sobre as
+    colunas `target_lane_x`/`moving_lateral` do store. Entradas de obstáculos
+    que saíram de jogo (ou foram reusados pelo pool) são descartadas ao sair
+    do heap, pela geração.
+    """
+
+    def __init__(self, lane_centers: list[int], rng):
+        self.rng = rng
+        self.lane_centers = np.asarray(lane_centers, dtype=np.float64)
+        # Fronteiras entre faixas: a faixa mais próxima de x é searchsorted(meios, x)
+        self.meios = (self.lane_centers[1:] + self.lane_centers[:-1]) / 2
+        self.decisoes = []
+        self.seq = 0
+        self.relogio = 0.0
+        self.decisoes_tomadas = 0
+        self.descartadas = 0
+
+    def limpar(self):
+        """Esquece todas as viaturas (nova partida)"""
+        self.decisoes.clear()
+        self.relogio = 0.0
+
+    def faixas_de(self, xs):
+        """Faixa mais próxima de cada coordenada x (escalar ou array)"""
+        return np.searchsorted(self.meios, xs)
+
+    def registrar(self, obst, dificuldade: int):
+        """Agenda a primeira decisão de uma viatura recém-criada"""
+        self._agendar(obst, self.relogio + intervalo_decisao(obst.vel, dificuldade))
+
+    def _agendar(self, obst, instante: float):
+        self.seq += 1
+        heapq.heappush(self.decisoes, (instante, self.seq, obst._geracao, obst))
+
+    def atualizar(self, store, jogador_x: float, dificuldade: int, dt: float):
+        """Processa as decisões vencidas e move lateralmente as viaturas"""
+        self.relogio += dt
+        decisoes = self.decisoes
+        if decisoes and decisoes[0][0] <= self.relogio:
+            faixa_jogador = int(self.faixas_de(jogador_x))
+            while decisoes and decisoes[0][0] <= self.relogio:
+                instante, _, geracao, obst = heapq.heappop(decisoes)
+                if obst._store is not store or obst._geracao != geracao:
+                    self.descartadas += 1
+                    continue
+                self._decidir(obst, faixa_jogador)
+                self._agendar(obst, instante + intervalo_decisao(obst.vel, dificuldade))
+
+        self._mover_lateral(store, dt)
+
+    def _decidir(self, obst, faixa_jogador: int):
+        """Escolhe a nova faixa de uma viatura"""
+        self.decisoes_tomadas += 1
+
+        # Comportamento inteligente: tenta bloquear o jogador se estiver próximo
+        if obst.y > altura_ativacao(obst.vel) and faixa_jogador != obst.faixa:
+            nova_faixa = faixa_jogador
+        else:
+            # Movimento aleatório (ou já está na faixa do jogador)
+            nova_faixa = self.rng.randint(0, len(self.lane_centers) - 1)
+
+        if nova_faixa != obst.faixa:
+            obst.faixa = nova_faixa
+            obst.moving_lateral = True
+            obst.target_lane_x = self.lane_centers[nova_faixa] - obst.largura // 2
+
+    def proximas_decisoes(self) -> dict:
+        """{id(viatura): segundos até a próxima decisão} das viaturas em jogo"""
+        relogio = self.relogio
+        return {id(obst): instante - relogio
+                for instante, _, geracao, obst in self.decisoes if obst._geracao == geracao}
+
+    def estatisticas(self) -> dict:
+        """Decisões processadas, entradas descartadas e pendentes no heap"""
+        return {
+            'decisoes': self.decisoes_tomadas,
+            'descartadas': self.descartadas,
+            'agendadas': len(self.decisoes),
+        }
+
+    def _mover_lateral(self, store, dt: float):
+        """Aproxima (em lote) as viaturas em movimento da posição alvo"""
+        n = store.n
+        indices = store.moving_lateral[:n].nonzero()[0]
+        if not len(indices):
+            return
+        x = store.x[indices]
+        alvo = store.target_lane_x[indices]
+        # Velocidade lateral acompanha a velocidade do jogo acima de 1.5x a inicial
+        ratio = store.vel[indices] / OBST_VEL_INICIAL
+        dx = np.where(ratio > 1.5, POLICE_LATERAL_SPEED * ratio, POLICE_LATERAL_SPEED) * dt
+
+        distancia = alvo - x
+        chegou = np.abs(distancia) < dx
+        store.x[indices] = np.where(chegou, alvo, x + np.sign(distancia) * dx)
+        store.moving_lateral[indices[chegou]] = False
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Pré-carregamento dos assets do jogo numa thread enquanto o menu roda
+"""
+
+import threading
+import time
+from ..config import ATLAS_SPRITES, POWERUP_TIPOS
+from ..engine import carregar_estrada, calcular_faixas
+from ..entities.obstacles import Obstaculo
+from ..entities.police import SireneAnimacao
+from ..entities.powerup import PowerUp
+from .assets import assets
+from .atlas import atlas
+
+
+class AssetPreloader:
+    """Executa uma lista de tarefas (nome, função) numa thread de fundo.
+
+    Cada função recebe o dicionário de resultados das tarefas anteriores
+    (executadas em ordem) e seu retorno fica em `resultados[nome]`. Quem
+    precisa de tudo pronto chama `aguardar()`: sem espera se a thread já
+    terminou; se uma tarefa falhou na thread, ela é refeita na thread
+    chamadora (e o erro, se houver, aparece ali).
+    """
+
+    def __init__(self, tarefas: list):
+        self.tarefas = list(tarefas)
+        self.resultados = {}
+        self.erros = {}
+        self.tempos = {}  # {nome: segundos}
+        self.concluidas = 0
+        self.espera = 0.0  # tempo total bloqueado em aguardar()
+        self._thread = None
+
+    def adicionar(self, nome: str, funcao):
+        """Acrescenta uma tarefa (antes de `iniciar`)"""
+        self.tarefas.append((nome, funcao))
+
+    def iniciar(self):
+        """Dispara a thread (chamadas repetidas são ignoradas)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._executar, name="preloader", daemon=True)
+            self._thread.start()
+        return self
+
+    def _executar(self):
+        for nome, funcao in self.tarefas:
+            inicio = time.perf_counter()
+            try:
+                self.resultados[nome] = funcao(self.resultados)
+            except Exception as erro:  # refeita em aguardar()
+                self.erros[nome] = erro
+            self.tempos[nome] = time.perf_counter() - inicio
+            self.concluidas += 1
+
+    @property
+    def pronto(self) -> bool:
+        return self.concluidas == len(self.tarefas)
+
+    def progresso(self) -> float:
+        """Fração das tarefas concluídas (0.0 a 1.0)"""
+        return self.concluidas / len(self.tarefas) if self.tarefas else 1.0
+
+    def tarefa_atual(self):
+        """Nome da tarefa em execução (None se terminou)"""
+        return self.tarefas[self.concluidas][0] if not self.pronto else None
+
+    def aguardar(self) -> dict:
+        """Bloqueia até tudo estar carregado e retorna os resultados"""
+        if not self.pronto:
+            inicio = time.perf_counter()
+            if self._thread is None:
+                self._executar()
+            else:
+                self._thread.join()
+            self.espera += time.perf_counter() - inicio
+        for nome, funcao in self.tarefas:
+            if nome in self.erros:
+                print(f"⚠️ Pré-carregamento de '{nome}' falhou ({self.erros[nome]}); carregando de novo")
+                self.resultados[nome] = funcao(self.resultados)
+                del self.erros[nome]
+        return self.resultados
+
+    def estatisticas(self) -> dict:
+        """Progresso, tempo de cada tarefa e espera causada no jogo"""
+        return {
+            'concluidas': self.concluidas,
+            'total': len(self.tarefas),
+            'erros': len(self.erros),
+            'tempo_total': round(sum(self.tempos.values()), 4),
+            'tempos': {nome: round(t, 4) for nome, t in self.tempos.items()},
+            'espera': round(self.espera, 4),
+        }
+
+
+def _sprites_obstaculos(resultados):
+    """Variantes (escala + máscara) de todos os carros na largura das faixas"""
+    lane_w = resultados['faixas'][2]
+    return [Obstaculo.sprite_cache.obter(nome, lane_w) for nome in Obstaculo.inimigos_nomes]
+
+
+def _sirene(resultados):
+    """Frames e overlays da sirene no tamanho da viatura"""
+    policia = resultados['obstaculos'][Obstaculo.inimigos_nomes.index("police.png")]
+    frames = SireneAnimacao.obter_frames(policia.largura, policia.altura)
+    SireneAnimacao.obter_overlays(policia.largura, policia.altura)
+    return frames
+
+
+def _atlas(resultados):
+    """Empacota carros, sirene, setas e power-ups no atlas e troca cada
+    superfície compartilhada pela sua região (mesmos objetos de lista)"""
+    sprites = resultados['obstaculos']
+    sirene = resultados['sirene']
+    setas = Obstaculo.obter_setas()
+    powerups = [PowerUp.obter_frames(tipo) for tipo in POWERUP_TIPOS]
+    mapa = atlas.empacotar([v.img for v in sprites] + sirene + list(setas) +
+                           [frame for frames in powerups for angulo in frames for frame in angulo])
+    for variante in sprites:
+        variante.img = mapa[variante.img]
+    sirene[:] = [mapa[frame] for frame in sirene]
+    Obstaculo.setas = tuple(mapa[seta] for seta in setas)
+    for frames in powerups:
+        for angulo in frames:
+            angulo[:] = [mapa[frame] for frame in angulo]
+    return atlas.estatisticas()
+
+
+def tarefas_jogo() -> list:
+    """Tudo que o JOGANDO usa: estrada, faixas, jogador, carros, sirene, power-ups e o atlas"""
+    tarefas = [
+        ('estrada', lambda r: carregar_estrada()),
+        ('faixas', lambda r: calcular_faixas(*r['estrada'])),
+        ('jogador', lambda r: assets.imagem("carro_jogador.png")),
+        ('obstaculos', _sprites_obstaculos),
+        ('sirene', _sirene),
+        ('powerups', lambda r: PowerUp.carregar_frames()),
+    ]
+    if ATLAS_SPRITES:
+        tarefas.append(('atlas', _atlas))
+    return tarefas
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Gravação e reprodução de partidas (semente + entradas de cada tick)
+
+Formato binário (little-endian):
+    cabeçalho: magic b'VARP', versão (u8), tick_hz (u16), semente (u64), ticks (u32)
+    corpo: pares (entrada u8, repetições u16) - entradas codificadas por run-length
+"""
+
+import struct
+from bisect import bisect_right
+from ..config import SIM_TICK_HZ, REPLAY_SNAPSHOT_INTERVALO, REPLAY_SNAPSHOT_MEMORIA
+
+REPLAY_MAGIC = b'VARP'
+REPLAY_VERSAO = 1
+_CABECALHO = struct.Struct('<4sBHQI')
+_RUN = struct.Struct('<BH')
+_RUN_MAX = 0xFFFF
+
+
+class ReplayRecorder:
+    """Acumula as entradas de uma partida em runs (entrada, repetições)"""
+
+    def __init__(self, semente: int, tick_hz: int = SIM_TICK_HZ):
+        self.semente = semente
+        self.tick_hz = tick_hz
+        self.runs = []  # [[entrada, repetições]]
+        self.ticks = 0
+
+    def registrar(self, entrada: int):
+        """Registra a entrada de um tick"""
+        self.ticks += 1
+        runs = self.runs
+        if runs:
+            ultimo = runs[-1]
+            if ultimo[0] == entrada and ultimo[1] < _RUN_MAX:
+                ultimo[1] += 1
+                return
+        runs.append([entrada, 1])
+
+    def para_bytes(self) -> bytes:
+        """Serializa o replay"""
+        partes = [_CABECALHO.pack(REPLAY_MAGIC, REPLAY_VERSAO, self.tick_hz, self.semente, self.ticks)]
+        partes.extend(_RUN.pack(entrada, repeticoes) for entrada, repeticoes in self.runs)
+        return b''.join(partes)
+
+    def salvar(self, caminho: str):
+        """Grava o replay em disco"""
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(self.para_bytes())
+        print(f"💾 Replay salvo: {caminho} ({self.ticks} ticks, semente {self.semente})")
+
+
+class ReplayPlayer:
+    """Lê um replay e o reexecuta num GameEngine.
+
+    Para busca, `indexar` roda o replay uma vez guardando snapshots a cada
+    `intervalo` ticks; `ir_para` restaura o snapshot mais próximo antes do
+    tick pedido e simula só o restante. Se os snapshots passarem do
+    orçamento de memória, metade é descartada e o intervalo dobra.
+    """
+
+    def __init__(self, semente: int, tick_hz: int, runs: list, ticks: int):
+        self.semente = semente
+        self.tick_hz = tick_hz
+        self.runs = runs
+        self.ticks = ticks
+        self.snapshots = []
+        self.intervalo = REPLAY_SNAPSHOT_INTERVALO
+        self._entradas_por_tick = None
+
+    @classmethod
+    def de_bytes(cls, dados: bytes):
+        magic, versao, tick_hz, semente, ticks = _CABECALHO.unpack_from(dados, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Arquivo não é um replay")
+        if versao != REPLAY_VERSAO:
+            raise ValueError(f"Versão de replay não suportada: {versao}")
+        runs = list(_RUN.iter_unpack(dados[_CABECALHO.size:]))
+        return cls(semente, tick_hz, runs, ticks)
+
+    @classmethod
+    def carregar(cls, caminho: str):
+        with open(caminho, 'rb') as arquivo:
+            return cls.de_bytes(arquivo.read())
+
+    def entradas(self):
+        """Entradas tick a tick"""
+        for entrada, repeticoes in self.runs:
+            for _ in range(repeticoes):
+                yield entrada
+
+    def entrada_no_tick(self, tick: int) -> int:
+        """Entrada aplicada no tick `tick` (0 = primeiro tick da partida)"""
+        if self._entradas_por_tick is None:
+            self._entradas_por_tick = bytes(self.entradas())
+        return self._entradas_por_tick[tick]
+
+    def _verificar_engine(self, engine):
+        if round(1.0 / engine.dt) != self.tick_hz:
+            raise ValueError(f"Replay gravado a {self.tick_hz} Hz, motor a {1.0 / engine.dt:.0f} Hz")
+
+    def indexar(self, engine, intervalo: int = REPLAY_SNAPSHOT_INTERVALO,
+                memoria: int = REPLAY_SNAPSHOT_MEMORIA):
+        """Executa o replay inteiro guardando snapshots periódicos para `ir_para`"""
+        self._verificar_engine(engine)
+        engine.resetar(self.semente)
+        self.intervalo = intervalo
+        self.snapshots = [engine.capturar_estado()]
+        usado = self.snapshots[0].tamanho()
+        for tick, entrada in enumerate(self.entradas(), 1):
+            engine.passo(entrada)
+            if tick % self.intervalo:
+                continue
+            snap = engine.capturar_estado()
+            self.snapshots.append(snap)
+            usado += snap.tamanho()
+            while usado > memoria and len(self.snapshots) > 1:
+                # Desbaste: mantém um a cada dois (os ticks continuam múltiplos do intervalo)
+                self.snapshots = self.snapshots[::2]
+                self.intervalo *= 2
+                usado = sum(s.tamanho() for s in self.snapshots)
+        return self.memoria_usada()
+
+    def memoria_usada(self) -> int:
+        """Estimativa (bytes) dos snapshots guardados"""
+        return sum(s.tamanho() for s in self.snapshots)
+
+    def ir_para(self, engine, tick: int):
+        """Leva o motor ao estado logo após `tick` ticks e o retorna"""
+        self._verificar_engine(engine)
+        tick = max(0, min(tick, self.ticks))
+        if self.snapshots:
+            i = bisect_right([s.tick for s in self.snapshots], tick) - 1
+            engine.restaurar_estado(self.snapshots[i])
+        else:
+            engine.resetar(self.semente)
+        estado = engine.estado
+        for t in range(estado.tick, tick):
+            estado = engine.passo(self.entrada_no_tick(t))
+        return estado
+
+    def executar(self, engine, ao_passo=None):
+        """Reinicia o motor com a semente gravada e reaplica todas as entradas.
+
+        `ao_passo(engine)` é chamado depois de cada tick (para inspeção/profiling).
+        Retorna o estado final.
+        """
+        self._verificar_engine(engine)
+        engine.resetar(self.semente)
+        estado = engine.estado
+        for entrada in self.entradas():
+            estado = engine.passo(entrada)
+            if ao_passo is not None:
+                ao_passo(engine)
+        return estado
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Agendador de spawns baseado em fila de prioridade de eventos futuros
+"""
+
+import heapq
+from collections import deque
+from ..config import (
+    OBST_VEL_INICIAL, OBST_SPAWN_INTERVALO, OBST_SPAWN_INTERVALO_MIN,
+    POWERUP_SPAWN_CHANCE, POWERUP_SPAWN_INTERVALO, POWERUP_TIPOS,
+    SPAWN_JANELA, SPAWN_LOTE_OBSTACULOS
+)
+from ..entities.obstacles import Obstaculo
+
+# Tipos de evento
+SPAWN_OBSTACULO = 0
+SPAWN_POWERUP = 1
+_REABASTECER = 2  # interno: sortear mais tentativas de power-up
+
+
+def densidade_por_velocidade(estado) -> float:
+    """Política padrão: quanto mais rápidos os carros, mais frequentes os spawns"""
+    return max(OBST_SPAWN_INTERVALO_MIN, OBST_SPAWN_INTERVALO * (OBST_VEL_INICIAL / estado.vel_obst))
+
+
+class SpawnScheduler:
+    """Heap de eventos (instante, seq, tipo, dados) num relógio próprio.
+
+    - Obstáculos: o próximo evento é agendado quando o anterior dispara, com
+      o intervalo dado pela política de densidade (`politica(estado)`). O
+      sprite e a faixa de cada um vêm de um lote sorteado com antecedência.
+    - Power-ups: as tentativas a cada POWERUP_SPAWN_INTERVALO não dependem do
+      estado, então são sorteadas SPAWN_JANELA segundos à frente e só as
+      bem-sucedidas entram no heap (já com tipo e faixa).
+
+    Em ticks sem spawn `atualizar` é uma única comparação; um `dt` grande
+    dispara todos os eventos do intervalo em ordem (avanço rápido).
+    """
+
+    def __init__(self, n_faixas: int, rng, politica=densidade_por_velocidade):
+        self.n_faixas = n_faixas
+        self.politica = politica
+        self.rng = rng
+        self.tipos_powerup = tuple(POWERUP_TIPOS)
+        self.eventos = []
+        self.padroes_obstaculos = deque()
+        self.disparados = []  # reusada a cada chamada de atualizar
+        self.resetar()
+
+    def resetar(self):
+        """Começa uma nova partida (relógio em zero)"""
+        self.relogio = 0.0
+        self.seq = 0
+        self.eventos.clear()
+        self.padroes_obstaculos.clear()
+        self.proxima_tentativa_powerup = POWERUP_SPAWN_INTERVALO
+        self._agendar(OBST_SPAWN_INTERVALO, SPAWN_OBSTACULO, None)
+        self._sortear_powerups(0.0)
+
+    def _agendar(self, instante: float, tipo: int, dados):
+        self.seq += 1
+        heapq.heappush(self.eventos, (instante, self.seq, tipo, dados))
+
+    def _sortear_powerups(self, agora: float):
+        """Sorteia as tentativas de power-up até o fim da janela que começa em `agora`"""
+        limite = agora + SPAWN_JANELA
+        while self.proxima_tentativa_powerup <= limite:
+            if self.rng.random() < POWERUP_SPAWN_CHANCE:
+                dados = (self.rng.choice(self.tipos_powerup), self.rng.randrange(self.n_faixas))
+                self._agendar(self.proxima_tentativa_powerup, SPAWN_POWERUP, dados)
+            self.proxima_tentativa_powerup += POWERUP_SPAWN_INTERVALO
+        # Sorteia a próxima janela na metade desta
+        self._agendar(agora + SPAWN_JANELA / 2, _REABASTECER, None)
+
+    def _padrao_obstaculo(self):
+        """Próximo (sprite_id, faixa) pré-sorteado"""
+        if not self.padroes_obstaculos:
+            self.padroes_obstaculos.extend(
+                Obstaculo.sortear(self.n_faixas, self.rng) for _ in range(SPAWN_LOTE_OBSTACULOS))
+        return self.padroes_obstaculos.popleft()
+
+    def atualizar(self, dt: float, estado) -> list:
+        """Avança o relógio e retorna os eventos vencidos como [(tipo, dados)].
+
+        A lista retornada é reusada na próxima chamada.
+        """
+        self.relogio += dt
+        eventos = self.eventos
+        disparados = self.disparados
+        disparados.clear()
+        if eventos[0][0] > self.relogio:
+            return disparados
+
+        while eventos[0][0] <= self.relogio:
+            instante, _, tipo, dados = heapq.heappop(eventos)
+            if tipo == SPAWN_OBSTACULO:
+                disparados.append((tipo, self._padrao_obstaculo()))
+                self._agendar(instante + self.politica(estado), SPAWN_OBSTACULO, None)
+            elif tipo == SPAWN_POWERUP:
+                disparados.append((tipo, dados))
+            else:
+                self._sortear_powerups(instante)
+        return disparados
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Variantes de sprites (superfície escalada + máscara) sobre o AssetManager
+"""
+
+import pygame
+from ..config import OBST_ALTURA, LANE_MARGIN, ALPHA_THRESHOLD
+from ..utils.surface import converter_para_display
+from .collision import calcular_bbox
+from .assets import assets
+
+
+class VarianteSprite:
+    """Superfície escalada e máscara de colisão de um sprite.
+
+    As instâncias são compartilhadas entre todas as entidades que usam a
+    mesma variante, então devem ser tratadas como somente leitura.
+    """
+
+    __slots__ = ('img', 'mask', 'bbox', 'largura', 'altura')
+
+    def __init__(self, img, mask):
+        self.img = img
+        self.mask = mask
+        self.bbox = calcular_bbox(mask)  # retângulo justo da máscara (modo "hybrid")
+        self.largura, self.altura = img.get_size()
+
+
+def calcular_tamanho(base, altura_alvo: int, lane_w: int) -> tuple[int, int]:
+    """Escala pela altura alvo preservando proporção e garante que cabe na faixa"""
+    ow, oh = base.get_width(), base.get_height()
+
+    scale = altura_alvo / oh
+    w = int(ow * scale)
+    h = altura_alvo
+
+    max_w = max(10, lane_w - 2*LANE_MARGIN)
+    if w > max_w:
+        s = max_w / w
+        w = int(w * s)
+        h = int(h * s)
+    return w, h
+
+
+class SpriteCache:
+    """Variantes (nome, lane_w, OBST_ALTURA, ALPHA_THRESHOLD) guardadas no AssetManager.
+
+    Cada variante é construída uma única vez enquanto couber no orçamento de
+    memória do AssetManager; despejada, é reconstruída no próximo pedido.
+    """
+
+    def __init__(self, asset_manager=assets):
+        self.assets = asset_manager
+        self.hits = 0
+        self.misses = 0
+
+    def obter(self, nome: str, lane_w: int) -> VarianteSprite:
+        """Retorna a variante escalada do sprite `nome`, criando-a apenas quando falta"""
+        chave = ('sprite', nome, lane_w, OBST_ALTURA, ALPHA_THRESHOLD)
+        if chave in self.assets.variantes:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        def construir():
+            base = self.assets.imagem(nome)
+            w, h = calcular_tamanho(base, OBST_ALTURA, lane_w)
+            img = converter_para_display(pygame.transform.smoothscale(base, (w, h)))
+            return VarianteSprite(img, pygame.mask.from_surface(img, ALPHA_THRESHOLD))
+
+        return self.assets.variante(chave, construir)
+
+    def estatisticas(self) -> dict:
+        """Retorna contadores de acerto/erro do cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def limpar(self):
+        """Zera os contadores (as variantes ficam no AssetManager)"""
+        self.hits = 0
+        self.misses = 0
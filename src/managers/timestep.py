@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Passo fixo de simulação com acumulador
+"""
+
+from ..config import SIM_TICK_HZ, SIM_MAX_PASSOS_POR_FRAME
+
+
+class FixedTimestep:
+    """Converte o tempo real de cada frame em um número inteiro de ticks fixos.
+
+    A sobra que não completa um tick fica no acumulador e vira o fator de
+    interpolação (`alpha`) usado para desenhar entre o tick anterior e o atual.
+    """
+
+    def __init__(self, hz: int = SIM_TICK_HZ, max_passos: int = SIM_MAX_PASSOS_POR_FRAME):
+        self.hz = hz
+        self.passo = 1.0 / hz
+        self.max_passos = max_passos
+        self.acumulador = 0.0
+        self.tick = 0
+
+    def avancar(self, dt: float) -> int:
+        """Acumula `dt` segundos e retorna quantos ticks devem ser simulados"""
+        self.acumulador += dt
+        passos = int(self.acumulador / self.passo)
+        if passos > self.max_passos:
+            # Máquina lenta demais: descarta o atraso em vez de entrar em espiral
+            passos = self.max_passos
+            self.acumulador = 0.0
+        else:
+            self.acumulador -= passos * self.passo
+        self.tick += passos
+        return passos
+
+    @property
+    def alpha(self) -> float:
+        """Fração do próximo tick já decorrida (0.0 a 1.0)"""
+        return min(1.0, self.acumulador / self.passo)
+
+    def resetar(self):
+        """Zera o acumulador e o contador de ticks"""
+        self.acumulador = 0.0
+        self.tick = 0
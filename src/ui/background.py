@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Fundo rolante pré-composto (grama + estrada + faixas)
+"""
+
+import math
+import pygame
+from ..config import TELA_LARGURA, TELA_ALTURA
+
+COR_GRAMA = (50, 150, 50)
+
+
+class RoadBackground:
+    """Grama e estrada compostas uma única vez numa faixa vertical periódica.
+
+    A superfície tem a largura da tela e altura de uma tela mais um tile da
+    estrada, então qualquer deslocamento em [0, H_tile) é desenhado com um
+    único blit recortado. A grama não se move: depois da primeira pintura só
+    a estrada (e as regiões pedidas, como os textos do HUD) é redesenhada.
+    """
+
+    def __init__(self, img_road, road_x: int, velocidade: float = 200.0, aceleracao: float = 8.0):
+        self.road_x = road_x
+        self.H_tile = img_road.get_height()
+        self.rect_estrada = pygame.Rect(road_x, 0, img_road.get_width(), TELA_ALTURA)
+        self.velocidade_inicial = velocidade
+        self.aceleracao = aceleracao
+
+        altura = TELA_ALTURA + self.H_tile
+        self.superficie = pygame.Surface((TELA_LARGURA, altura))
+        if pygame.display.get_surface() is not None:
+            self.superficie = self.superficie.convert()
+        self.superficie.fill(COR_GRAMA)
+        for i in range(math.ceil(altura / self.H_tile)):
+            self.superficie.blit(img_road, (road_x, i * self.H_tile))
+
+        self.resetar()
+
+    def resetar(self):
+        """Volta ao deslocamento e velocidade iniciais"""
+        self.offset = 0.0
+        self.offset_anterior = 0.0
+        self.velocidade = self.velocidade_inicial
+        self.pintado = False  # a próxima pintura cobre a tela inteira
+
+    def invalidar(self):
+        """Força a pintura da tela inteira no próximo desenho (a tela foi usada por outro estado)"""
+        self.pintado = False
+
+    def atualizar(self, dt):
+        """Rola o fundo (com wrap) e acelera gradualmente"""
+        self.offset_anterior = self.offset
+        self.offset = (self.offset + self.velocidade * dt) % self.H_tile
+        self.velocidade += self.aceleracao * dt
+
+    def offset_interpolado(self, alpha: float) -> float:
+        """Deslocamento entre o tick anterior e o atual (considerando o wrap)"""
+        avanco = (self.offset - self.offset_anterior) % self.H_tile
+        return (self.offset_anterior + avanco * alpha) % self.H_tile
+
+    def desenhar(self, tela, alpha=1.0, restaurar=()):
+        """Desenha o fundo com blits recortados e retorna a área da estrada.
+
+        A primeira pintura (ou após `invalidar`) cobre a tela inteira; depois
+        só a estrada e os retângulos de `restaurar` (o que foi desenhado por
+        cima da grama no frame anterior).
+        """
+        offset = self.offset_interpolado(alpha)
+        topo = self.H_tile - int(offset)
+        if not self.pintado:
+            self.pintado = True
+            return tela.blit(self.superficie, (0, 0), (0, topo, TELA_LARGURA, TELA_ALTURA))
+        for rect in restaurar:
+            tela.blit(self.superficie, rect, pygame.Rect(rect).move(0, topo))
+        return tela.blit(self.superficie, self.rect_estrada, self.rect_estrada.move(0, topo))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Atualização parcial da tela (dirty rects) para renderização por software
+"""
+
+import pygame
+from ..config import DIRTY_RECTS_LIMITE
+
+
+class DirtyRectManager:
+    """Acumula as regiões alteradas no frame e envia só elas ao display.
+
+    Cada região é enviada no frame em que foi desenhada e também no seguinte,
+    para apagar o que ficou na posição antiga. Se a área somada passar de
+    DIRTY_RECTS_LIMITE da tela, faz um flip completo.
+    """
+
+    def __init__(self, tela, limite: float = DIRTY_RECTS_LIMITE):
+        self.tela_rect = tela.get_rect()
+        self.limite_area = self.tela_rect.w * self.tela_rect.h * limite
+        self.rects = []
+        self.rects_anteriores = []
+        self.flip_pendente = True
+        self.flips = 0
+        self.updates = 0
+
+    def marcar(self, rect):
+        """Registra uma região alterada neste frame"""
+        if rect:
+            self.rects.append(pygame.Rect(rect))
+
+    def marcar_varios(self, rects):
+        """Registra várias regiões alteradas neste frame"""
+        for rect in rects:
+            self.marcar(rect)
+
+    def invalidar(self):
+        """Força um flip completo no próximo frame (troca de tela, reset, etc.)"""
+        self.flip_pendente = True
+
+    def _regioes(self):
+        """Regiões deste frame e do anterior, recortadas e sem as contidas em outras"""
+        regioes = []
+        candidatas = [r.clip(self.tela_rect) for r in self.rects + self.rects_anteriores]
+        for rect in sorted(candidatas, key=lambda r: r.w * r.h, reverse=True):
+            if rect.w > 0 and rect.h > 0 and not any(maior.contains(rect) for maior in regioes):
+                regioes.append(rect)
+        return regioes
+
+    def apresentar(self):
+        """Envia as regiões alteradas para o display (ou faz flip completo)"""
+        regioes = None if self.flip_pendente else self._regioes()
+        if regioes is None or sum(r.w * r.h for r in regioes) > self.limite_area:
+            pygame.display.flip()
+            self.flips += 1
+        else:
+            pygame.display.update(regioes)
+            self.updates += 1
+
+        self.flip_pendente = False
+        self.rects_anteriores = self.rects
+        self.rects = []
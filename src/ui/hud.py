@@ -6,6 +6,7 @@ Interface do usuário e HUD do jogo
 import pygame
 import os
 from ..config import TELA_LARGURA, TELA_ALTURA, POWERUP_TIPOS, POWERUP_SPAWN_CHANCE
+from .text_cache import obter_fonte, renderizar_texto
 
 
 def desenhar_tela_cinematic(tela, cinematic_manager):
@@ -27,8 +28,8 @@ def desenhar_tela_cinematic(tela, cinematic_manager):
         tela.blit(overlay, (0, 0))
         
         # Instruções
-        fonte_instrucoes = pygame.font.SysFont('Arial', 28, True)
-        instrucoes = fonte_instrucoes.render('Pressione ESPAÇO para pular', True, (255, 255, 255))
+        fonte_instrucoes = obter_fonte('Arial', 28, True)
+        instrucoes = renderizar_texto(fonte_instrucoes, 'Pressione ESPAÇO para pular', (255, 255, 255))
         rect = tela.get_rect()
         tela.blit(instrucoes, (rect.centerx - instrucoes.get_width()//2, TELA_ALTURA - 60))
         
@@ -37,25 +38,25 @@ def desenhar_tela_cinematic(tela, cinematic_manager):
         tela.fill((0, 0, 0))
         
         # Texto central
-        fonte = pygame.font.SysFont('Arial', 48, True)
-        texto = fonte.render('🎬 CINEMÁTICA', True, (255, 255, 255))
+        fonte = obter_fonte('Arial', 48, True)
+        texto = renderizar_texto(fonte, '🎬 CINEMÁTICA', (255, 255, 255))
         rect = tela.get_rect()
         tela.blit(texto, (rect.centerx - texto.get_width()//2, rect.centery - 120))
         
         # Status da cinemática
-        fonte_status = pygame.font.SysFont('Arial', 32)
-        status = fonte_status.render('Modo Fallback - Aguardando...', True, (255, 255, 0))
+        fonte_status = obter_fonte('Arial', 32)
+        status = renderizar_texto(fonte_status, 'Modo Fallback - Aguardando...', (255, 255, 0))
         tela.blit(status, (rect.centerx - status.get_width()//2, rect.centery - 50))
         
         # Instruções para fallback
-        fonte_instrucoes = pygame.font.SysFont('Arial', 24)
-        instrucoes1 = fonte_instrucoes.render('Coloque o arquivo "cinematic.mp4"', True, (200, 200, 200))
-        instrucoes2 = fonte_instrucoes.render('na pasta "assets/videos/"', True, (200, 200, 200))
+        fonte_instrucoes = obter_fonte('Arial', 24)
+        instrucoes1 = renderizar_texto(fonte_instrucoes, 'Coloque o arquivo "cinematic.mp4"', (200, 200, 200))
+        instrucoes2 = renderizar_texto(fonte_instrucoes, 'na pasta "assets/videos/"', (200, 200, 200))
         tela.blit(instrucoes1, (rect.centerx - instrucoes1.get_width()//2, rect.centery + 20))
         tela.blit(instrucoes2, (rect.centerx - instrucoes2.get_width()//2, rect.centery + 50))
         
         # Instruções
-        instrucoes = fonte_instrucoes.render('Pressione ESPAÇO para pular', True, (200, 200, 200))
+        instrucoes = renderizar_texto(fonte_instrucoes, 'Pressione ESPAÇO para pular', (200, 200, 200))
         tela.blit(instrucoes, (rect.centerx - instrucoes.get_width()//2, rect.centery + 120))
 
 
@@ -77,13 +78,13 @@ def desenhar_tela_powerup_help(tela):
         espacamento = 70
     
     # Título
-    fonte_titulo = pygame.font.SysFont('Arial', 48, True)
-    titulo = fonte_titulo.render('🎁 POWER-UPS DISPONÍVEIS', True, (255, 255, 255))
+    fonte_titulo = obter_fonte('Arial', 48, True)
+    titulo = renderizar_texto(fonte_titulo, '🎁 POWER-UPS DISPONÍVEIS', (255, 255, 255))
     tela.blit(titulo, (TELA_LARGURA//2 - titulo.get_width()//2, 50))
     
     # Subtítulo
-    fonte_subtitulo = pygame.font.SysFont('Arial', 24)
-    subtitulo = fonte_subtitulo.render('Colete power-ups na estrada para obter vantagens especiais!', True, (200, 200, 200))
+    fonte_subtitulo = obter_fonte('Arial', 24)
+    subtitulo = renderizar_texto(fonte_subtitulo, 'Colete power-ups na estrada para obter vantagens especiais!', (200, 200, 200))
     tela.blit(subtitulo, (TELA_LARGURA//2 - subtitulo.get_width()//2, 100))
     
     # Lista de power-ups (espaçamento dinâmico baseado no tamanho da tela)
@@ -140,26 +141,26 @@ def desenhar_tela_powerup_help(tela):
             pygame.draw.circle(tela, cor_simbolo, (centro_x + tamanho_simbolo//3, centro_y), tamanho_simbolo//3)
         
         # Nome do power-up
-        fonte_nome = pygame.font.SysFont('Arial', 20, True)
-        nome = fonte_nome.render(config['nome'], True, config['cor'])
+        fonte_nome = obter_fonte('Arial', 20, True)
+        nome = renderizar_texto(fonte_nome, config['nome'], config['cor'])
         tela.blit(nome, (200, y_pos))
         
         # Descrição
-        fonte_desc = pygame.font.SysFont('Arial', 16)
-        desc = fonte_desc.render(config['descricao'], True, (255, 255, 255))
+        fonte_desc = obter_fonte('Arial', 16)
+        desc = renderizar_texto(fonte_desc, config['descricao'], (255, 255, 255))
         tela.blit(desc, (200, y_pos + 25))
         
         # Duração
-        fonte_duracao = pygame.font.SysFont('Arial', 14)
-        duracao = fonte_duracao.render(f'Duração: {config["duracao"]}s', True, (180, 180, 180))
+        fonte_duracao = obter_fonte('Arial', 14)
+        duracao = renderizar_texto(fonte_duracao, f'Duração: {config["duracao"]}s', (180, 180, 180))
         tela.blit(duracao, (200, y_pos + 45))
     
     # Estatísticas dos power-ups (ajustado para não cortar)
-    fonte_stats = pygame.font.SysFont('Arial', 18, True)
-    stats_titulo = fonte_stats.render('📊 ESTATÍSTICAS:', True, (0, 255, 255))
+    fonte_stats = obter_fonte('Arial', 18, True)
+    stats_titulo = renderizar_texto(fonte_stats, '📊 ESTATÍSTICAS:', (0, 255, 255))
     tela.blit(stats_titulo, (TELA_LARGURA - 300, y_inicial + len(POWERUP_TIPOS) * espacamento + 20))
     
-    fonte_stat = pygame.font.SysFont('Arial', 16)
+    fonte_stat = obter_fonte('Arial', 16)
     stats = [
         f"• Chance de spawn: {POWERUP_SPAWN_CHANCE * 100:.1f}%",
         f"• Intervalo de spawn: 2.0s",
@@ -168,15 +169,15 @@ def desenhar_tela_powerup_help(tela):
     ]
     
     for i, stat in enumerate(stats):
-        stat_texto = fonte_stat.render(stat, True, (220, 220, 220))
+        stat_texto = renderizar_texto(fonte_stat, stat, (220, 220, 220))
         tela.blit(stat_texto, (TELA_LARGURA - 300, y_inicial + len(POWERUP_TIPOS) * espacamento + 45 + i * 22))
     
     # Dicas gerais (ajustado para não cortar)
-    fonte_dicas = pygame.font.SysFont('Arial', 18, True)
-    dicas_titulo = fonte_dicas.render('💡 DICAS:', True, (255, 255, 0))
+    fonte_dicas = obter_fonte('Arial', 18, True)
+    dicas_titulo = renderizar_texto(fonte_dicas, '💡 DICAS:', (255, 255, 0))
     tela.blit(dicas_titulo, (TELA_LARGURA//2 - dicas_titulo.get_width()//2, y_inicial + len(POWERUP_TIPOS) * espacamento + 20))
     
-    fonte_dica = pygame.font.SysFont('Arial', 16)
+    fonte_dica = obter_fonte('Arial', 16)
     dicas = [
         "• Múltiplos power-ups podem estar ativos simultaneamente",
         "• O Ímã atrai power-ups próximos automaticamente",
@@ -186,30 +187,36 @@ def desenhar_tela_powerup_help(tela):
     ]
     
     for i, dica in enumerate(dicas):
-        dica_texto = fonte_dica.render(dica, True, (220, 220, 220))
+        dica_texto = renderizar_texto(fonte_dica, dica, (220, 220, 220))
         tela.blit(dica_texto, (TELA_LARGURA//2 - dica_texto.get_width()//2, y_inicial + len(POWERUP_TIPOS) * espacamento + 45 + i * 22))
     
     # Instruções para voltar (ajustado para não cortar)
-    fonte_instrucoes = pygame.font.SysFont('Arial', 20, True)
-    instrucoes = fonte_instrucoes.render('Pressione H para voltar ao jogo', True, (255, 255, 255))
+    fonte_instrucoes = obter_fonte('Arial', 20, True)
+    instrucoes = renderizar_texto(fonte_instrucoes, 'Pressione H para voltar ao jogo', (255, 255, 255))
     tela.blit(instrucoes, (TELA_LARGURA//2 - instrucoes.get_width()//2, TELA_ALTURA - 40))
     
     # Controles adicionais
-    fonte_controles = pygame.font.SysFont('Arial', 16)
-    controles = fonte_controles.render('ESC: Pausar | H: Ajuda Power-ups | R: Reiniciar', True, (150, 150, 150))
+    fonte_controles = obter_fonte('Arial', 16)
+    controles = renderizar_texto(fonte_controles, 'ESC: Pausar | H: Ajuda Power-ups | R: Reiniciar', (150, 150, 150))
     tela.blit(controles, (TELA_LARGURA//2 - controles.get_width()//2, TELA_ALTURA - 20))
 
 
-def desenhar_tela_abertura(tela, img_abertura):
-    """Desenha a tela de abertura"""
+def desenhar_tela_abertura(tela, img_abertura, progresso=None):
+    """Desenha a tela de abertura (com a barra de carregamento, se `progresso` vier)"""
     tela.blit(img_abertura, (0, 0))
     
     # Adiciona instrução sobre power-ups (apenas tecla H, posicionada mais acima)
-    fonte_instrucoes = pygame.font.SysFont('Arial', 20)
-    instrucoes_ajuda = fonte_instrucoes.render('Pressione H para ver os power-ups', True, (200, 200, 200))
+    fonte_instrucoes = obter_fonte('Arial', 20)
+    instrucoes_ajuda = renderizar_texto(fonte_instrucoes, 'Pressione H para ver os power-ups', (200, 200, 200))
     
     # Posiciona a instrução mais acima na tela
     tela.blit(instrucoes_ajuda, (TELA_LARGURA//2 - instrucoes_ajuda.get_width()//2, TELA_ALTURA - 120))
+    
+    # Barra fina do pré-carregamento dos assets do jogo
+    if progresso is not None:
+        barra = pygame.Rect(TELA_LARGURA//2 - 150, TELA_ALTURA - 80, 300, 6)
+        pygame.draw.rect(tela, (60, 60, 60), barra)
+        pygame.draw.rect(tela, (255, 200, 0), (barra.x, barra.y, int(barra.width * progresso), barra.height))
 
 
 def desenhar_tela_gameover(tela, pontuacao, img_gameover, record_manager, novo_record=False):
@@ -217,128 +224,135 @@ def desenhar_tela_gameover(tela, pontuacao, img_gameover, record_manager, novo_r
     tela.blit(img_gameover, (0, 0))
     
     # Pontuação
-    fonte = pygame.font.SysFont('Arial', 40, True)
-    score = fonte.render(f'Pontuação: {pontuacao}', True, (255,255,255))
+    fonte = obter_fonte('Arial', 40, True)
+    score = renderizar_texto(fonte, f'Pontuação: {pontuacao}', (255,255,255))
     rect = tela.get_rect()
     tela.blit(score, (rect.centerx - score.get_width()//2, 300))
     
     # Record
     record_atual = record_manager.obter_record()
-    fonte_record = pygame.font.SysFont('Arial', 32, True)
+    fonte_record = obter_fonte('Arial', 32, True)
     
     if novo_record:
         # Novo record - destaque especial
-        record_texto = fonte_record.render(f'🏆 NOVO RECORD! 🏆', True, (255, 215, 0))  # Dourado
+        record_texto = renderizar_texto(fonte_record, f'🏆 NOVO RECORD! 🏆', (255, 215, 0))  # Dourado
         tela.blit(record_texto, (rect.centerx - record_texto.get_width()//2, 350))
         
-        record_valor = fonte_record.render(f'{record_atual} pontos', True, (255, 215, 0))
+        record_valor = renderizar_texto(fonte_record, f'{record_atual} pontos', (255, 215, 0))
         tela.blit(record_valor, (rect.centerx - record_valor.get_width()//2, 380))
     else:
         # Record atual
-        record_texto = fonte_record.render(f'Record: {record_atual}', True, (200, 200, 200))
+        record_texto = renderizar_texto(fonte_record, f'Record: {record_atual}', (200, 200, 200))
         tela.blit(record_texto, (rect.centerx - record_texto.get_width()//2, 350))
     
     # Instruções
-    fonte_instrucoes = pygame.font.SysFont('Arial', 24)
-    instrucoes = fonte_instrucoes.render('Pressione R para voltar ao menu', True, (150, 150, 150))
+    fonte_instrucoes = obter_fonte('Arial', 24)
+    instrucoes = renderizar_texto(fonte_instrucoes, 'Pressione R para voltar ao menu', (150, 150, 150))
     tela.blit(instrucoes, (rect.centerx - instrucoes.get_width()//2, 450))
 
 
 def desenhar_powerups_ativos(tela, powerup_manager):
-    """Desenha os power-ups ativos no canto superior direito"""
-    if not powerup_manager.powerups_ativos:
-        return
+    """Desenha os power-ups ativos no canto superior direito e retorna as regiões desenhadas"""
+    regioes = []
+    if not powerup_manager.expiracoes:
+        return regioes
     
     # Posição inicial no canto superior direito
     x_inicial = TELA_LARGURA - 200
     y_inicial = 10
     espacamento = 25
     
-    fonte_nome = pygame.font.SysFont('Arial', 16, True)
-    fonte_tempo = pygame.font.SysFont('Arial', 14)
+    fonte_nome = obter_fonte('Arial', 16, True)
+    fonte_tempo = obter_fonte('Arial', 14)
     
-    for i, (tipo, dados) in enumerate(powerup_manager.powerups_ativos.items()):
+    for i, tipo in enumerate(powerup_manager.tipos_ativos()):
         config = POWERUP_TIPOS[tipo]
-        tempo_restante = dados['tempo_restante']
+        tempo_restante = powerup_manager.get_tempo_restante(tipo)
         
         y_pos = y_inicial + i * espacamento
         
         # Nome do power-up com cor específica
-        nome_texto = fonte_nome.render(config['nome'], True, config['cor'])
-        tela.blit(nome_texto, (x_inicial, y_pos))
+        nome_texto = renderizar_texto(fonte_nome, config['nome'], config['cor'])
+        regioes.append(tela.blit(nome_texto, (x_inicial, y_pos)))
         
         # Tempo restante
-        tempo_texto = fonte_tempo.render(f'{tempo_restante:.1f}s', True, (200, 200, 200))
-        tela.blit(tempo_texto, (x_inicial + nome_texto.get_width() + 10, y_pos))
+        tempo_texto = renderizar_texto(fonte_tempo, f'{tempo_restante:.1f}s', (200, 200, 200))
+        regioes.append(tela.blit(tempo_texto, (x_inicial + nome_texto.get_width() + 10, y_pos)))
+    
+    return regioes
 
 
 def desenhar_hud_jogo(tela, pontuacao, obstaculos, playlist_manager, record_manager, powerup_manager=None, game_state=None):
-    """Desenha o HUD durante o jogo"""
+    """Desenha o HUD durante o jogo e retorna as regiões desenhadas (para dirty rects)"""
+    regioes = []
+    
     # Pontuação
-    fonte = pygame.font.SysFont('Arial', 28)
-    tela.blit(fonte.render(f'Pontuação: {pontuacao}', True, (255,255,255)), (10, 10))
+    fonte = obter_fonte('Arial', 28)
+    regioes.append(tela.blit(renderizar_texto(fonte, f'Pontuação: {pontuacao}', (255,255,255)), (10, 10)))
     
     # Record
     record_atual = record_manager.obter_record()
-    fonte_record = pygame.font.SysFont('Arial', 20)
-    record_texto = fonte_record.render(f'Record: {record_atual}', True, (200, 200, 200))
-    tela.blit(record_texto, (10, 40))
+    fonte_record = obter_fonte('Arial', 20)
+    record_texto = renderizar_texto(fonte_record, f'Record: {record_atual}', (200, 200, 200))
+    regioes.append(tela.blit(record_texto, (10, 40)))
     
     # Mostra aviso de carro da polícia se houver algum
     for obst in obstaculos:
         if obst.nome_imagem == "police.png":
-            fonte_police = pygame.font.SysFont('Arial', 24, True)
-            aviso = fonte_police.render('🚨 CARRO DA POLÍCIA! 🚨', True, (255, 0, 0))
-            tela.blit(aviso, (TELA_LARGURA - aviso.get_width() - 10, 10))
+            fonte_police = obter_fonte('Arial', 24, True)
+            aviso = renderizar_texto(fonte_police, '🚨 CARRO DA POLÍCIA! 🚨', (255, 0, 0))
+            regioes.append(tela.blit(aviso, (TELA_LARGURA - aviso.get_width() - 10, 10)))
             break
     
     # Power-ups ativos
     if powerup_manager:
-        desenhar_powerups_ativos(tela, powerup_manager)
+        regioes.extend(desenhar_powerups_ativos(tela, powerup_manager))
     
     # Informações da playlist
     if playlist_manager.musica_atual:
         nome_musica = os.path.basename(playlist_manager.musica_atual)
         # Remove extensão do arquivo
         nome_musica = os.path.splitext(nome_musica)[0]
-        fonte_musica = pygame.font.SysFont('Arial', 16)
+        fonte_musica = obter_fonte('Arial', 16)
         
         # Mostra status do mute
         if playlist_manager.mute_ativo or playlist_manager.volume == 0:
-            texto_musica = fonte_musica.render(f'🔇 {nome_musica} (MUTADO)', True, (255, 100, 100))
+            texto_musica = renderizar_texto(fonte_musica, f'🔇 {nome_musica} (MUTADO)', (255, 100, 100))
         elif playlist_manager.pausado:
-            texto_musica = fonte_musica.render(f'⏸️ {nome_musica} (PAUSADO)', True, (255, 165, 0))  # Laranja
+            texto_musica = renderizar_texto(fonte_musica, f'⏸️ {nome_musica} (PAUSADO)', (255, 165, 0))  # Laranja
         else:
-            texto_musica = fonte_musica.render(f'🎵 {nome_musica}', True, (200, 200, 200))
+            texto_musica = renderizar_texto(fonte_musica, f'🎵 {nome_musica}', (200, 200, 200))
         
-        tela.blit(texto_musica, (10, TELA_ALTURA - 30))
+        regioes.append(tela.blit(texto_musica, (10, TELA_ALTURA - 30)))
         
         # Controles da playlist - MELHORADO
         if playlist_manager.mute_ativo or playlist_manager.volume == 0:
-            controles = fonte_musica.render('N: Próxima | R: Aleatória | P: Pausar | M: Desmutar', True, (255, 150, 150))
+            controles = renderizar_texto(fonte_musica, 'N: Próxima | R: Aleatória | P: Pausar | M: Desmutar', (255, 150, 150))
         elif playlist_manager.pausado:
-            controles = fonte_musica.render('N: Próxima | R: Aleatória | P: Despausar | M: Mutar', True, (255, 200, 150))
+            controles = renderizar_texto(fonte_musica, 'N: Próxima | R: Aleatória | P: Despausar | M: Mutar', (255, 200, 150))
         else:
-            controles = fonte_musica.render('N: Próxima | R: Aleatória | P: Pausar | M: Mutar', True, (150, 150, 150))
+            controles = renderizar_texto(fonte_musica, 'N: Próxima | R: Aleatória | P: Pausar | M: Mutar', (150, 150, 150))
         
-        tela.blit(controles, (10, TELA_ALTURA - 50))
+        regioes.append(tela.blit(controles, (10, TELA_ALTURA - 50)))
         
         # Controles de volume
-        fonte_volume = pygame.font.SysFont('Arial', 14)
-        controles_volume = fonte_volume.render('+/-: Ajustar Volume | 0: Resetar Volume', True, (150, 150, 150))
-        tela.blit(controles_volume, (10, TELA_ALTURA - 70))
+        fonte_volume = obter_fonte('Arial', 14)
+        controles_volume = renderizar_texto(fonte_volume, '+/-: Ajustar Volume | 0: Resetar Volume', (150, 150, 150))
+        regioes.append(tela.blit(controles_volume, (10, TELA_ALTURA - 70)))
         
         # Mostra volume atual
         if not playlist_manager.mute_ativo:
-            volume_texto = fonte_volume.render(f'Volume: {int(playlist_manager.volume * 100)}%', True, (200, 200, 200))
-            tela.blit(volume_texto, (TELA_LARGURA - volume_texto.get_width() - 10, TELA_ALTURA - 30))
+            volume_texto = renderizar_texto(fonte_volume, f'Volume: {int(playlist_manager.volume * 100)}%', (200, 200, 200))
+            regioes.append(tela.blit(volume_texto, (TELA_LARGURA - volume_texto.get_width() - 10, TELA_ALTURA - 30)))
         
         # Comando para resetar record
-        fonte_record_controle = pygame.font.SysFont('Arial', 14)
-        record_controle = fonte_record_controle.render('F1: Resetar Record', True, (100, 100, 100))
-        tela.blit(record_controle, (10, TELA_ALTURA - 90))
+        fonte_record_controle = obter_fonte('Arial', 14)
+        record_controle = renderizar_texto(fonte_record_controle, 'F1: Resetar Record', (100, 100, 100))
+        regioes.append(tela.blit(record_controle, (10, TELA_ALTURA - 90)))
         
         # Comando para ajuda dos power-ups (movido para a direita)
-        fonte_ajuda = pygame.font.SysFont('Arial', 14)
-        ajuda_controle = fonte_ajuda.render('H: Ajuda Power-ups', True, (100, 100, 100))
-        tela.blit(ajuda_controle, (TELA_LARGURA - ajuda_controle.get_width() - 10, TELA_ALTURA - 110)) 
\ No newline at end of file
+        fonte_ajuda = obter_fonte('Arial', 14)
+        ajuda_controle = renderizar_texto(fonte_ajuda, 'H: Ajuda Power-ups', (100, 100, 100))
+        regioes.append(tela.blit(ajuda_controle, (TELA_LARGURA - ajuda_controle.get_width() - 10, TELA_ALTURA - 110)))
+    
+    return regioes
\ No newline at end of file
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de fontes e cache de textos renderizados do HUD
+"""
+
+from collections import OrderedDict
+import pygame
+from ..config import TEXTO_CACHE_TAMANHO
+
+_fontes = {}  # {(nome, tamanho, negrito): pygame.font.Font}
+_textos = OrderedDict()  # {(fonte, texto, cor): Surface} em ordem de uso (LRU)
+estatisticas = {'hits': 0, 'misses': 0, 'descartes': 0}
+
+
+def obter_fonte(nome: str, tamanho: int, negrito: bool = False) -> pygame.font.Font:
+    """Resolve a fonte do sistema uma única vez por (nome, tamanho, negrito)"""
+    chave = (nome, tamanho, negrito)
+    fonte = _fontes.get(chave)
+    if fonte is None:
+        fonte = pygame.font.SysFont(nome, tamanho, negrito)
+        _fontes[chave] = fonte
+    return fonte
+
+
+def renderizar_texto(fonte: pygame.font.Font, texto: str, cor) -> pygame.Surface:
+    """Renderiza o texto (antialias) reaproveitando superfícies já renderizadas.
+
+    A superfície retornada é compartilhada e não deve ser modificada.
+    """
+    chave = (fonte, texto, tuple(cor))
+    superficie = _textos.get(chave)
+    if superficie is not None:
+        _textos.move_to_end(chave)
+        estatisticas['hits'] += 1
+        return superficie
+
+    estatisticas['misses'] += 1
+    superficie = fonte.render(texto, True, cor)
+    _textos[chave] = superficie
+    if len(_textos) > TEXTO_CACHE_TAMANHO:
+        _textos.popitem(last=False)
+        estatisticas['descartes'] += 1
+    return superficie
+
+
+def limpar_cache():
+    """Descarta os textos renderizados (as fontes continuam registradas)"""
+    _textos.clear()
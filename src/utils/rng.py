@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Geradores aleatórios com semente, um fluxo independente por subsistema
+"""
+
+import random
+
+
+class RNGService:
+    """Fluxos `random.Random` nomeados, todos derivados de uma única semente.
+
+    Cada subsistema ('spawn', 'policia', ...) tem seu próprio fluxo, então
+    mudar quantos números um deles sorteia não altera a sequência dos
+    outros. `reiniciar` ressemeia os mesmos objetos, de modo que quem
+    guardou a referência a um fluxo continua válido entre partidas.
+    """
+
+    def __init__(self, semente: int = None):
+        self.fluxos = {}
+        self.reiniciar(semente)
+
+    @staticmethod
+    def nova_semente() -> int:
+        """Semente de 64 bits imprevisível (para partidas normais)"""
+        return random.SystemRandom().getrandbits(64)
+
+    def reiniciar(self, semente: int = None):
+        """Ressemeia todos os fluxos (semente None = sorteia uma nova)"""
+        self.semente = self.nova_semente() if semente is None else semente
+        for nome, fluxo in self.fluxos.items():
+            fluxo.seed(self._semente_fluxo(nome))
+
+    def _semente_fluxo(self, nome: str) -> str:
+        # Sementes str são estáveis entre execuções (ao contrário de hash())
+        return f"{self.semente}:{nome}"
+
+    def fluxo(self, nome: str) -> random.Random:
+        """Retorna (criando no primeiro uso) o fluxo de um subsistema"""
+        fluxo = self.fluxos.get(nome)
+        if fluxo is None:
+            fluxo = self.fluxos[nome] = random.Random(self._semente_fluxo(nome))
+        return fluxo
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+Conversão de superfícies para o formato do display (quando houver display)
+"""
+
+import pygame
+
+
+def converter_para_display(superficie: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Converte para o formato do display; sem janela (modo headless) retorna a própria superfície"""
+    if pygame.display.get_surface() is None:
+        return superficie
+    return superficie.convert_alpha() if alpha else superficie.convert()
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Velozes e Assados - Varredura de parâmetros em lote (headless)
+
+Roda muitas partidas sem janela, distribuídas num pool de processos (um
+por núcleo), para cada combinação de parâmetros de src/config.py, e gera
+um relatório com sobrevivência, pontuação e causas de morte. Só as
+constantes de PARAMETROS_VARRIVEIS podem ser varridas: as demais são lidas
+uma única vez (sprites, fontes, janela) e não mudariam o resultado.
+
+Exemplo:
+    python sweep.py -p OBST_VEL_INICIAL=240,280,320 -p POLICE_SPAWN_CHANCE=0.1,0.2 \\
+        --jogos 200 --motorista expert --csv sweep.csv --json sweep.json
+"""
+
+import argparse
+import ast
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+from src import config
+from src.engine import GameEngine
+from src.managers.input_source import criar_fonte, FONTES
+from src.managers.asset_pack import usar_pacote
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+# Constantes que valem numa partida headless quando alteradas: lidas a cada
+# tick/partida ou ao montar o motor (refeito a cada combinação). Ficam de
+# fora as que só entram em caches de sprites ou na renderização.
+PARAMETROS_VARRIVEIS = (
+    'OBST_VEL_INICIAL', 'OBST_VEL_INCREMENTO', 'OBST_SPAWN_INTERVALO', 'OBST_SPAWN_INTERVALO_MIN',
+    'SPAWN_JANELA', 'SPAWN_LOTE_OBSTACULOS', 'LANE_COUNT', 'CARRO_ALTURA', 'OBST_ALTURA',
+    'COLLISION_MODE', 'HITBOX_SHRINK_W', 'HITBOX_SHRINK_H',
+    'BROADPHASE_ALTURA_BANDA', 'BROADPHASE_LOTE_MIN', 'COLISAO_VARRIDA', 'COLISAO_VARRIDA_PASSO',
+    'POLICE_SPAWN_CHANCE', 'POLICE_LATERAL_SPEED', 'POLICE_LANE_CHANGE_INTERVAL', 'POLICE_AGGRESSIVE_MODE',
+    'POWERUP_SPAWN_CHANCE', 'POWERUP_SPAWN_INTERVALO', 'POWERUP_VELOCIDADE', 'PILOTO_PASSO_PLANO',
+)
+
+# Estado de cada processo do pool
+_engine = None
+_parametros_engine = None  # combinação com que _engine foi montado
+_hz = None
+_originais = {}
+
+
+# -------------------- Processos do pool --------------------
+
+def _aplicar_parametros(parametros: dict):
+    """Sobrescreve constantes do config em todos os módulos src.* que as importaram.
+
+    Constantes alteradas por uma tarefa anterior voltam ao valor original.
+    """
+    for nome in parametros:
+        _originais.setdefault(nome, getattr(config, nome))
+    for nome, valor in {**_originais, **parametros}.items():
+        for modulo in list(sys.modules.values()):
+            nome_modulo = getattr(modulo, '__name__', '')
+            if (nome_modulo == 'src' or nome_modulo.startswith('src.')) and hasattr(modulo, nome):
+                setattr(modulo, nome, valor)
+
+
+def _iniciar_processo(hz: int):
+    """Prepara o processo (o motor é montado na primeira partida)"""
+    global _hz
+    os.chdir(RAIZ)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    usar_pacote()
+    _hz = hz
+
+
+def _jogar(tarefa):
+    """Executa uma partida; retorna (índice da configuração, ticks, pontuação, causa)"""
+    global _engine, _parametros_engine
+    indice, parametros, semente, motorista, max_ticks = tarefa
+    if _engine is None or parametros != _parametros_engine:
+        # Faixas, broadphase e tamanhos são fixados ao montar o motor
+        _aplicar_parametros(parametros)
+        _engine = GameEngine.headless(1.0 / _hz, avisos=False)  # sem log de power-ups por partida
+        _parametros_engine = parametros
+    engine = _engine
+    engine.resetar(semente)
+    fonte = criar_fonte(motorista, engine.rng.fluxo('entrada'))
+    estado = engine.estado
+    while estado.tick < max_ticks:
+        estado = engine.passo(fonte.ler(engine))
+        if estado.colidiu:
+            return indice, estado.tick, estado.pontuacao, estado.causa
+    return indice, estado.tick, estado.pontuacao, 'tempo_limite'
+
+
+# -------------------- Relatório --------------------
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))]
+
+
+def agregar(parametros: dict, resultados: list, hz: int) -> dict:
+    """Resume as partidas de uma configuração"""
+    tempos = [ticks / hz for _, ticks, _, _ in resultados]
+    pontos = [pontuacao for _, _, pontuacao, _ in resultados]
+    causas = {}
+    for _, _, _, causa in resultados:
+        causas[causa] = causas.get(causa, 0) + 1
+    return {
+        **parametros,
+        'jogos': len(resultados),
+        'sobrevivencia_media': round(statistics.mean(tempos), 3),
+        'sobrevivencia_mediana': round(statistics.median(tempos), 3),
+        'sobrevivencia_p10': round(_percentil(tempos, 0.1), 3),
+        'sobrevivencia_p90': round(_percentil(tempos, 0.9), 3),
+        'pontuacao_media': round(statistics.mean(pontos), 2),
+        'pontuacao_mediana': statistics.median(pontos),
+        'pontuacao_p90': _percentil(pontos, 0.9),
+        'pontuacao_max': max(pontos),
+        'causas': causas,
+    }
+
+
+def salvar_csv(caminho: str, linhas: list):
+    causas = sorted({causa for linha in linhas for causa in linha['causas']})
+    colunas = [c for c in linhas[0] if c != 'causas'] + [f'causa_{c}' for c in causas]
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=colunas)
+        escritor.writeheader()
+        for linha in linhas:
+            saida = {c: v for c, v in linha.items() if c != 'causas'}
+            saida.update({f'causa_{c}': linha['causas'].get(c, 0) for c in causas})
+            escritor.writerow(saida)
+
+
+# -------------------- CLI --------------------
+
+def _ler_parametro(texto: str):
+    """'NOME=v1,v2' -> (NOME, [v1, v2]) validando contra PARAMETROS_VARRIVEIS"""
+    nome, _, valores = texto.partition('=')
+    nome = nome.strip()
+    if not hasattr(config, nome):
+        raise argparse.ArgumentTypeError(f"{nome} não existe em src/config.py")
+    if nome not in PARAMETROS_VARRIVEIS:
+        raise argparse.ArgumentTypeError(f"{nome} não muda uma partida headless; varráveis: "
+                                         f"{', '.join(PARAMETROS_VARRIVEIS)}")
+    return nome, [ast.literal_eval(v.strip()) for v in valores.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-p', '--param', action='append', default=[], type=_ler_parametro,
+                        metavar='NOME=v1,v2', help='constante do config e valores a varrer')
+    parser.add_argument('--jogos', type=int, default=100, help='partidas por combinação')
+    parser.add_argument('--motorista', choices=[f for f in FONTES if f != 'teclado'], default='medio',
+                        help='fonte de entrada: parado, aleatorio ou nível do piloto automático')
+    parser.add_argument('--max-segundos', type=float, default=300.0, help='limite de cada partida')
+    parser.add_argument('--hz', type=int, default=config.SIM_TICK_HZ, help='ticks por segundo da simulação')
+    parser.add_argument('--semente', type=int, default=0, help='semente base (partida i usa semente+i)')
+    parser.add_argument('--processos', type=int, default=os.cpu_count(), help='padrão: um por núcleo')
+    parser.add_argument('--csv', help='arquivo CSV do relatório')
+    parser.add_argument('--json', help='arquivo JSON do relatório')
+    args = parser.parse_args()
+
+    nomes = [nome for nome, _ in args.param]
+    combinacoes = [dict(zip(nomes, valores))
+                   for valores in itertools.product(*(valores for _, valores in args.param))]
+    max_ticks = int(args.max_segundos * args.hz)
+    # Mesmas sementes em todas as combinações (comparação justa entre elas)
+    tarefas = [(i, parametros, args.semente + jogo, args.motorista, max_ticks)
+               for i, parametros in enumerate(combinacoes) for jogo in range(args.jogos)]
+
+    print(f"🏁 {len(combinacoes)} combinações x {args.jogos} jogos em {args.processos} processos")
+    resultados = [[] for _ in combinacoes]
+    inicio = time.perf_counter()
+    with multiprocessing.Pool(args.processos, _iniciar_processo, (args.hz,)) as pool:
+        lote = max(1, len(tarefas) // (args.processos * 8))
+        for resultado in pool.imap_unordered(_jogar, tarefas, chunksize=lote):
+            resultados[resultado[0]].append(resultado)
+    duracao = time.perf_counter() - inicio
+
+    linhas = [agregar(parametros, res, args.hz) for parametros, res in zip(combinacoes, resultados)]
+    for linha in linhas:
+        print(json.dumps(linha, ensure_ascii=False))
+    print(f"⏱️ {len(tarefas)} jogos em {duracao:.1f}s ({len(tarefas) / duracao:.1f} jogos/s)")
+
+    if args.csv:
+        salvar_csv(args.csv, linhas)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump({'motorista': args.motorista, 'jogos_por_combinacao': args.jogos,
+                       'hz': args.hz, 'semente': args.semente, 'jogos_por_segundo': len(tarefas) / duracao,
+                       'resultados': linhas}, arquivo, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()